@@ -0,0 +1,41 @@
+"""add_source_watermarks
+
+Revision ID: a3c5e7f9b1d2
+Revises: d4f6a8c0e2b5
+Create Date: 2026-10-17 16:05:12.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c5e7f9b1d2'
+down_revision: Union[str, Sequence[str], None] = 'd4f6a8c0e2b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create source_watermarks for incremental scraping."""
+    op.create_table(
+        'source_watermarks',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('source_id', sa.Integer(), nullable=False),
+        sa.Column('last_published_at', sa.DateTime(), nullable=True),
+        sa.Column('last_external_id', sa.String(length=255), nullable=True),
+        sa.Column('last_full_scrape_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['source_id'], ['sources.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('source_id')
+    )
+    op.create_index(op.f('ix_source_watermarks_id'), 'source_watermarks', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop source_watermarks."""
+    op.drop_index(op.f('ix_source_watermarks_id'), table_name='source_watermarks')
+    op.drop_table('source_watermarks')
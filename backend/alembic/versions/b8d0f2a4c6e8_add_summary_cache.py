@@ -0,0 +1,40 @@
+"""add_summary_cache
+
+Revision ID: b8d0f2a4c6e8
+Revises: a3c5e7f9b1d2
+Create Date: 2026-10-17 18:42:37.905113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d0f2a4c6e8'
+down_revision: Union[str, Sequence[str], None] = 'a3c5e7f9b1d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create summary_cache (summaries keyed by normalized content hash)."""
+    op.create_table(
+        'summary_cache',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('summary', sa.Text(), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_summary_cache_id'), 'summary_cache', ['id'], unique=False)
+    op.create_index(op.f('ix_summary_cache_content_hash'), 'summary_cache', ['content_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Drop summary_cache."""
+    op.drop_index(op.f('ix_summary_cache_content_hash'), table_name='summary_cache')
+    op.drop_index(op.f('ix_summary_cache_id'), table_name='summary_cache')
+    op.drop_table('summary_cache')
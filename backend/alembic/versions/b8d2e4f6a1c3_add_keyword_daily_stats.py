@@ -0,0 +1,50 @@
+"""add_keyword_daily_stats
+
+Revision ID: b8d2e4f6a1c3
+Revises: f7b3d8e1a6c9
+Create Date: 2026-10-17 13:41:09.215377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d2e4f6a1c3'
+down_revision: Union[str, Sequence[str], None] = 'f7b3d8e1a6c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create keyword_daily_stats and add day-over-day delta to trends."""
+    op.create_table('keyword_daily_stats',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('keyword', sa.String(length=200), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('article_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('score_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('keyword', 'date', name='uq_keyword_daily_stats_keyword_date')
+    )
+    op.create_index('ix_keyword_daily_stats_id', 'keyword_daily_stats', ['id'])
+    op.create_index('ix_keyword_daily_stats_date', 'keyword_daily_stats', ['date'])
+    op.create_index('ix_keyword_daily_stats_computed_at', 'keyword_daily_stats', ['computed_at'])
+
+    op.add_column('trends', sa.Column('article_count_delta', sa.Integer(), server_default='0', nullable=True))
+
+    # Incremental detect_trends looks up recently changed articles
+    op.create_index('idx_articles_updated_at', 'articles', ['updated_at'])
+
+
+def downgrade() -> None:
+    """Drop keyword_daily_stats and the trends delta column."""
+    op.drop_index('idx_articles_updated_at', table_name='articles')
+    op.drop_column('trends', 'article_count_delta')
+    op.drop_index('ix_keyword_daily_stats_computed_at', table_name='keyword_daily_stats')
+    op.drop_index('ix_keyword_daily_stats_date', table_name='keyword_daily_stats')
+    op.drop_index('ix_keyword_daily_stats_id', table_name='keyword_daily_stats')
+    op.drop_table('keyword_daily_stats')
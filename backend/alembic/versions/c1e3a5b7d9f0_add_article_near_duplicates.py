@@ -0,0 +1,37 @@
+"""add_article_near_duplicates
+
+Revision ID: c1e3a5b7d9f0
+Revises: b8d0f2a4c6e8
+Create Date: 2026-10-17 21:17:54.662830
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c1e3a5b7d9f0'
+down_revision: Union[str, Sequence[str], None] = 'b8d0f2a4c6e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add SimHash fingerprints and canonical article links to articles."""
+    op.add_column('articles', sa.Column('simhash', sa.BigInteger(), nullable=True))
+    op.add_column('articles', sa.Column('duplicate_of_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_articles_duplicate_of_id', 'articles', 'articles',
+        ['duplicate_of_id'], ['id'], ondelete='SET NULL'
+    )
+    op.create_index(op.f('ix_articles_duplicate_of_id'), 'articles', ['duplicate_of_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop near-duplicate columns from articles."""
+    op.drop_index(op.f('ix_articles_duplicate_of_id'), table_name='articles')
+    op.drop_constraint('fk_articles_duplicate_of_id', 'articles', type_='foreignkey')
+    op.drop_column('articles', 'duplicate_of_id')
+    op.drop_column('articles', 'simhash')
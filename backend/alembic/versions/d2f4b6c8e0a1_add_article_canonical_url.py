@@ -0,0 +1,200 @@
+"""add_article_canonical_url
+
+Revision ID: d2f4b6c8e0a1
+Revises: c1e3a5b7d9f0
+Create Date: 2026-10-17 23:08:41.127554
+
+"""
+import re
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f4b6c8e0a1'
+down_revision: Union[str, Sequence[str], None] = 'c1e3a5b7d9f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+# Frozen copy of app.utils.urls.canonicalize_url as of this revision: the
+# backfill must not change (or break) when the app's rules evolve.
+
+Query = List[Tuple[str, str]]
+
+TRACKING_PARAMS = frozenset({
+    "ref", "ref_src", "ref_url", "referrer",
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "twclid", "igshid",
+    "mc_cid", "mc_eid", "_hsenc", "_hsmi", "mkt_tok",
+})
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_", "oly_")
+
+_DEFAULT_PORTS = {":80", ":443"}
+_MEDIUM_POST_ID = re.compile(r"(?:^|-)([0-9a-f]{10,12})$")
+_YOUTUBE_ID = re.compile(r"^[\w-]{11}$")
+_ARXIV_ID = re.compile(r"^(\d{4}\.\d{4,5}|[a-z\-]+(?:\.[A-Z]{2})?/\d{7})(?:v\d+)?(?:\.pdf)?$")
+
+
+def _youtube(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    parts = path.strip("/").split("/")
+    video_id = None
+    if host == "youtu.be":
+        video_id = parts[0]
+    elif parts[0] in ("shorts", "embed", "live", "v") and len(parts) > 1:
+        video_id = parts[1]
+    elif parts[0] == "watch":
+        video_id = dict(query).get("v")
+
+    if video_id and _YOUTUBE_ID.match(video_id):
+        return "youtube.com", "/watch", [("v", video_id)]
+    return "youtube.com", path, query
+
+
+def _medium(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    last = path.rstrip("/").rsplit("/", 1)[-1]
+    match = _MEDIUM_POST_ID.search(last)
+    if match:
+        return "medium.com", f"/p/{match.group(1)}", []
+    return host, path, query
+
+
+def _reddit(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    parts = path.strip("/").split("/")
+    if host == "redd.it" and parts[0]:
+        return "reddit.com", f"/comments/{parts[0]}", []
+    if "comments" in parts:
+        index = parts.index("comments")
+        if index + 1 < len(parts):
+            return "reddit.com", f"/comments/{parts[index + 1]}", []
+    return "reddit.com", path, query
+
+
+def _hackernews(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    return host, path, [(k, v) for k, v in query if k == "id"]
+
+
+def _arxiv(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    parts = path.strip("/").split("/", 1)
+    if len(parts) == 2 and parts[0] in ("abs", "pdf", "html"):
+        match = _ARXIV_ID.match(parts[1])
+        if match:
+            return "arxiv.org", f"/abs/{match.group(1)}", []
+    return "arxiv.org", path, query
+
+
+def _twitter(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    match = re.match(r"^/([^/]+)/status(?:es)?/(\d+)", path)
+    if match:
+        return "x.com", f"/{match.group(1).lower()}/status/{match.group(2)}", []
+    return "x.com", path, query
+
+
+def _github(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    return host, path.lower(), query
+
+
+SITE_RULES: Dict[str, Callable[[str, str, Query], Tuple[str, str, Query]]] = {
+    "youtube.com": _youtube,
+    "m.youtube.com": _youtube,
+    "music.youtube.com": _youtube,
+    "youtu.be": _youtube,
+    "medium.com": _medium,
+    "reddit.com": _reddit,
+    "old.reddit.com": _reddit,
+    "new.reddit.com": _reddit,
+    "np.reddit.com": _reddit,
+    "redd.it": _reddit,
+    "news.ycombinator.com": _hackernews,
+    "arxiv.org": _arxiv,
+    "export.arxiv.org": _arxiv,
+    "twitter.com": _twitter,
+    "mobile.twitter.com": _twitter,
+    "x.com": _twitter,
+    "github.com": _github,
+}
+
+
+def _site_rule(host: str) -> Optional[Callable[[str, str, Query], Tuple[str, str, Query]]]:
+    rule = SITE_RULES.get(host)
+    if rule is None and host.endswith(".medium.com"):
+        rule = _medium
+    return rule
+
+
+def _is_tracking(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    url = str(url).strip()
+    parts = urlsplit(url)
+    if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    port = f":{parts.port}" if parts.port else ""
+    if port in _DEFAULT_PORTS:
+        port = ""
+
+    path = re.sub(r"/{2,}", "/", parts.path) or "/"
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking(key)
+    ]
+
+    rule = _site_rule(host)
+    if rule is not None:
+        host, path, query = rule(host, path, query)
+
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return urlunsplit(("https", f"{host}{port}", path, urlencode(sorted(query)), ""))
+
+
+def upgrade() -> None:
+    """Add articles.canonical_url, backfilled, with a unique index.
+
+    The oldest row of each canonical URL keeps it; the other copies get
+    NULL and are linked to that row as duplicates (duplicate_of_id).
+    """
+    op.add_column('articles', sa.Column('canonical_url', sa.Text(), nullable=True))
+
+    conn = op.get_bind()
+    owners = {}
+    updates = []
+    duplicates = []
+    for article_id, url in conn.execute(sa.text("SELECT id, url FROM articles ORDER BY id")):
+        canonical = canonicalize_url(url)
+        if canonical in owners:
+            duplicates.append({'id': article_id, 'owner': owners[canonical]})
+        else:
+            owners[canonical] = article_id
+            updates.append({'id': article_id, 'canonical_url': canonical})
+
+    for i in range(0, len(updates), BATCH_SIZE):
+        conn.execute(
+            sa.text("UPDATE articles SET canonical_url = :canonical_url WHERE id = :id"),
+            updates[i:i + BATCH_SIZE]
+        )
+    for i in range(0, len(duplicates), BATCH_SIZE):
+        conn.execute(
+            sa.text("UPDATE articles SET duplicate_of_id = :owner WHERE id = :id AND duplicate_of_id IS NULL"),
+            duplicates[i:i + BATCH_SIZE]
+        )
+
+    op.create_index(op.f('ix_articles_canonical_url'), 'articles', ['canonical_url'], unique=True)
+
+
+def downgrade() -> None:
+    """Drop articles.canonical_url."""
+    op.drop_index(op.f('ix_articles_canonical_url'), table_name='articles')
+    op.drop_column('articles', 'canonical_url')
@@ -0,0 +1,32 @@
+"""add_article_keywords_indexes
+
+Revision ID: d4f6a8c0e2b5
+Revises: b8d2e4f6a1c3
+Create Date: 2026-10-17 14:22:51.604183
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f6a8c0e2b5'
+down_revision: Union[str, Sequence[str], None] = 'b8d2e4f6a1c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index article_keywords for keyword -> articles lookups."""
+    # (article_id, keyword_id) is already covered by the unique constraint
+    op.create_index('idx_article_keywords_keyword_article', 'article_keywords', ['keyword_id', 'article_id'])
+    # Incremental detect_trends looks up recently (re)linked articles
+    op.create_index('idx_article_keywords_created_at', 'article_keywords', ['created_at'])
+
+
+def downgrade() -> None:
+    """Remove article_keywords lookup indexes."""
+    op.drop_index('idx_article_keywords_created_at', table_name='article_keywords')
+    op.drop_index('idx_article_keywords_keyword_article', table_name='article_keywords')
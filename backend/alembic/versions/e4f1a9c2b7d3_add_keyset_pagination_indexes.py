@@ -0,0 +1,47 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: e4f1a9c2b7d3
+Revises: c2a82ac4fde2
+Create Date: 2026-10-17 10:12:44.318502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4f1a9c2b7d3'
+down_revision: Union[str, Sequence[str], None] = 'c2a82ac4fde2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite indexes matching the keyset sorts of list endpoints."""
+    # Expressions must stay identical to the sort keys in app/api (articles, videos, library)
+    op.create_index('idx_articles_keyset_score', 'articles', [
+        sa.text('coalesce(score, -1) DESC'), sa.text('id DESC')
+    ])
+    op.create_index('idx_articles_keyset_date', 'articles', [
+        sa.text('published_at DESC'), sa.text('id DESC')
+    ])
+    op.create_index('idx_articles_keyset_popularity', 'articles', [
+        sa.text('(coalesce(upvotes, 0) + coalesce(comments_count, 0)) DESC'), sa.text('id DESC')
+    ])
+    op.create_index('idx_articles_keyset_views', 'articles', [
+        sa.text('coalesce(view_count, -1) DESC'), sa.text('id DESC')
+    ])
+    op.create_index('idx_articles_keyset_bookmarked', 'articles', [
+        sa.text('coalesce(bookmarked_at, created_at) DESC'), sa.text('id DESC')
+    ], postgresql_where=sa.text('is_bookmarked'))
+
+
+def downgrade() -> None:
+    """Remove keyset pagination indexes."""
+    op.drop_index('idx_articles_keyset_bookmarked', table_name='articles')
+    op.drop_index('idx_articles_keyset_views', table_name='articles')
+    op.drop_index('idx_articles_keyset_popularity', table_name='articles')
+    op.drop_index('idx_articles_keyset_date', table_name='articles')
+    op.drop_index('idx_articles_keyset_score', table_name='articles')
@@ -0,0 +1,45 @@
+"""add_full_text_search
+
+Revision ID: f7b3d8e1a6c9
+Revises: e4f1a9c2b7d3
+Create Date: 2026-10-17 11:03:27.540716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b3d8e1a6c9'
+down_revision: Union[str, Sequence[str], None] = 'e4f1a9c2b7d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add generated tsvector column + GIN indexes for full-text search."""
+    # Maintained by PostgreSQL on every insert/update (title > author > content).
+    # Content is capped so very long pages stay under the tsvector size limit.
+    op.execute("""
+        ALTER TABLE articles ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english'::regconfig, coalesce(author, '')), 'B') ||
+            setweight(to_tsvector('english'::regconfig, left(coalesce(content, ''), 100000)), 'C')
+        ) STORED
+    """)
+    op.create_index('idx_articles_search_vector', 'articles', ['search_vector'], postgresql_using='gin')
+
+    # Admin comment search (expression must match app/services/search.py)
+    op.create_index('idx_comments_content_fts', 'comments', [
+        sa.text("to_tsvector('english'::regconfig, content)")
+    ], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Remove full-text search column and indexes."""
+    op.drop_index('idx_comments_content_fts', table_name='comments')
+    op.drop_index('idx_articles_search_vector', table_name='articles')
+    op.drop_column('articles', 'search_vector')
@@ -19,6 +19,7 @@ from app.schemas.user import (
     PaginatedUsersResponse,
     UserResponse,
 )
+from app.services.search import comment_search_filter
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -199,7 +200,7 @@ async def list_comments(
     query = db.query(Comment).options(joinedload(Comment.author))
 
     if search:
-        query = query.filter(Comment.content.ilike(f"%{search}%"))
+        query = query.filter(comment_search_filter(search, db.get_bind().dialect.name))
 
     if is_deleted is not None:
         query = query.filter(Comment.is_deleted == is_deleted)
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Integer, cast, func, desc, select, text
 from datetime import datetime, timedelta, date
-from app.database import get_db
+from app.database import get_async_db
 from app.models import Article, Keyword, Source, Trend
 from app.schemas.analytics import (
     AnalyticsSummaryResponse,
@@ -12,13 +12,15 @@ from app.schemas.analytics import (
     WeeklyTrendResponse
 )
 from app.utils.logger import get_logger
+from app.utils.response_cache import TAG_ARTICLES, TAG_KEYWORDS, TAG_TRENDS, cached_response
 
 logger = get_logger(__name__)
 router = APIRouter()
 
 
 @router.get("/analytics/summary", response_model=AnalyticsSummaryResponse)
-async def get_analytics_summary(db: Session = Depends(get_db)):
+@cached_response(ttl=300, tags=[TAG_ARTICLES, TAG_KEYWORDS, TAG_TRENDS])
+async def get_analytics_summary(db: AsyncSession = Depends(get_async_db)):
     """
     Résumé global des analytics
 
@@ -28,35 +30,35 @@ async def get_analytics_summary(db: Session = Depends(get_db)):
     - Répartition par catégorie
     """
     # Total counts
-    total_articles = db.query(func.count(Article.id)).scalar()
-    total_sources = db.query(func.count(Source.id)).filter(Source.is_active == True).scalar()
-    total_keywords = db.query(func.count(Keyword.id)).filter(Keyword.is_active == True).scalar()
+    total_articles = await db.scalar(select(func.count(Article.id)))
+    total_sources = await db.scalar(select(func.count(Source.id)).where(Source.is_active == True))
+    total_keywords = await db.scalar(select(func.count(Keyword.id)).where(Keyword.is_active == True))
 
     # Avg score last 7 days
     seven_days_ago = datetime.now() - timedelta(days=7)
-    avg_score = db.query(func.avg(Article.score)).filter(
+    avg_score = await db.scalar(select(func.avg(Article.score)).where(
         Article.scraped_at >= seven_days_ago,
         Article.score.isnot(None)
-    ).scalar() or 0.0
+    )) or 0.0
 
     # Articles scraped today
     today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    articles_today = db.query(func.count(Article.id)).filter(
+    articles_today = await db.scalar(select(func.count(Article.id)).where(
         Article.scraped_at >= today_start
-    ).scalar()
+    ))
 
     # Top trends (last 7 days)
-    top_trends_query = db.query(Trend).filter(
+    top_trends_query = (await db.scalars(select(Trend).where(
         Trend.date >= (date.today() - timedelta(days=7))
-    ).order_by(desc(Trend.trend_score)).limit(10).all()
+    ).order_by(desc(Trend.trend_score)).limit(10))).all()
 
     # Articles by category
-    categories = db.query(
+    categories = (await db.execute(select(
         Article.category,
         func.count(Article.id)
-    ).filter(
+    ).where(
         Article.category.isnot(None)
-    ).group_by(Article.category).all()
+    ).group_by(Article.category))).all()
 
     articles_by_category = {cat: count for cat, count in categories}
 
@@ -74,7 +76,7 @@ async def get_analytics_summary(db: Session = Depends(get_db)):
 @router.get("/analytics/daily-stats")
 async def get_daily_stats(
     days: int = Query(7, ge=1, le=90),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Statistiques quotidiennes
@@ -84,20 +86,20 @@ async def get_daily_stats(
     start_date = datetime.now() - timedelta(days=days)
 
     # Query avec agrégation par jour et catégorie
-    stats = db.query(
+    stats = (await db.execute(select(
         func.date(Article.published_at).label('date'),
         Article.category,
         func.count(Article.id).label('article_count'),
         func.avg(Article.score).label('avg_score'),
-        func.sum(func.cast(Article.is_read, db.Integer)).label('read_count'),
-        func.sum(func.cast(Article.is_favorite, db.Integer)).label('favorite_count')
-    ).filter(
+        func.sum(cast(Article.is_read, Integer)).label('read_count'),
+        func.sum(cast(Article.is_favorite, Integer)).label('favorite_count')
+    ).where(
         Article.published_at >= start_date,
         Article.category.isnot(None)
     ).group_by(
         func.date(Article.published_at),
         Article.category
-    ).all()
+    ))).all()
 
     # Restructure data
     daily_data = {}
@@ -146,7 +148,7 @@ async def get_trends(
     days: int = Query(7, ge=1, le=90),
     category: str = Query(None),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Récupère les tendances détectées
@@ -157,12 +159,12 @@ async def get_trends(
     """
     start_date = date.today() - timedelta(days=days)
 
-    query = db.query(Trend).filter(Trend.date >= start_date)
+    query = select(Trend).where(Trend.date >= start_date)
 
     if category:
-        query = query.filter(Trend.category == category)
+        query = query.where(Trend.category == category)
 
-    trends = query.order_by(desc(Trend.trend_score)).limit(limit).all()
+    trends = (await db.scalars(query.order_by(desc(Trend.trend_score)).limit(limit))).all()
 
     logger.info(f"Retrieved {len(trends)} trends (last {days} days)")
     return trends
@@ -171,7 +173,7 @@ async def get_trends(
 @router.get("/analytics/weekly-trends", response_model=list[WeeklyTrendResponse])
 async def get_weekly_trends(
     weeks: int = Query(4, ge=1, le=52),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Tendances hebdomadaires agrégées
@@ -181,7 +183,7 @@ async def get_weekly_trends(
     start_date = date.today() - timedelta(weeks=weeks * 7)
 
     # Query from vw_weekly_trends view
-    result = db.execute(f"""
+    result = await db.execute(text("""
         SELECT
             week_start,
             keyword,
@@ -189,10 +191,10 @@ async def get_weekly_trends(
             avg_trend_score,
             total_articles
         FROM vw_weekly_trends
-        WHERE week_start >= '{start_date}'
+        WHERE week_start >= :start_date
         ORDER BY week_start DESC, avg_trend_score DESC
         LIMIT 50
-    """)
+    """), {"start_date": start_date})
 
     trends = [
         WeeklyTrendResponse(
@@ -210,10 +212,11 @@ async def get_weekly_trends(
 
 
 @router.get("/analytics/top-keywords")
+@cached_response(ttl=900, tags=[TAG_TRENDS])
 async def get_top_keywords(
     days: int = Query(7, ge=1, le=90),
     limit: int = Query(10, ge=1, le=50),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Top keywords par fréquence dans les tendances
@@ -223,19 +226,19 @@ async def get_top_keywords(
     """
     start_date = date.today() - timedelta(days=days)
 
-    top_keywords = db.query(
+    top_keywords = (await db.execute(select(
         Trend.keyword,
         Trend.category,
         func.sum(Trend.article_count).label('total_articles'),
         func.avg(Trend.trend_score).label('avg_score')
-    ).filter(
+    ).where(
         Trend.date >= start_date
     ).group_by(
         Trend.keyword,
         Trend.category
     ).order_by(
         desc('total_articles')
-    ).limit(limit).all()
+    ).limit(limit))).all()
 
     result = [
         {
@@ -1,23 +1,39 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, literal_column, select
 from typing import Optional, List
 from datetime import datetime, timedelta
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models import Article, Source
 from app.schemas.article import ArticleResponse, PaginatedArticlesResponse
+from app.services.article_keywords import has_keyword
+from app.services.search import apply_article_search
 from app.utils.logger import get_logger
+from app.utils.pagination import count_rows, keyset_paginate_async
+from app.utils.response_cache import TAG_ARTICLES, cached_response, invalidate_tags_async
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Sort keys (DESC, then id DESC); expressions match the keyset indexes
+ARTICLE_SORT_KEYS = {
+    "score": [func.coalesce(Article.score, literal_column("-1"))],
+    "date": [Article.published_at],
+    "popularity": [
+        func.coalesce(Article.upvotes, literal_column("0")) +
+        func.coalesce(Article.comments_count, literal_column("0"))
+    ],
+}
+
 
 @router.get("/articles", response_model=PaginatedArticlesResponse)
 async def get_articles(
     categories: Optional[str] = Query(None, description="Comma-separated categories"),
     sources: Optional[str] = Query(None, description="Comma-separated source types"),
+    keyword_id: Optional[int] = Query(None, description="Only articles matching this keyword"),
     search: Optional[str] = Query(None, description="Search in title, content, author"),
-    sort: str = Query("score", pattern="^(score|date|popularity)$"),
+    sort: Optional[str] = Query(None, pattern="^(score|date|popularity|relevance)$"),
     timeRange: Optional[str] = Query(None, pattern="^(24h|7d|30d)$", description="Time filter"),
     minScore: float = Query(0.0, ge=0.0, le=100.0),
     is_read: Optional[bool] = None,
@@ -25,25 +41,29 @@ async def get_articles(
     is_archived: bool = False,
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Récupère les articles avec filtres et pagination
 
     - **categories**: Filtrer par catégories (comma-separated: healthtech,web3,dev)
     - **sources**: Filtrer par sources (comma-separated: hackernews,devto)
-    - **search**: Recherche dans titre, contenu, auteur, tags
-    - **sort**: Trier par (score, date, popularity)
+    - **keyword_id**: Articles contenant ce mot-clé (liens article_keywords posés au scoring)
+    - **search**: Recherche plein texte (titre, auteur, contenu; préfixes, extraits surlignés)
+    - **sort**: Trier par (score, date, popularity, relevance; relevance par défaut si search)
     - **minScore**: Score minimum (0-100)
     - **is_read**: Filtrer par statut lu/non-lu
     - **is_favorite**: Filtrer par favoris
     - **is_archived**: Inclure les articles archivés (False par défaut)
     - **limit**: Nombre max de résultats (1-200)
     - **offset**: Offset pour pagination
+    - **cursor**: Pagination par curseur (remplace offset, pas de total calculé)
     """
     # Eagerly load source relationship to populate source_type
-    query = db.query(Article).options(joinedload(Article.source)).filter(
+    query = select(Article).options(joinedload(Article.source)).filter(
         Article.is_archived == is_archived,
+        Article.duplicate_of_id.is_(None),  # One entry per story (canonical article)
         or_(Article.score >= minScore, Article.score.is_(None))
     )
 
@@ -78,16 +98,14 @@ async def get_articles(
         if source_list:
             query = query.filter(Source.type.in_(source_list))
 
-    # Search functionality
+    # Filter by keyword (index lookup on article_keywords)
+    if keyword_id is not None:
+        query = query.filter(has_keyword(keyword_id))
+
+    # Search functionality (full-text index)
+    rank = snippet = None
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Article.title.ilike(search_term),
-                Article.content.ilike(search_term),
-                Article.author.ilike(search_term)
-            )
-        )
+        query, rank, snippet = apply_article_search(query, search, db.bind.dialect.name)
 
     # Other filters
     if is_read is not None:
@@ -96,26 +114,35 @@ async def get_articles(
     if is_favorite is not None:
         query = query.filter(Article.is_favorite == is_favorite)
 
-    # Get total count
-    total = query.count()
+    # Get total count (skipped when paging by cursor)
+    total = None if cursor else await db.run_sync(count_rows, query)
+
+    # Sorting - map frontend values to backend fields (popularity = upvotes + comments)
+    if sort is None:
+        sort = "relevance" if rank is not None else "score"
+    if sort == "relevance":
+        sort_keys = [rank] if rank is not None else ARTICLE_SORT_KEYS["score"]
+    else:
+        sort_keys = ARTICLE_SORT_KEYS[sort]
 
-    # Sorting - map frontend values to backend fields
-    if sort == "score":
-        query = query.order_by(Article.score.desc())
-    elif sort == "date":
-        query = query.order_by(Article.published_at.desc())
-    elif sort == "popularity":
-        # Popularity = upvotes + comments
-        query = query.order_by((Article.upvotes + Article.comments_count).desc())
+    if snippet is not None:
+        query = query.add_columns(snippet.label('search_snippet'))
 
-    articles = query.limit(limit).offset(offset).all()
+    try:
+        rows, has_more, next_cursor = await keyset_paginate_async(
+            db, query, sort, sort_keys, Article.id, limit, offset, cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    articles = [row.Article for row in rows]
 
     # Populate source_type from relationship
     articles_data = []
-    for article in articles:
+    for row, article in zip(rows, articles):
         article_dict = {
             **article.__dict__,
-            'source_type': article.source.type if article.source else None
+            'source_type': article.source.type if article.source else None,
+            'search_snippet': row._mapping.get('search_snippet')
         }
         articles_data.append(ArticleResponse.model_validate(article_dict))
 
@@ -127,14 +154,16 @@ async def get_articles(
     return PaginatedArticlesResponse(
         data=articles_data,
         total=total,
-        hasMore=offset + len(articles) < total,
+        hasMore=has_more,
         offset=offset,
-        limit=limit
+        limit=limit,
+        nextCursor=next_cursor
     )
 
 
 @router.get("/articles/best-of-week", response_model=Optional[ArticleResponse])
-async def get_best_article_of_week(db: Session = Depends(get_db)):
+@cached_response(ttl=300, tags=[TAG_ARTICLES])
+async def get_best_article_of_week(db: AsyncSession = Depends(get_async_db)):
     """
     Get the best article of the week based on score AND user engagement.
 
@@ -157,15 +186,15 @@ async def get_best_article_of_week(db: Session = Depends(get_db)):
     # Exclude YouTube sources (those are videos)
     youtube_types = ['youtube_rss', 'youtube_trending']
 
-    article = db.query(Article).options(joinedload(Article.source)).join(
+    article = await db.scalar(select(Article).options(joinedload(Article.source)).join(
         Article.source
-    ).filter(
+    ).where(
         ~Source.type.in_(youtube_types),
         Article.published_at >= one_week_ago,
         Article.is_archived == False
     ).order_by(
         engagement_score.desc()
-    ).first()
+    ).limit(1))
 
     if not article:
         return None
@@ -180,10 +209,10 @@ async def get_best_article_of_week(db: Session = Depends(get_db)):
 @router.get("/articles/{article_id}", response_model=ArticleResponse)
 async def get_article(
     article_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Récupère un article par son ID"""
-    article = db.query(Article).filter(Article.id == article_id).first()
+    article = await db.get(Article, article_id)
 
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
@@ -246,6 +275,7 @@ async def toggle_archive(
     article.is_archived = is_archived
     db.commit()
     db.refresh(article)
+    await invalidate_tags_async(TAG_ARTICLES)
 
     logger.info(f"Article {article_id} archived: {is_archived}")
     return {"message": "Article updated", "is_archived": is_archived}
@@ -264,6 +294,7 @@ async def delete_article(
 
     db.delete(article)
     db.commit()
+    await invalidate_tags_async(TAG_ARTICLES)
 
     logger.info(f"Article {article_id} deleted")
     return {"message": "Article deleted"}
@@ -291,6 +322,7 @@ async def toggle_like(
 
     db.commit()
     db.refresh(article)
+    await invalidate_tags_async(TAG_ARTICLES)
 
     logger.info(f"Article {article_id} like toggled: {article.is_liked}")
 
@@ -324,6 +356,7 @@ async def toggle_dislike(
 
     db.commit()
     db.refresh(article)
+    await invalidate_tags_async(TAG_ARTICLES)
 
     logger.info(f"Article {article_id} dislike toggled: {article.is_disliked}")
 
@@ -336,11 +369,12 @@ async def toggle_dislike(
 
 
 @router.get("/articles/categories/list")
-async def get_categories(db: Session = Depends(get_db)):
+@cached_response(ttl=3600, tags=[TAG_ARTICLES])
+async def get_categories(db: AsyncSession = Depends(get_async_db)):
     """Récupère la liste des catégories disponibles"""
-    categories = db.query(Article.category).distinct().filter(
+    categories = (await db.execute(select(Article.category).distinct().where(
         Article.category.isnot(None)
-    ).all()
+    ))).all()
 
     category_list = [cat[0] for cat in categories if cat[0]]
 
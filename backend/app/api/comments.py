@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 
 from app.auth.deps import get_current_user
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models.comment import Comment
 
 # Import models (will be created by models branch)
@@ -22,6 +23,29 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/comments", tags=["comments"])
 
 
+async def _page_comments(db: AsyncSession, query, order_by, limit: int, offset: int):
+    """Total count and one page of comments (author eagerly loaded)"""
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
+    comments = (await db.scalars(
+        query.options(joinedload(Comment.author)).order_by(order_by).offset(offset).limit(limit)
+    )).all()
+    return total, comments
+
+
+async def _reply_counts(db: AsyncSession, comments) -> dict:
+    """Number of non-deleted replies per comment, in one GROUP BY"""
+    if not comments:
+        return {}
+    counts = await db.execute(select(
+        Comment.parent_id,
+        func.count(Comment.id)
+    ).where(
+        Comment.parent_id.in_([c.id for c in comments]),
+        Comment.is_deleted.is_(False)
+    ).group_by(Comment.parent_id))
+    return {parent_id: count for parent_id, count in counts}
+
+
 def _build_comment_response(comment: Comment, replies_count: int = 0) -> CommentResponse:
     """Build comment response with author info."""
     return CommentResponse(
@@ -49,7 +73,7 @@ async def get_article_comments(
     article_id: int,
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get comments for an article.
@@ -57,30 +81,17 @@ async def get_article_comments(
     Returns top-level comments with reply counts.
     """
     # Get top-level comments (no parent)
-    query = db.query(Comment).options(joinedload(Comment.author)).filter(
+    query = select(Comment).where(
         Comment.target_type == CommentTargetType.ARTICLE,
         Comment.target_id == article_id,
         Comment.parent_id.is_(None),
         Comment.is_deleted.is_(False),
     )
 
-    total = query.count()
-
-    comments = query.order_by(Comment.created_at.desc()).offset(offset).limit(limit).all()
+    total, comments = await _page_comments(db, query, Comment.created_at.desc(), limit, offset)
 
     # Get reply counts for each comment
-    reply_counts = {}
-    if comments:
-        comment_ids = [c.id for c in comments]
-        counts = db.query(
-            Comment.parent_id,
-            func.count(Comment.id)
-        ).filter(
-            Comment.parent_id.in_(comment_ids),
-            Comment.is_deleted.is_(False)
-        ).group_by(Comment.parent_id).all()
-
-        reply_counts = {parent_id: count for parent_id, count in counts}
+    reply_counts = await _reply_counts(db, comments)
 
     data = [
         _build_comment_response(c, reply_counts.get(c.id, 0))
@@ -101,37 +112,24 @@ async def get_video_comments(
     video_id: int,
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get comments for a video.
 
     Returns top-level comments with reply counts.
     """
-    query = db.query(Comment).options(joinedload(Comment.author)).filter(
+    query = select(Comment).where(
         Comment.target_type == CommentTargetType.VIDEO,
         Comment.target_id == video_id,
         Comment.parent_id.is_(None),
         Comment.is_deleted.is_(False),
     )
 
-    total = query.count()
-
-    comments = query.order_by(Comment.created_at.desc()).offset(offset).limit(limit).all()
+    total, comments = await _page_comments(db, query, Comment.created_at.desc(), limit, offset)
 
     # Get reply counts
-    reply_counts = {}
-    if comments:
-        comment_ids = [c.id for c in comments]
-        counts = db.query(
-            Comment.parent_id,
-            func.count(Comment.id)
-        ).filter(
-            Comment.parent_id.in_(comment_ids),
-            Comment.is_deleted.is_(False)
-        ).group_by(Comment.parent_id).all()
-
-        reply_counts = {parent_id: count for parent_id, count in counts}
+    reply_counts = await _reply_counts(db, comments)
 
     data = [
         _build_comment_response(c, reply_counts.get(c.id, 0))
@@ -152,27 +150,25 @@ async def get_comment_replies(
     comment_id: int,
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get replies to a specific comment.
     """
     # Verify parent comment exists
-    parent = db.query(Comment).filter(Comment.id == comment_id).first()
+    parent = await db.scalar(select(Comment.id).where(Comment.id == comment_id))
     if not parent:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Comment not found"
         )
 
-    query = db.query(Comment).options(joinedload(Comment.author)).filter(
+    query = select(Comment).where(
         Comment.parent_id == comment_id,
         Comment.is_deleted.is_(False),
     )
 
-    total = query.count()
-
-    replies = query.order_by(Comment.created_at.asc()).offset(offset).limit(limit).all()
+    total, replies = await _page_comments(db, query, Comment.created_at.asc(), limit, offset)
 
     data = [_build_comment_response(r) for r in replies]
 
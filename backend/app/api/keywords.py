@@ -9,6 +9,7 @@ from app.schemas.keyword import (
     KeywordListResponse
 )
 from app.utils.logger import get_logger
+from app.utils.response_cache import TAG_KEYWORDS, cached_response, invalidate_tags_async
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -80,6 +81,7 @@ async def create_keyword(
     db.add(keyword)
     db.commit()
     db.refresh(keyword)
+    await invalidate_tags_async(TAG_KEYWORDS)
 
     logger.info(f"Keyword created: {keyword.keyword} (category: {keyword.category}, weight: {keyword.weight})")
     return keyword
@@ -118,6 +120,7 @@ async def update_keyword(
 
     db.commit()
     db.refresh(keyword)
+    await invalidate_tags_async(TAG_KEYWORDS)
 
     logger.info(f"Keyword {keyword_id} updated: {keyword.keyword}")
     return keyword
@@ -137,12 +140,14 @@ async def delete_keyword(
     keyword_name = keyword.keyword
     db.delete(keyword)
     db.commit()
+    await invalidate_tags_async(TAG_KEYWORDS)
 
     logger.info(f"Keyword deleted: {keyword_name}")
     return {"message": f"Keyword '{keyword_name}' deleted"}
 
 
 @router.get("/keywords/categories/list")
+@cached_response(ttl=3600, tags=[TAG_KEYWORDS])
 async def get_keyword_categories(db: Session = Depends(get_db)):
     """Récupère la liste des catégories de mots-clés"""
     categories = db.query(Keyword.category).distinct().filter(
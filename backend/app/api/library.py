@@ -1,21 +1,29 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import case, func
 from typing import Optional
 from datetime import datetime
 from app.database import get_db
 from app.models import Article, Source
 from app.schemas.article import ArticleResponse
 from app.utils.logger import get_logger
+from app.utils.pagination import keyset_paginate
 from pydantic import BaseModel
 
 logger = get_logger(__name__)
 router = APIRouter()
 
 
+# Newest bookmark first; matches the partial keyset index on bookmarked articles
+LIBRARY_SORT_KEYS = [func.coalesce(Article.bookmarked_at, Article.created_at)]
+
+
 class LibraryResponse(BaseModel):
     items: list[ArticleResponse]
     total: int
     unread_count: int
+    hasMore: bool = False
+    nextCursor: Optional[str] = None
 
 
 @router.get("/library", response_model=LibraryResponse)
@@ -24,9 +32,10 @@ async def get_library(
     unread_only: bool = Query(False),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
     db: Session = Depends(get_db)
 ):
-    """Get all bookmarked items (Library)"""
+    """Get all bookmarked items (Library), paged by offset or cursor"""
     query = db.query(Article).options(joinedload(Article.source)).filter(
         Article.is_bookmarked == True
     )
@@ -41,18 +50,26 @@ async def get_library(
     if unread_only:
         query = query.filter(Article.is_read == False)
 
-    # Get total count before filtering unread
-    base_count_query = db.query(Article).filter(Article.is_bookmarked == True)
+    # Get total and unread counts (before filtering unread) in one aggregate
+    count_query = db.query(
+        func.count(Article.id),
+        func.coalesce(func.sum(case((Article.is_read == False, 1), else_=0)), 0)
+    ).filter(Article.is_bookmarked == True)
     if type == "article":
-        base_count_query = base_count_query.filter(Article.is_video == False)
+        count_query = count_query.filter(Article.is_video == False)
     elif type == "video":
-        base_count_query = base_count_query.filter(Article.is_video == True)
+        count_query = count_query.filter(Article.is_video == True)
 
-    total = base_count_query.count()
-    unread_count = base_count_query.filter(Article.is_read == False).count()
+    total, unread_count = count_query.one()
 
     # Sort by bookmarked_at descending (newest first)
-    items = query.order_by(Article.bookmarked_at.desc()).limit(limit).offset(offset).all()
+    try:
+        rows, has_more, next_cursor = keyset_paginate(
+            query, "bookmarked_at", LIBRARY_SORT_KEYS, Article.id, limit, offset, cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    items = [row.Article for row in rows]
 
     # Transform to response
     items_data = []
@@ -68,7 +85,9 @@ async def get_library(
     return LibraryResponse(
         items=items_data,
         total=total,
-        unread_count=unread_count
+        unread_count=unread_count,
+        hasMore=has_more,
+        nextCursor=next_cursor
     )
 
 
@@ -4,21 +4,24 @@ Personalized feed endpoints.
 Returns articles with user-specific scores based on their keywords.
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, literal_column, select
 from typing import Optional
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 
 from app.auth.deps import get_current_user
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models import Article, Source
 from app.models.user import User
 from app.models.user_keyword import UserKeyword
 from app.models.user_article_score import UserArticleScore
 from app.schemas.article import ArticleResponse
+from app.services.search import apply_article_search
 from app.services.user_scoring import UserScoringService
 from app.utils.logger import get_logger
+from app.utils.pagination import COUNT_MODE_PATTERN, count_rows, estimate_count, keyset_paginate_async
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/personalized", tags=["personalized"])
@@ -33,39 +36,56 @@ class PersonalizedArticleResponse(ArticleResponse):
 class PersonalizedFeedResponse(BaseModel):
     """Response for personalized feed."""
     data: list[PersonalizedArticleResponse]
-    total: int
+    total: Optional[int] = None  # None when count=none
     hasMore: bool
     offset: int
     limit: int
+    nextCursor: Optional[str] = None
 
 
 @router.get("/feed", response_model=PersonalizedFeedResponse)
 async def get_personalized_feed(
     categories: Optional[str] = Query(None, description="Comma-separated categories"),
     sources: Optional[str] = Query(None, description="Comma-separated source types"),
-    search: Optional[str] = Query(None, description="Search in title, content"),
+    search: Optional[str] = Query(None, description="Full-text search in title, author, content"),
     timeRange: Optional[str] = Query(None, pattern="^(24h|7d|30d)$"),
     minScore: float = Query(0.0, ge=0.0, le=100.0),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    count: str = Query("exact", pattern=COUNT_MODE_PATTERN, description="Total: exact, estimated or none"),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
     user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get personalized article feed sorted by user's keyword-based scores.
 
     Returns articles ordered by personalized_score, with scores calculated
     based on the user's configured keywords and weights.
+
+    - **count**: exact (window count in the page query), estimated (planner
+      estimate, cheap on deep pages) or none (total omitted, hasMore from
+      fetching one extra row)
+    - **cursor**: keyset pagination from a previous nextCursor (replaces offset)
     """
     # Check if user has keywords
-    has_keywords = db.query(UserKeyword).filter(
+    has_keywords = await db.scalar(select(UserKeyword.id).where(
         UserKeyword.user_id == user.id,
         UserKeyword.is_active == True
-    ).first() is not None
-
-    # Base query with eager loading
-    query = db.query(Article).options(joinedload(Article.source)).filter(
-        Article.is_archived == False
+    ).limit(1)) is not None
+
+    # Base query with eager loading; the user's score comes from the same join
+    query = select(
+        Article,
+        UserArticleScore.score.label('personalized_score'),
+        UserArticleScore.keyword_matches
+    ).options(joinedload(Article.source)).outerjoin(
+        UserArticleScore,
+        (UserArticleScore.article_id == Article.id) &
+        (UserArticleScore.user_id == user.id)
+    ).filter(
+        Article.is_archived == False,
+        Article.duplicate_of_id.is_(None)  # One entry per story (canonical article)
     )
 
     # Time range filter
@@ -90,25 +110,12 @@ async def get_personalized_feed(
         if source_list:
             query = query.join(Article.source).filter(Source.type.in_(source_list))
 
-    # Search
+    # Search (full-text index; order stays personalized)
+    snippet = None
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Article.title.ilike(search_term),
-                Article.content.ilike(search_term),
-                Article.author.ilike(search_term)
-            )
-        )
+        query, _, snippet = apply_article_search(query, search, db.bind.dialect.name)
 
     if has_keywords:
-        # Join with user scores and order by personalized score
-        query = query.outerjoin(
-            UserArticleScore,
-            (UserArticleScore.article_id == Article.id) &
-            (UserArticleScore.user_id == user.id)
-        )
-
         # Filter by min personalized score
         if minScore > 0:
             query = query.filter(
@@ -119,52 +126,75 @@ async def get_personalized_feed(
             )
 
         # Order by personalized score, then global score
-        query = query.order_by(
-            func.coalesce(UserArticleScore.score, Article.score, 0).desc(),
-            Article.published_at.desc()
-        )
+        sort = "personalized"
+        sort_keys = [
+            func.coalesce(UserArticleScore.score, Article.score, literal_column("0")),
+            Article.published_at
+        ]
     else:
         # No keywords - use global score
         if minScore > 0:
             query = query.filter(
                 or_(Article.score >= minScore, Article.score.is_(None))
             )
-        query = query.order_by(Article.score.desc(), Article.published_at.desc())
-
-    # Get total count
-    total = query.count()
+        sort = "score"
+        sort_keys = [func.coalesce(Article.score, literal_column("-1")), Article.published_at]
+
+    # Apply pagination (single SELECT: scores and exact total ride along)
+    page_query = query
+    if snippet is not None:
+        page_query = page_query.add_columns(snippet.label('search_snippet'))
+    # FTS5 auxiliary functions (snippet) cannot share a SELECT with a window function
+    windowed_total = count == "exact" and not cursor and (
+        snippet is None or db.bind.dialect.name == "postgresql"
+    )
+    if windowed_total:
+        page_query = page_query.add_columns(func.count().over().label('total_count'))
 
-    # Apply pagination
-    articles = query.limit(limit).offset(offset).all()
+    try:
+        rows, has_more, next_cursor = await keyset_paginate_async(
+            db, page_query, sort, sort_keys, Article.id, limit, offset, cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    total = None
+    if count == "exact":
+        if rows and windowed_total:
+            total = rows[0].total_count
+        elif offset or not windowed_total:
+            # Past the last page no row carries it (cursor pages and SQLite searches never do)
+            total = await db.run_sync(count_rows, query)
+        else:
+            total = 0
+    elif count == "estimated":
+        total = max(await db.run_sync(estimate_count, query), (0 if cursor else offset) + len(rows))
 
     # Build response with personalized scores
     articles_data = []
-    for article in articles:
-        # Get personalized score if exists
-        user_score = db.query(UserArticleScore).filter(
-            UserArticleScore.user_id == user.id,
-            UserArticleScore.article_id == article.id
-        ).first()
-
+    for row in rows:
+        article = row.Article
         article_dict = {
             **article.__dict__,
             'source_type': article.source.type if article.source else None,
-            'personalized_score': user_score.score if user_score else None,
-            'keyword_matches': user_score.keyword_matches if user_score else None
+            'personalized_score': row.personalized_score,
+            'keyword_matches': row.keyword_matches,
+            'search_snippet': row._mapping.get('search_snippet')
         }
         articles_data.append(PersonalizedArticleResponse.model_validate(article_dict))
 
     logger.info(
-        f"Retrieved {len(articles)} personalized articles for user {user.id} "
+        f"Retrieved {len(rows)} personalized articles for user {user.id} "
         f"(has_keywords={has_keywords})"
     )
 
     return PersonalizedFeedResponse(
         data=articles_data,
         total=total,
-        hasMore=offset + len(articles) < total,
+        hasMore=has_more,
         offset=offset,
-        limit=limit
+        limit=limit,
+        nextCursor=next_cursor
     )
 
 
@@ -187,32 +217,26 @@ async def score_new_articles(
 @router.get("/stats")
 async def get_personalized_stats(
     user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get statistics about user's personalized scoring.
     """
     # Count keywords
-    keyword_count = db.query(UserKeyword).filter(
+    keyword_count = await db.scalar(select(func.count(UserKeyword.id)).where(
         UserKeyword.user_id == user.id,
         UserKeyword.is_active == True
-    ).count()
-
-    # Count scored articles
-    scored_count = db.query(UserArticleScore).filter(
-        UserArticleScore.user_id == user.id
-    ).count()
-
-    # Average personalized score
-    avg_score = db.query(func.avg(UserArticleScore.score)).filter(
+    ))
+
+    # Scored articles, average and high score (>70) in one pass
+    scored_count, avg_score, high_score_count = (await db.execute(select(
+        func.count(UserArticleScore.id),
+        func.avg(UserArticleScore.score),
+        func.count(UserArticleScore.id).filter(UserArticleScore.score >= 70)
+    ).where(
         UserArticleScore.user_id == user.id
-    ).scalar() or 0.0
-
-    # High score articles (>70)
-    high_score_count = db.query(UserArticleScore).filter(
-        UserArticleScore.user_id == user.id,
-        UserArticleScore.score >= 70
-    ).count()
+    ))).one()
+    avg_score = avg_score or 0.0
 
     return {
         "keyword_count": keyword_count,
@@ -36,7 +36,8 @@ async def get_triage_items(
     base_query = db.query(Article).options(joinedload(Article.source)).filter(
         Article.is_bookmarked == False,
         Article.is_dismissed == False,
-        Article.is_archived == False
+        Article.is_archived == False,
+        Article.duplicate_of_id.is_(None)
     )
 
     # Get remaining count for UI
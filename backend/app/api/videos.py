@@ -1,12 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, or_, desc
+from sqlalchemy import func, or_, desc, literal_column, select
 from typing import Optional
 from datetime import datetime, timedelta
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models import Article, Source
 from app.schemas.article import VideoResponse, PaginatedVideosResponse
+from app.services.search import apply_article_search
 from app.utils.logger import get_logger
+from app.utils.pagination import count_rows, keyset_paginate_async
+from app.utils.response_cache import TAG_ARTICLES, cached_response
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -14,33 +18,42 @@ router = APIRouter()
 # YouTube source types
 YOUTUBE_SOURCE_TYPES = ['youtube_rss', 'youtube_trending']
 
+# Sort keys (DESC, then id DESC); expressions match the keyset indexes
+VIDEO_SORT_KEYS = {
+    "score": [func.coalesce(Article.score, literal_column("-1"))],
+    "date": [Article.published_at],
+    "popularity": [func.coalesce(Article.view_count, literal_column("-1"))],
+}
+
 
 @router.get("/videos", response_model=PaginatedVideosResponse)
 async def get_videos(
     categories: Optional[str] = Query(None, description="Comma-separated categories"),
     sources: Optional[str] = Query(None, description="Comma-separated source types"),
-    search: Optional[str] = Query(None, description="Search in title, author"),
-    sort: str = Query("score", pattern="^(score|date|popularity)$"),
+    search: Optional[str] = Query(None, description="Search in title, author, description"),
+    sort: Optional[str] = Query(None, pattern="^(score|date|popularity|relevance)$"),
     timeRange: Optional[str] = Query(None, pattern="^(24h|7d|30d)$", description="Time filter"),
     minScore: float = Query(0.0, ge=0.0, le=100.0),
     is_favorite: Optional[bool] = None,
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get videos (articles from YouTube sources)
 
     - **categories**: Filter by categories (comma-separated)
     - **sources**: Filter by YouTube source types (youtube_rss, youtube_trending)
-    - **search**: Search in title, author
-    - **sort**: Sort by (score, date, popularity)
+    - **search**: Full-text search in title, author, description (prefix matches, highlighted snippets)
+    - **sort**: Sort by (score, date, popularity, relevance; relevance by default when searching)
     - **minScore**: Minimum score (0-100)
     - **is_favorite**: Filter by favorites
     - **limit**: Max results (1-200)
     - **offset**: Offset for pagination
+    - **cursor**: Cursor pagination (replaces offset, total not computed)
     """
-    query = db.query(Article).options(joinedload(Article.source)).join(
+    query = select(Article).options(joinedload(Article.source)).join(
         Article.source
     ).filter(
         Source.type.in_(YOUTUBE_SOURCE_TYPES),
@@ -71,36 +84,40 @@ async def get_videos(
         if youtube_sources:
             query = query.filter(Source.type.in_(youtube_sources))
 
-    # Search
+    # Search (full-text index)
+    rank = snippet = None
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Article.title.ilike(search_term),
-                Article.author.ilike(search_term)
-            )
-        )
+        query, rank, snippet = apply_article_search(query, search, db.bind.dialect.name)
 
     # Filter by favorite
     if is_favorite is not None:
         query = query.filter(Article.is_favorite == is_favorite)
 
-    # Get total count
-    total = query.count()
+    # Get total count (skipped when paging by cursor)
+    total = None if cursor else await db.run_sync(count_rows, query)
 
     # Sorting
-    if sort == "score":
-        query = query.order_by(Article.score.desc())
-    elif sort == "date":
-        query = query.order_by(Article.published_at.desc())
-    elif sort == "popularity":
-        query = query.order_by(Article.view_count.desc().nullslast())
+    if sort is None:
+        sort = "relevance" if rank is not None else "score"
+    if sort == "relevance":
+        sort_keys = [rank] if rank is not None else VIDEO_SORT_KEYS["score"]
+    else:
+        sort_keys = VIDEO_SORT_KEYS[sort]
 
-    videos = query.limit(limit).offset(offset).all()
+    if snippet is not None:
+        query = query.add_columns(snippet.label('search_snippet'))
+
+    try:
+        rows, has_more, next_cursor = await keyset_paginate_async(
+            db, query, sort, sort_keys, Article.id, limit, offset, cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    videos = [row.Article for row in rows]
 
     # Build response
     videos_data = []
-    for video in videos:
+    for row, video in zip(rows, videos):
         video_dict = {
             'id': video.id,
             'title': video.title,
@@ -120,6 +137,7 @@ async def get_videos(
             'is_liked': video.is_liked if hasattr(video, 'is_liked') else False,
             'is_disliked': video.is_disliked if hasattr(video, 'is_disliked') else False,
             'source_type': video.source.type if video.source else None,
+            'search_snippet': row._mapping.get('search_snippet'),
             'created_at': video.created_at,
             'updated_at': video.updated_at
         }
@@ -130,14 +148,16 @@ async def get_videos(
     return PaginatedVideosResponse(
         data=videos_data,
         total=total,
-        hasMore=offset + len(videos) < total,
+        hasMore=has_more,
         offset=offset,
-        limit=limit
+        limit=limit,
+        nextCursor=next_cursor
     )
 
 
 @router.get("/videos/best-of-week", response_model=Optional[VideoResponse])
-async def get_best_video_of_week(db: Session = Depends(get_db)):
+@cached_response(ttl=300, tags=[TAG_ARTICLES])
+async def get_best_video_of_week(db: AsyncSession = Depends(get_async_db)):
     """
     Get the best video of the week based on score AND user engagement.
 
@@ -156,15 +176,15 @@ async def get_best_video_of_week(db: Session = Depends(get_db)):
         case((Article.is_disliked == True, 20), else_=0)
     )
 
-    video = db.query(Article).options(joinedload(Article.source)).join(
+    video = await db.scalar(select(Article).options(joinedload(Article.source)).join(
         Article.source
-    ).filter(
+    ).where(
         Source.type.in_(YOUTUBE_SOURCE_TYPES),
         Article.published_at >= one_week_ago,
         Article.is_archived == False
     ).order_by(
         engagement_score.desc()
-    ).first()
+    ).limit(1))
 
     if not video:
         return None
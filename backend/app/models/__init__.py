@@ -1,9 +1,11 @@
 from app.models.article import Article
 from app.models.source import Source
+from app.models.source_watermark import SourceWatermark
 from app.models.scraping_run import ScrapingRun
 from app.models.keyword import Keyword
 from app.models.article_keyword import ArticleKeyword
 from app.models.trend import Trend
+from app.models.keyword_daily_stat import KeywordDailyStat
 from app.models.user_config import UserConfig
 from app.models.youtube_channel import YouTubeChannel
 from app.models.user import User, OAuthAccount
@@ -12,14 +14,17 @@ from app.models.comment import Comment
 from app.models.user_state import UserArticleState, UserVideoState
 from app.models.consent import UserConsent, DataExportRequest
 from app.models.user_article_score import UserArticleScore
+from app.models.summary_cache import SummaryCacheEntry
 
 __all__ = [
     "Article",
     "Source",
+    "SourceWatermark",
     "ScrapingRun",
     "Keyword",
     "ArticleKeyword",
     "Trend",
+    "KeywordDailyStat",
     "UserConfig",
     "YouTubeChannel",
     "User",
@@ -31,4 +36,5 @@ __all__ = [
     "UserConsent",
     "DataExportRequest",
     "UserArticleScore",
+    "SummaryCacheEntry",
 ]
@@ -1,5 +1,5 @@
 import json
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, TypeDecorator, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Float, DateTime, Boolean, TypeDecorator, ForeignKey, DDL, event
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -42,6 +42,7 @@ class Article(Base):
     external_id = Column(String(255), nullable=True)
     title = Column(Text, nullable=False)
     url = Column(Text, unique=True, nullable=False)
+    canonical_url = Column(Text, unique=True, index=True, nullable=True)  # Clé de déduplication (app/utils/urls.py)
     content = Column(Text, nullable=True)
     summary = Column(Text, nullable=True)
     author = Column(String(255), nullable=True)
@@ -64,6 +65,9 @@ class Article(Base):
     duration_seconds = Column(Integer, nullable=True)
     view_count = Column(Integer, nullable=True)
     is_video = Column(Boolean, default=False)
+    # Near-duplicate detection (same story from several sources)
+    simhash = Column(BigInteger, nullable=True)  # SimHash titre + contenu (app/utils/simhash.py)
+    duplicate_of_id = Column(Integer, ForeignKey("articles.id", ondelete="SET NULL"), nullable=True, index=True)  # Article canonique
     # Library & Triage fields
     is_bookmarked = Column(Boolean, default=False)
     is_dismissed = Column(Boolean, default=False)
@@ -81,3 +85,30 @@ class Article(Base):
 
     def __repr__(self):
         return f"<Article(id={self.id}, title='{self.title[:50]}...', score={self.score})>"
+
+
+# Full-text search on SQLite (tests): FTS5 index over title/content/author kept
+# in sync by triggers. PostgreSQL uses the generated search_vector column from
+# the migrations instead (see app/services/search.py).
+_SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5("
+    "title, content, author, content='articles', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN "
+    "INSERT INTO articles_fts(rowid, title, content, author) "
+    "VALUES (new.id, new.title, new.content, new.author); END",
+    "CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN "
+    "INSERT INTO articles_fts(articles_fts, rowid, title, content, author) "
+    "VALUES ('delete', old.id, old.title, old.content, old.author); END",
+    "CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE OF title, content, author ON articles BEGIN "
+    "INSERT INTO articles_fts(articles_fts, rowid, title, content, author) "
+    "VALUES ('delete', old.id, old.title, old.content, old.author); "
+    "INSERT INTO articles_fts(rowid, title, content, author) "
+    "VALUES (new.id, new.title, new.content, new.author); END",
+]
+
+for _statement in _SQLITE_FTS_DDL:
+    event.listen(Article.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    Article.__table__, "after_drop",
+    DDL("DROP TABLE IF EXISTS articles_fts").execute_if(dialect="sqlite")
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -19,9 +19,11 @@ class ArticleKeyword(Base):
     article = relationship("Article", back_populates="article_keywords")
     keyword = relationship("Keyword", back_populates="article_keywords")
 
-    # Contrainte unique (article_id, keyword_id)
+    # Contrainte unique (article_id, keyword_id) + index inverse pour "articles du keyword X"
     __table_args__ = (
         UniqueConstraint("article_id", "keyword_id", name="uq_article_keyword"),
+        Index("idx_article_keywords_keyword_article", "keyword_id", "article_id"),
+        Index("idx_article_keywords_created_at", "created_at"),
     )
 
     def __repr__(self):
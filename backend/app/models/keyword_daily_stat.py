@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class KeywordDailyStat(Base):
+    """Agrégats quotidiens par mot-clé (articles publiés ce jour-là), base de detect_trends"""
+
+    __tablename__ = "keyword_daily_stats"
+
+    id = Column(Integer, primary_key=True, index=True)
+    keyword = Column(String(200), nullable=False)
+    date = Column(Date, nullable=False, index=True)  # Jour de publication des articles
+    article_count = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0.0)  # Somme des scores (moyenne = score_sum / article_count)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    # Contrainte unique (keyword, date)
+    __table_args__ = (
+        UniqueConstraint("keyword", "date", name="uq_keyword_daily_stats_keyword_date"),
+    )
+
+    def __repr__(self):
+        return f"<KeywordDailyStat(keyword='{self.keyword}', date={self.date}, count={self.article_count})>"
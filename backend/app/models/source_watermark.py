@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class SourceWatermark(Base):
+    """Position du dernier scraping d'une source (scraping incrémental)"""
+
+    __tablename__ = "source_watermarks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    source_id = Column(Integer, ForeignKey("sources.id", ondelete="CASCADE"), nullable=False, unique=True)
+    last_published_at = Column(DateTime, nullable=True)  # Article le plus récent vu (UTC)
+    last_external_id = Column(String(255), nullable=True)  # Plus grand ID externe vu (sources à IDs croissants)
+    last_full_scrape_at = Column(DateTime, nullable=True)  # Dernier scraping complet (rafraîchit les compteurs)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<SourceWatermark(source_id={self.source_id}, last_published_at={self.last_published_at})>"
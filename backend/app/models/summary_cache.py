@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class SummaryCacheEntry(Base):
+    """Résumé IA mis en cache par hash du contenu normalisé (fallback durable du cache Redis)"""
+
+    __tablename__ = "summary_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    content_hash = Column(String(64), nullable=False, unique=True, index=True)  # sha256(version prompt, modèle, contenu)
+    summary = Column(Text, nullable=False)
+    model = Column(String(100), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<SummaryCacheEntry(content_hash={self.content_hash[:12]}, model={self.model})>"
@@ -13,6 +13,7 @@ class Trend(Base):
     category = Column(String(100), nullable=True, index=True)
     trend_score = Column(Float, default=0.0)  # Score de tendance
     article_count = Column(Integer, default=0)  # Nombre d'articles pour ce keyword
+    article_count_delta = Column(Integer, default=0)  # Articles du jour - articles de la veille
     date = Column(Date, nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
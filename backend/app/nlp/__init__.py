@@ -1,4 +1,5 @@
-from app.nlp.scorer import ArticleScorer
+from app.nlp.scorer import ArticleScorer, get_scorer
 from app.nlp.summarizer import ArticleSummarizer
+from app.nlp.tfidf_model import CorpusTfidfModel
 
-__all__ = ["ArticleScorer", "ArticleSummarizer"]
+__all__ = ["ArticleScorer", "ArticleSummarizer", "CorpusTfidfModel", "get_scorer"]
@@ -3,11 +3,17 @@ Article Scorer - NLP-based relevance scoring
 Combine plusieurs approches pour scorer les articles selon les mots-clés
 """
 
-from typing import List, Dict, Tuple
+import os
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator
 import spacy
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
+from app.config import settings
+from app.nlp.tfidf_model import CorpusTfidfModel, load_tfidf_model
+from app.utils.keyword_matcher import get_matcher
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -22,16 +28,23 @@ DATA_TOOLS = [
     "snowflake", "dbt", "jupyter", "numpy", "matplotlib"
 ]
 
+CLAUDE_MATCHER = get_matcher(CLAUDE_KEYWORDS)
+DATA_TOOLS_MATCHER = get_matcher(DATA_TOOLS)
+
+# Pipeline components the scorer never reads (only tokens and vectors are used)
+UNUSED_PIPES = ["parser", "ner", "lemmatizer"]
+
 
 class ArticleScorer:
     """Score les articles selon les mots-clés avec 3 approches combinées"""
 
-    def __init__(self, language: str = "en"):
+    def __init__(self, language: str = "en", tfidf_model_path: Optional[str] = None):
         """
         Initialize scorer with spaCy model
 
         Args:
             language: Language code ("en" or "fr")
+            tfidf_model_path: Corpus TF-IDF model file (defaults to settings.TFIDF_MODEL_PATH)
         """
         self.language = language
         # Try models in order: lg > md > sm (best quality first)
@@ -43,8 +56,8 @@ class ArticleScorer:
 
         for model_name in model_list:
             try:
-                self.nlp = spacy.load(model_name)
-                logger.info(f"Loaded spaCy model: {model_name}")
+                self.nlp = spacy.load(model_name, disable=UNUSED_PIPES)
+                logger.info(f"Loaded spaCy model: {model_name} (disabled: {UNUSED_PIPES})")
                 break
             except OSError:
                 continue
@@ -58,6 +71,17 @@ class ArticleScorer:
             ngram_range=(1, 2)
         )
 
+        # Keyword embedding cache, rebuilt when the keyword set changes
+        self._keyword_cache_key: Optional[Tuple[str, ...]] = None
+        self._keyword_vectors: Optional[np.ndarray] = None
+        self._keyword_norms: Optional[np.ndarray] = None
+        self._keyword_has_vector: Optional[np.ndarray] = None
+
+        # Corpus TF-IDF model, reloaded when the refresh task rewrites the file
+        self._tfidf_model_path = tfidf_model_path or settings.TFIDF_MODEL_PATH
+        self._tfidf_model: Optional[CorpusTfidfModel] = None
+        self._tfidf_model_mtime: Optional[float] = None
+
     def score_article(self, text: str, keywords: List[Dict]) -> Dict:
         """
         Score un article selon les mots-clés
@@ -79,29 +103,104 @@ class ArticleScorer:
             }
         """
         if not text or not keywords:
-            return {
-                "overall_score": 0.0,
-                "category": "uncategorized",
-                "matched_keywords": [],
-                "scores": {'exact_match': 0.0, 'semantic': 0.0, 'tfidf': 0.0}
-            }
+            return self._empty_result()
+
+        tfidf_model = self._current_tfidf_model()
+        tfidf_score = None
+        if tfidf_model is not None:
+            tfidf_score = self._tfidf_batch_scores(tfidf_model, [text], keywords)[0]
+
+        return self._score_doc(text, self.nlp(text), keywords, tfidf_score)
+
+    def score_batch(
+        self,
+        texts: Iterable[str],
+        keywords: List[Dict],
+        batch_size: int = 64,
+        n_process: int = 1
+    ) -> Iterator[Dict]:
+        """
+        Score many articles by streaming them through nlp.pipe
+
+        Args:
+            texts: Textes des articles (title + content)
+            keywords: Liste de dicts {"keyword": str, "weight": float, "category": str}
+            batch_size: Documents per nlp.pipe batch
+            n_process: Worker processes for nlp.pipe (scales with cores)
+
+        Yields:
+            One result dict per text, in input order, identical to score_article()
+
+        With a corpus TF-IDF model loaded, TF-IDF scores for each batch come
+        from a single sparse matrix product against the keyword matrix.
+        """
+        if not keywords:
+            for _ in texts:
+                yield self._empty_result()
+            return
+
+        # Original text travels as context so empty texts keep their slot
+        docs = self.nlp.pipe(
+            ((text or "", text) for text in texts),
+            as_tuples=True,
+            batch_size=batch_size,
+            n_process=n_process
+        )
+
+        tfidf_model = self._current_tfidf_model()
+
+        while True:
+            batch = list(islice(docs, batch_size))
+            if not batch:
+                return
+
+            tfidf_scores = [None] * len(batch)
+            if tfidf_model is not None:
+                tfidf_scores = self._tfidf_batch_scores(
+                    tfidf_model, [text or "" for _, text in batch], keywords
+                )
 
+            for (doc, text), tfidf_score in zip(batch, tfidf_scores):
+                if not text:
+                    yield self._empty_result()
+                else:
+                    yield self._score_doc(text, doc, keywords, tfidf_score)
+
+    def _empty_result(self) -> Dict:
+        """Result for an empty text or an empty keyword list"""
+        return {
+            "overall_score": 0.0,
+            "category": "uncategorized",
+            "matched_keywords": [],
+            "scores": {'exact_match': 0.0, 'semantic': 0.0, 'tfidf': 0.0}
+        }
+
+    def _score_doc(
+        self,
+        text: str,
+        doc: spacy.tokens.Doc,
+        keywords: List[Dict],
+        tfidf_score: Optional[float] = None
+    ) -> Dict:
+        """Score an already-parsed article (shared by score_article and score_batch)"""
         text_lower = text.lower()
-        doc = self.nlp(text)
 
-        matched_keywords = []
         scores_detail = {'exact_match': 0.0, 'semantic': 0.0, 'tfidf': 0.0}
 
+        # Single pass over the text for every keyword
+        matched = self._match_keywords(text_lower, keywords)
+
         # 1. Exact Match Score (40% weight)
-        exact_score = self._exact_match_score(text_lower, keywords)
+        exact_score = self._exact_match_score(keywords, matched)
         scores_detail["exact_match"] = exact_score
 
         # 2. Semantic Similarity Score (30% weight) - spaCy embeddings
         semantic_score = self._semantic_similarity_score(doc, keywords)
         scores_detail["semantic"] = semantic_score
 
-        # 3. TF-IDF Cosine Similarity Score (30% weight)
-        tfidf_score = self._tfidf_score(text, keywords)
+        # 3. TF-IDF Cosine Similarity Score (30% weight) - precomputed with the corpus model
+        if tfidf_score is None:
+            tfidf_score = self._tfidf_score(text, keywords)
         scores_detail["tfidf"] = tfidf_score
 
         # Overall score: weighted average
@@ -112,16 +211,17 @@ class ArticleScorer:
         )
 
         # Determine category (most relevant keyword category)
-        category = self._determine_category(text_lower, keywords)
+        category = self._determine_category(keywords, matched)
 
         # Identify matched keywords
-        for kw in keywords:
-            if kw["keyword"].lower() in text_lower:
-                matched_keywords.append({
-                    "keyword": kw["keyword"],
-                    "category": kw.get("category", "other"),
-                    "weight": kw.get("weight", 1.0)
-                })
+        matched_keywords = [
+            {
+                "keyword": keywords[i]["keyword"],
+                "category": keywords[i].get("category", "other"),
+                "weight": keywords[i].get("weight", 1.0)
+            }
+            for i in matched
+        ]
 
         # Apply combo multiplier (Claude + Data tools)
         combo_multiplier, combo_reason, matched_data_tools = self._calculate_combo_multiplier(text_lower)
@@ -137,22 +237,29 @@ class ArticleScorer:
             "matched_data_tools": matched_data_tools
         }
 
-    def _exact_match_score(self, text_lower: str, keywords: List[Dict]) -> float:
+    def _match_keywords(self, text_lower: str, keywords: List[Dict]) -> List[int]:
+        """
+        Indices of keywords present in the text, in keyword order
+
+        Returns:
+            Sorted list of indices into keywords
+        """
+        return sorted(get_matcher(kw["keyword"] for kw in keywords).matched_indices(text_lower))
+
+    def _exact_match_score(self, keywords: List[Dict], matched: List[int]) -> float:
         """
         Score based on matched keywords weight sum.
         Uses logarithmic scaling: each match contributes significantly.
 
+        Args:
+            keywords: Keyword dicts
+            matched: Indices of matched keywords (see _match_keywords)
+
         Returns:
             Score 0-100
         """
-        matched_weight = 0.0
-        match_count = 0
-
-        for kw in keywords:
-            if kw["keyword"].lower() in text_lower:
-                weight = kw.get("weight", 1.0)
-                matched_weight += weight
-                match_count += 1
+        matched_weight = sum(keywords[i].get("weight", 1.0) for i in matched)
+        match_count = len(matched)
 
         if match_count == 0:
             return 0.0
@@ -170,34 +277,112 @@ class ArticleScorer:
         """
         Score based on TOP 5 semantic similarities (best matches).
 
+        Keyword vectors come from the cache, so each keyword is parsed once per
+        keyword set rather than once per article.
+
         Returns:
             Score 0-100
         """
         if not doc.has_vector:
             return 0.0
 
-        similarities = []
+        vectors, norms, has_vector = self._get_keyword_vectors(keywords)
+        if not has_vector.any():
+            return 0.0
 
-        for kw in keywords:
-            kw_doc = self.nlp(kw["keyword"])
-            if kw_doc.has_vector:
-                sim = doc.similarity(kw_doc)
-                weight = kw.get("weight", 1.0)
-                similarities.append(sim * weight)
+        # Cosine similarity against every keyword at once (same as Doc.similarity,
+        # which yields 0.0 when either vector is all zeros)
+        doc_norm = doc.vector_norm
+        denominators = norms * doc_norm
+        dots = vectors @ doc.vector
+        sims = np.divide(dots, denominators, out=np.zeros_like(dots), where=denominators != 0)
 
-        if not similarities:
-            return 0.0
+        weights = np.array([kw.get("weight", 1.0) for kw in keywords], dtype=float)
+        similarities = (sims * weights)[has_vector]
 
         # Use TOP 5 similarities instead of average (focus on best matches)
-        top_n = sorted(similarities, reverse=True)[:5]
+        top_n = np.sort(similarities)[::-1][:5]
         avg_top_similarity = np.mean(top_n)
 
         return max(0.0, min(100.0, avg_top_similarity * 100))
 
+    def _get_keyword_vectors(self, keywords: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return cached keyword embeddings, rebuilding them if the keyword set changed
+
+        Returns:
+            Tuple of (vectors K x D, vector norms K, has_vector mask K)
+        """
+        cache_key = tuple(kw["keyword"] for kw in keywords)
+
+        if cache_key != self._keyword_cache_key:
+            kw_docs = list(self.nlp.pipe(cache_key))
+            self._keyword_vectors = np.array(
+                [kw_doc.vector for kw_doc in kw_docs], dtype=np.float32
+            ).reshape(len(kw_docs), -1)
+            self._keyword_norms = np.array(
+                [kw_doc.vector_norm for kw_doc in kw_docs], dtype=np.float32
+            )
+            self._keyword_has_vector = np.array(
+                [kw_doc.has_vector for kw_doc in kw_docs], dtype=bool
+            )
+            self._keyword_cache_key = cache_key
+            logger.info(f"Keyword vector cache rebuilt for {len(cache_key)} keywords")
+
+        return self._keyword_vectors, self._keyword_norms, self._keyword_has_vector
+
+    def _current_tfidf_model(self) -> Optional[CorpusTfidfModel]:
+        """
+        Corpus TF-IDF model, reloaded if the file on disk changed
+
+        Returns:
+            CorpusTfidfModel or None when no model has been fitted yet
+        """
+        try:
+            mtime = os.path.getmtime(self._tfidf_model_path)
+        except OSError:
+            self._tfidf_model = None
+            self._tfidf_model_mtime = None
+            return None
+
+        if mtime != self._tfidf_model_mtime:
+            self._tfidf_model = load_tfidf_model(self._tfidf_model_path)
+            self._tfidf_model_mtime = mtime
+
+        return self._tfidf_model
+
+    def _tfidf_batch_scores(
+        self,
+        model: CorpusTfidfModel,
+        texts: List[str],
+        keywords: List[Dict]
+    ) -> List[float]:
+        """
+        TF-IDF scores for a batch of texts with the corpus model
+
+        Returns:
+            One score 0-100 per text
+        """
+        try:
+            similarities = model.similarities(texts, keywords)
+        except Exception as e:
+            logger.warning(f"Corpus TF-IDF scoring failed: {e}")
+            return [0.0] * len(texts)
+
+        weights = np.array([kw.get("weight", 1.0) for kw in keywords], dtype=float)
+        weighted = similarities * weights
+
+        # Use TOP 5 similarities per article instead of average
+        top_n = -np.sort(-weighted, axis=1)[:, :5]
+        return np.clip(top_n.mean(axis=1) * 100, 0.0, 100.0).tolist()
+
     def _tfidf_score(self, text: str, keywords: List[Dict]) -> float:
         """
         Score based on TOP 5 TF-IDF cosine similarities.
 
+        Fallback used until a corpus model has been fitted (see
+        refresh_tfidf_model): fits on the article and its keywords only.
+
         Returns:
             Score 0-100
         """
@@ -233,20 +418,24 @@ class ArticleScorer:
             logger.warning(f"TF-IDF scoring failed: {e}")
             return 0.0
 
-    def _determine_category(self, text_lower: str, keywords: List[Dict]) -> str:
+    def _determine_category(self, keywords: List[Dict], matched: List[int]) -> str:
         """
         Détermine la catégorie dominante de l'article
 
+        Args:
+            keywords: Keyword dicts
+            matched: Indices of matched keywords (see _match_keywords)
+
         Returns:
             Category string (healthtech, web3, dev, etc.)
         """
         category_scores = {}
 
-        for kw in keywords:
-            if kw["keyword"].lower() in text_lower:
-                category = kw.get("category", "other")
-                weight = kw.get("weight", 1.0)
-                category_scores[category] = category_scores.get(category, 0.0) + weight
+        for i in matched:
+            kw = keywords[i]
+            category = kw.get("category", "other")
+            weight = kw.get("weight", 1.0)
+            category_scores[category] = category_scores.get(category, 0.0) + weight
 
         if not category_scores:
             return "other"
@@ -270,13 +459,13 @@ class ArticleScorer:
             Tuple of (multiplier, reason, matched_data_tools)
         """
         # Check if any Claude keyword is present
-        has_claude = any(kw in text_lower for kw in CLAUDE_KEYWORDS)
+        has_claude = CLAUDE_MATCHER.contains_any(text_lower)
 
         if not has_claude:
             return 1.0, "no combo", []
 
         # Count matched data tools
-        matched_tools = [tool for tool in DATA_TOOLS if tool in text_lower]
+        matched_tools = [DATA_TOOLS[i] for i in sorted(DATA_TOOLS_MATCHER.matched_indices(text_lower))]
         tool_count = len(matched_tools)
 
         if tool_count >= 3:
@@ -287,3 +476,22 @@ class ArticleScorer:
             return 1.3, f"claude + 1 data tool", matched_tools
         else:
             return 1.0, "claude only", []
+
+
+@lru_cache(maxsize=None)
+def get_scorer(language: str = "en") -> ArticleScorer:
+    """
+    Process-wide ArticleScorer for a language
+
+    Loading a spaCy model takes seconds (and hundreds of MB for *_lg), so Celery
+    workers keep one scorer per language for their whole lifetime instead of
+    building one per task run. The keyword vector cache lives on the instance and
+    is rebuilt automatically whenever the active keyword set changes.
+
+    Args:
+        language: Language code ("en" or "fr")
+
+    Returns:
+        Shared ArticleScorer instance
+    """
+    return ArticleScorer(language=language)
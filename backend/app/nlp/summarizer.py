@@ -1,100 +1,168 @@
 """
 Article Summarizer - Claude AI-based summarization
 Génère des résumés concis des articles via l'API Anthropic Claude
+
+Requests go through the async client, with bounded concurrency and the
+account's request / input token / output token budgets shared across
+workers (DistributedRateLimiter). 429 and 529 (overloaded) responses are
+retried with backoff, honouring retry-after. The daily backlog can go
+through the Message Batches API instead (half price, results within 24h).
 """
 
+import asyncio
+import math
+import random
 from typing import Optional
+
 import anthropic
 from app.config import settings
+from app.scrapers.strategies.rate_limit import DistributedRateLimiter
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+PROMPT_VERSION = "1"  # Bump when the prompt changes: invalidates the summary cache
+MAX_CONTENT_LENGTH = 8000  # chars (limite de contexte / coût)
+MIN_CONTENT_LENGTH = 50
+MAX_OUTPUT_TOKENS = 500
+TEMPERATURE = 0.3  # Plus déterministe
+CHARS_PER_TOKEN = 3.5  # Estimation prudente pour du texte FR/EN
+
+RETRYABLE_STATUS = {429, 529}
+MAX_BACKOFF = 60.0  # seconds
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimation du nombre de tokens d'un texte (sans appel API)"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _retry_delay(error: Optional[anthropic.APIStatusError], attempt: int) -> float:
+    """Délai avant la prochaine tentative: retry-after si fourni, sinon backoff exponentiel"""
+    if error is not None:
+        headers = error.response.headers
+        try:
+            if headers.get("retry-after-ms"):
+                return float(headers["retry-after-ms"]) / 1000
+            if headers.get("retry-after"):
+                return float(headers["retry-after"])
+        except ValueError:
+            pass
+    return min(MAX_BACKOFF, 2 ** attempt) * random.uniform(0.5, 1.0)
+
 
 class ArticleSummarizer:
-    """Génère des résumés IA des articles via Claude API"""
+    """
+    Génère des résumés IA des articles via Claude API
 
-    def __init__(self):
+    Args:
+        max_concurrency: Requêtes simultanées max (défaut: SUMMARY_MAX_CONCURRENCY)
+        max_retries: Nouvelles tentatives sur 429/529 (défaut: SUMMARY_MAX_RETRIES)
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None, max_retries: Optional[int] = None):
         """Initialize Claude client"""
         if not settings.ANTHROPIC_API_KEY or settings.ANTHROPIC_API_KEY == "sk-ant-your-api-key-here":
             logger.warning("Anthropic API key not configured - summarization disabled")
             self.client = None
         else:
-            self.client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+            # Retries are handled here so that each attempt goes through the rate limiters
+            self.client = anthropic.AsyncAnthropic(
+                api_key=settings.ANTHROPIC_API_KEY,
+                base_url=settings.ANTHROPIC_BASE_URL,
+                max_retries=0
+            )
             logger.info("Claude AI client initialized")
 
-    async def summarize(
-        self,
-        title: str,
-        content: Optional[str],
-        max_length: int = 200
-    ) -> Optional[str]:
-        """
-        Génère un résumé concis de l'article
+        self.model = settings.SUMMARY_MODEL
+        self.max_retries = settings.SUMMARY_MAX_RETRIES if max_retries is None else max_retries
+        self.semaphore = asyncio.Semaphore(max_concurrency or settings.SUMMARY_MAX_CONCURRENCY)
+        self.request_limiter = DistributedRateLimiter("anthropic:requests", settings.SUMMARY_REQUESTS_PER_MINUTE)
+        self.input_limiter = DistributedRateLimiter("anthropic:input_tokens", settings.SUMMARY_INPUT_TOKENS_PER_MINUTE)
+        self.output_limiter = DistributedRateLimiter("anthropic:output_tokens", settings.SUMMARY_OUTPUT_TOKENS_PER_MINUTE)
 
-        Args:
-            title: Titre de l'article
-            content: Contenu de l'article (peut être None)
-            max_length: Longueur max du résumé en mots
+    def _request_params(self, title: str, content: str, max_length: int) -> dict:
+        """Paramètres de messages.create (partagés par les appels directs et les batches)
 
-        Returns:
-            Résumé généré ou None si erreur/pas de contenu
+        temperature is sent as a raw body field: the 1.x SDK dropped the keyword
+        argument (0.x still had it), the API accepts it either way.
         """
-        if not self.client:
-            logger.debug("Summarization skipped - API key not configured")
-            return None
-
-        if not content or len(content.strip()) < 50:
-            logger.debug(f"Content too short to summarize: {title}")
-            return None
-
-        try:
-            # Truncate content si trop long (limite API Claude)
-            max_content_length = 8000  # chars
-            truncated_content = content[:max_content_length]
-
-            prompt = f"""Résume l'article suivant de manière concise et factuelle en MAXIMUM {max_length} mots.
+        prompt = f"""Résume l'article suivant de manière concise et factuelle en MAXIMUM {max_length} mots.
 Concentre-toi sur les points clés et les informations importantes.
 
 Titre: {title}
 
 Contenu:
-{truncated_content}
+{content[:MAX_CONTENT_LENGTH]}
 
 Résumé (max {max_length} mots):"""
 
-            message = self.client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=500,
-                temperature=0.3,  # Plus déterministe
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
+        return {
+            "model": self.model,
+            "max_tokens": MAX_OUTPUT_TOKENS,
+            "extra_body": {"temperature": TEMPERATURE},
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+
+    def _batch_params(self, title: str, content: str, max_length: int) -> dict:
+        """Paramètres d'une requête de batch (body JSON brut)"""
+        params = self._request_params(title, content, max_length)
+        return {**params.pop("extra_body"), **params}
+
+    def _should_summarize(self, title: str, content: Optional[str]) -> bool:
+        """Vérifie que le client est configuré et que le contenu est suffisant"""
+        if not self.client:
+            logger.debug("Summarization skipped - API key not configured")
+            return False
 
-            summary = message.content[0].text.strip()
+        if not content or len(content.strip()) < MIN_CONTENT_LENGTH:
+            logger.debug(f"Content too short to summarize: {title}")
+            return False
+        return True
 
-            logger.info(f"Generated summary for: {title[:50]}... (length: {len(summary.split())} words)")
-            return summary
+    async def _create_message(self, params: dict) -> anthropic.types.Message:
+        """
+        Appel messages.create avec budgets et retries
 
-        except anthropic.APIError as e:
-            logger.error(f"Claude API error during summarization: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error during summarization: {e}")
-            return None
+        Each attempt reserves one request, the estimated input tokens and
+        max_tokens of output in the shared buckets before being sent.
+        """
+        input_tokens = estimate_tokens(params["messages"][0]["content"])
+        attempt = 0
+        while True:
+            await self.request_limiter.acquire()
+            await self.input_limiter.acquire(input_tokens)
+            await self.output_limiter.acquire(params["max_tokens"])
+
+            try:
+                return await self.client.messages.create(**params)
+            except anthropic.APIStatusError as e:
+                if e.status_code not in RETRYABLE_STATUS or attempt >= self.max_retries:
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(f"Claude API returned {e.status_code}, retrying in {delay:.1f}s")
+            except anthropic.APIConnectionError as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = _retry_delay(None, attempt)
+                logger.warning(f"Claude API connection error ({e}), retrying in {delay:.1f}s")
+
+            attempt += 1
+            await asyncio.sleep(delay)
 
-    def summarize_sync(
+    async def summarize(
         self,
         title: str,
         content: Optional[str],
         max_length: int = 200
     ) -> Optional[str]:
         """
-        Génère un résumé concis de l'article (version synchrone pour Celery)
+        Génère un résumé concis de l'article
 
         Args:
             title: Titre de l'article
@@ -104,41 +172,12 @@ Résumé (max {max_length} mots):"""
         Returns:
             Résumé généré ou None si erreur/pas de contenu
         """
-        if not self.client:
-            logger.debug("Summarization skipped - API key not configured")
-            return None
-
-        if not content or len(content.strip()) < 50:
-            logger.debug(f"Content too short to summarize: {title}")
+        if not self._should_summarize(title, content):
             return None
 
         try:
-            # Truncate content si trop long (limite API Claude)
-            max_content_length = 8000  # chars
-            truncated_content = content[:max_content_length]
-
-            prompt = f"""Résume l'article suivant de manière concise et factuelle en MAXIMUM {max_length} mots.
-Concentre-toi sur les points clés et les informations importantes.
-
-Titre: {title}
-
-Contenu:
-{truncated_content}
-
-Résumé (max {max_length} mots):"""
-
-            # Synchronous call - Anthropic SDK is synchronous
-            message = self.client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=500,
-                temperature=0.3,  # Plus déterministe
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
+            async with self.semaphore:
+                message = await self._create_message(self._request_params(title, content, max_length))
 
             summary = message.content[0].text.strip()
 
@@ -158,7 +197,7 @@ Résumé (max {max_length} mots):"""
         max_length: int = 200
     ) -> dict[str, Optional[str]]:
         """
-        Génère des résumés pour plusieurs articles
+        Génère des résumés pour plusieurs articles (en parallèle, concurrence bornée)
 
         Args:
             articles: Liste de dicts {"id": str, "title": str, "content": str}
@@ -167,18 +206,68 @@ Résumé (max {max_length} mots):"""
         Returns:
             Dict {article_id: summary}
         """
-        summaries = {}
+        articles = [article for article in articles if article.get("id")]
+        results = await asyncio.gather(*[
+            self.summarize(article.get("title", ""), article.get("content"), max_length)
+            for article in articles
+        ])
+        summaries = {article["id"]: summary for article, summary in zip(articles, results)}
+
+        generated = sum(1 for summary in results if summary)
+        logger.info(f"Batch summarization complete: {generated}/{len(summaries)} summaries generated")
+        return summaries
+
+    async def submit_batch(
+        self,
+        articles: list[dict],
+        max_length: int = 200
+    ) -> Optional[str]:
+        """
+        Soumet les articles à l'API Message Batches
+
+        Args:
+            articles: Liste de dicts {"id": str, "title": str, "content": str}
+            max_length: Longueur max par résumé
 
-        for article in articles:
-            article_id = article.get("id")
-            title = article.get("title", "")
-            content = article.get("content")
+        Returns:
+            ID du batch, ou None si rien à soumettre
+        """
+        requests = [
+            {
+                "custom_id": str(article["id"]),
+                "params": self._batch_params(article.get("title", ""), article["content"], max_length)
+            }
+            for article in articles
+            if article.get("id") and self._should_summarize(article.get("title", ""), article.get("content"))
+        ]
+        if not requests:
+            return None
 
-            if not article_id:
-                continue
+        batch = await self.client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted summary batch {batch.id} ({len(requests)} articles)")
+        return batch.id
 
-            summary = await self.summarize(title, content, max_length)
-            summaries[article_id] = summary
+    async def fetch_batch_results(self, batch_id: str) -> Optional[dict[str, Optional[str]]]:
+        """
+        Récupère les résumés d'un batch terminé
+
+        Args:
+            batch_id: ID retourné par submit_batch
 
-        logger.info(f"Batch summarization complete: {len(summaries)} summaries generated")
+        Returns:
+            Dict {custom_id: summary ou None si échec}, ou None si le batch est encore en cours
+        """
+        batch = await self.client.messages.batches.retrieve(batch_id)
+        if batch.processing_status != "ended":
+            return None
+
+        summaries = {}
+        async for entry in await self.client.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                summaries[entry.custom_id] = entry.result.message.content[0].text.strip()
+            else:
+                logger.warning(f"Summary batch {batch_id}: request {entry.custom_id} {entry.result.type}")
+                summaries[entry.custom_id] = None
+
+        logger.info(f"Summary batch {batch_id} ended: {sum(1 for s in summaries.values() if s)} summaries")
         return summaries
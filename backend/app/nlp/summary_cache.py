@@ -0,0 +1,190 @@
+"""
+Summary cache keyed by normalized content hash
+
+Syndicated posts (the same article on Medium, Dev.to and Reddit) and
+re-scraped updates carry the same text: their summary is looked up here
+before calling Claude. Keys combine the prompt version, the model, the
+summary length and the normalized content, so changing any of them
+misses the cache. Entries live in Redis (TTL) and in the summary_cache
+table, which refills Redis after an eviction or a flush.
+"""
+
+import hashlib
+import html
+import re
+import unicodedata
+from typing import Dict, Iterable, Optional
+
+import redis
+from redis.exceptions import RedisError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.summary_cache import SummaryCacheEntry
+from app.nlp.summarizer import MAX_CONTENT_LENGTH, PROMPT_VERSION
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "summary:cache"
+STATS_KEY = f"{KEY_PREFIX}:stats"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_content(content: str) -> str:
+    """Texte comparable entre syndications: sans HTML, casse ni variations d'espaces"""
+    text = _TAG_RE.sub(" ", content[:MAX_CONTENT_LENGTH])
+    text = unicodedata.normalize("NFKC", html.unescape(text)).casefold()
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def summary_cache_key(content: str, model: str, max_length: int = 200) -> str:
+    """
+    Clé de cache d'un résumé
+
+    Args:
+        content: Contenu de l'article
+        model: Modèle Claude utilisé
+        max_length: Longueur max du résumé en mots
+
+    Returns:
+        sha256 hex (64 chars)
+    """
+    raw = f"{PROMPT_VERSION}\x00{model}\x00{max_length}\x00{normalize_content(content)}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+_client: Optional[redis.Redis] = None
+
+
+def _redis_client() -> redis.Redis:
+    """Client partagé par les instances (un seul pool de connexions par process)"""
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=1,
+            socket_timeout=1
+        )
+    return _client
+
+
+class SummaryCache:
+    """
+    Cache de résumés à deux niveaux (Redis puis table summary_cache)
+
+    Redis errors are logged and the cache keeps working from the database.
+
+    Args:
+        db: Session SQLAlchemy (set_many n'effectue pas de commit)
+        redis_client: Client Redis sync (défaut: REDIS_URL)
+    """
+
+    def __init__(self, db: Session, redis_client: Optional[redis.Redis] = None):
+        self.db = db
+        self.redis = redis_client if redis_client is not None else _redis_client()
+        self.ttl = settings.SUMMARY_CACHE_TTL
+
+    def _redis_failed(self, error: Exception) -> None:
+        logger.warning(f"Summary cache Redis unavailable ({error}), using database only")
+        self.redis = None
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Récupère les résumés en cache
+
+        Args:
+            keys: Clés (summary_cache_key)
+
+        Returns:
+            Dict {key: summary} pour les clés trouvées
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, str] = {}
+
+        if self.redis is not None and keys:
+            try:
+                values = self.redis.mget([f"{KEY_PREFIX}:{key}" for key in keys])
+                found = {key: value for key, value in zip(keys, values) if value is not None}
+            except (RedisError, OSError) as e:
+                self._redis_failed(e)
+
+        missing = [key for key in keys if key not in found]
+        if missing:
+            rows = self.db.query(SummaryCacheEntry.content_hash, SummaryCacheEntry.summary).filter(
+                SummaryCacheEntry.content_hash.in_(missing)
+            ).all()
+            from_db = {content_hash: summary for content_hash, summary in rows}
+            if from_db:
+                self._set_redis(from_db)
+            found.update(from_db)
+
+        return found
+
+    def set_many(self, summaries: Dict[str, str], model: str) -> None:
+        """
+        Met en cache des résumés (Redis + table, sans commit)
+
+        Args:
+            summaries: Dict {key: summary}
+            model: Modèle Claude qui les a générés
+        """
+        summaries = {key: summary for key, summary in summaries.items() if summary}
+        if not summaries:
+            return
+
+        existing = {
+            content_hash for (content_hash,) in self.db.query(SummaryCacheEntry.content_hash).filter(
+                SummaryCacheEntry.content_hash.in_(list(summaries))
+            )
+        }
+        self.db.add_all([
+            SummaryCacheEntry(content_hash=key, summary=summary, model=model)
+            for key, summary in summaries.items()
+            if key not in existing
+        ])
+        self._set_redis(summaries)
+
+    def _set_redis(self, summaries: Dict[str, str]) -> None:
+        if self.redis is None:
+            return
+        try:
+            with self.redis.pipeline(transaction=False) as pipe:
+                for key, summary in summaries.items():
+                    pipe.setex(f"{KEY_PREFIX}:{key}", self.ttl, summary)
+                pipe.execute()
+        except (RedisError, OSError) as e:
+            self._redis_failed(e)
+
+    def record(self, hits: int, misses: int) -> None:
+        """Ajoute aux compteurs de hits/misses (cumulés dans Redis)"""
+        if self.redis is None or not (hits or misses):
+            return
+        try:
+            with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hincrby(STATS_KEY, "hits", hits)
+                pipe.hincrby(STATS_KEY, "misses", misses)
+                pipe.execute()
+        except (RedisError, OSError) as e:
+            self._redis_failed(e)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Compteurs cumulés du cache
+
+        Returns:
+            Dict {"hits", "misses", "hit_rate"}
+        """
+        counters = {}
+        if self.redis is not None:
+            try:
+                counters = self.redis.hgetall(STATS_KEY)
+            except (RedisError, OSError) as e:
+                self._redis_failed(e)
+
+        hits, misses = int(counters.get("hits", 0)), int(counters.get("misses", 0))
+        total = hits + misses
+        return {"hits": hits, "misses": misses, "hit_rate": round(hits / total, 3) if total else 0.0}
@@ -0,0 +1,178 @@
+"""
+Corpus TF-IDF model - IDF weights learned from the stored article corpus
+
+Fitted once on the Article table, persisted to disk and reloaded by workers,
+so scoring is a sparse transform + one keyword matrix product per batch.
+"""
+
+import os
+import tempfile
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import joblib
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.preprocessing import normalize
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CorpusTfidfModel:
+    """
+    TF-IDF with a fixed vocabulary and updatable document frequencies
+
+    The vocabulary is chosen by a full fit; partial_fit() only folds new
+    documents into the document frequencies (new terms wait for the next
+    full fit). Weighting matches sklearn's TfidfVectorizer defaults
+    (raw tf, smooth idf, l2 norm).
+    """
+
+    def __init__(
+        self,
+        vectorizer: CountVectorizer,
+        doc_freq: np.ndarray,
+        n_docs: int,
+        last_article_id: int = 0,
+        fitted_at: Optional[datetime] = None
+    ):
+        self.vectorizer = vectorizer
+        self.doc_freq = doc_freq.astype(np.int64)
+        self.n_docs = n_docs
+        self.last_article_id = last_article_id
+        self.fitted_at = fitted_at or datetime.now(timezone.utc)
+        self._idf = self._compute_idf()
+        self._keyword_cache_key: Optional[Tuple[str, ...]] = None
+        self._keyword_matrix: Optional[sparse.csr_matrix] = None
+
+    @classmethod
+    def fit(
+        cls,
+        texts: Iterable[str],
+        last_article_id: int = 0,
+        language: str = "en",
+        max_features: int = 20000
+    ) -> "CorpusTfidfModel":
+        """
+        Fit vocabulary and document frequencies on a corpus
+
+        Args:
+            texts: Article texts (title + content)
+            last_article_id: Highest Article.id included in the corpus
+            language: Language code ("en" enables English stop words)
+            max_features: Vocabulary size cap
+
+        Returns:
+            Fitted CorpusTfidfModel
+        """
+        vectorizer = CountVectorizer(
+            max_features=max_features,
+            stop_words='english' if language == "en" else None,
+            ngram_range=(1, 2)
+        )
+        counts = vectorizer.fit_transform(texts)
+        doc_freq = np.bincount(counts.indices, minlength=counts.shape[1])
+        return cls(vectorizer, doc_freq, counts.shape[0], last_article_id)
+
+    def partial_fit(self, texts: Iterable[str], last_article_id: int) -> int:
+        """
+        Fold new documents into the document frequencies
+
+        Args:
+            texts: Texts of articles added since the last fit
+            last_article_id: Highest Article.id now included
+
+        Returns:
+            Number of documents added
+        """
+        counts = self.vectorizer.transform(texts)
+        if counts.shape[0]:
+            # CSR indices hold each (doc, term) pair once
+            self.doc_freq += np.bincount(counts.indices, minlength=counts.shape[1])
+            self.n_docs += counts.shape[0]
+            self._idf = self._compute_idf()
+            self._keyword_cache_key = None
+        self.last_article_id = max(self.last_article_id, last_article_id)
+        return counts.shape[0]
+
+    def _compute_idf(self) -> np.ndarray:
+        return np.log((1 + self.n_docs) / (1 + self.doc_freq)) + 1
+
+    def transform(self, texts: Iterable[str]) -> sparse.csr_matrix:
+        """L2-normalized TF-IDF rows (N x vocabulary)"""
+        counts = self.vectorizer.transform(texts)
+        return normalize(counts @ sparse.diags(self._idf), norm='l2', copy=False)
+
+    def _keyword_rows(self, keywords: List[Dict]) -> sparse.csr_matrix:
+        """Keyword TF-IDF rows, cached per keyword set"""
+        cache_key = tuple(kw["keyword"] for kw in keywords)
+        if cache_key != self._keyword_cache_key:
+            self._keyword_matrix = self.transform(cache_key)
+            self._keyword_cache_key = cache_key
+        return self._keyword_matrix
+
+    def similarities(self, texts: List[str], keywords: List[Dict]) -> np.ndarray:
+        """
+        Cosine similarity of every text against every keyword
+
+        Returns:
+            Dense array of shape (len(texts), len(keywords))
+        """
+        if not texts or not keywords:
+            return np.zeros((len(texts), len(keywords)))
+        product = self.transform(texts) @ self._keyword_rows(keywords).T
+        return product.toarray()
+
+    def save(self, path: str) -> None:
+        """Persist atomically (workers may be reading the previous file)"""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            joblib.dump({
+                "vectorizer": self.vectorizer,
+                "doc_freq": self.doc_freq,
+                "n_docs": self.n_docs,
+                "last_article_id": self.last_article_id,
+                "fitted_at": self.fitted_at,
+            }, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "CorpusTfidfModel":
+        data = joblib.load(path)
+        return cls(
+            data["vectorizer"],
+            data["doc_freq"],
+            data["n_docs"],
+            data["last_article_id"],
+            data["fitted_at"]
+        )
+
+
+def load_tfidf_model(path: str) -> Optional[CorpusTfidfModel]:
+    """
+    Load a persisted model, or None if missing/unreadable
+
+    Args:
+        path: Model file path
+
+    Returns:
+        CorpusTfidfModel or None
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        model = CorpusTfidfModel.load(path)
+        logger.info(f"Loaded TF-IDF model from {path} ({model.n_docs} docs)")
+        return model
+    except Exception as e:
+        logger.warning(f"Could not load TF-IDF model from {path}: {e}")
+        return None
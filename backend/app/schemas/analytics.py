@@ -10,6 +10,7 @@ class TrendResponse(BaseModel):
     category: Optional[str]
     trend_score: float
     article_count: int
+    article_count_delta: Optional[int] = None
     date: date
     created_at: datetime
 
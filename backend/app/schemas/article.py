@@ -52,6 +52,7 @@ class ArticleResponse(ArticleCreate):
     is_bookmarked: bool = False
     is_dismissed: bool = False
     bookmarked_at: Optional[datetime] = None
+    search_snippet: Optional[str] = None  # Highlighted excerpt when searching
     created_at: datetime
     updated_at: datetime
 
@@ -95,6 +96,7 @@ class VideoResponse(BaseModel):
     dislikes: int = 0
     user_reaction: Optional[str] = None
     source_type: Optional[str] = None
+    search_snippet: Optional[str] = None  # Highlighted excerpt when searching
     created_at: datetime
     updated_at: datetime
 
@@ -117,15 +119,17 @@ class VideoResponse(BaseModel):
 
 class PaginatedArticlesResponse(BaseModel):
     data: List[ArticleResponse]
-    total: int
+    total: Optional[int] = None  # Not computed in cursor mode
     hasMore: bool
     offset: int
     limit: int
+    nextCursor: Optional[str] = None
 
 
 class PaginatedVideosResponse(BaseModel):
     data: List[VideoResponse]
-    total: int
+    total: Optional[int] = None  # Not computed in cursor mode
     hasMore: bool
     offset: int
     limit: int
+    nextCursor: Optional[str] = None
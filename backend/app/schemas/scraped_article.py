@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, HttpUrl, Field, field_validator
+from pydantic import BaseModel, HttpUrl, Field, computed_field, field_validator
+
+from app.utils.urls import canonicalize_url
 
 
 class ScrapedArticle(BaseModel):
@@ -30,6 +32,12 @@ class ScrapedArticle(BaseModel):
     # Source-specific data (stored as JSON in DB)
     raw_data: dict = Field(default_factory=dict)
 
+    @computed_field
+    @property
+    def canonical_url(self) -> str:
+        """URL canonique (clé de déduplication, voir app/utils/urls.py)"""
+        return canonicalize_url(str(self.url))
+
     @field_validator('tags')
     @classmethod
     def limit_tags(cls, v: List[str]) -> List[str]:
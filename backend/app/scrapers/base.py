@@ -1,14 +1,26 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import AsyncIterator, List, Dict, Optional, Sequence, Tuple, Union
 import asyncio
+import feedparser
 import httpx
 import hashlib
 import json
 import random
+import uuid
 from redis.asyncio import Redis
 from app.schemas.scraped_article import ScrapedArticle
+from app.scrapers.http_client import http_clients
+from app.scrapers.watermarks import ScrapeWatermark, to_utc_naive
+from app.utils.keyword_matcher import get_matcher
 from app.utils.logger import get_logger
 
+# feedparser is pure Python and CPU-bound: parse off the event loop,
+# in a small pool shared by every plugin
+_FEED_PARSE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="feedparse")
+
 
 class ScraperPlugin(ABC):
     """
@@ -18,10 +30,17 @@ class ScraperPlugin(ABC):
     - scrape(): Main scraping logic
     - validate_config(): Config validation
 
+    Subclasses may override:
+    - iter_articles(): Yield articles as they are fetched (defaults to scrape())
+
     Features:
     - Automatic retries with exponential backoff + jitter
-    - Redis caching with configurable TTL
-    - Shared HTTP client with proper lifecycle
+    - Redis caching with configurable TTL (streamed in and out in chunks)
+    - Shared pooled HTTP client borrowed from http_clients (per-host limits)
+    - Concurrent RSS/Atom fetching (_fetch_feeds)
+    - Conditional GET (ETag / Last-Modified) with validators kept in Redis,
+      stored once the run is saved (commit_validators)
+    - Incremental runs: only items newer than the source watermark
     - Best-effort error handling
     """
 
@@ -34,11 +53,22 @@ class ScraperPlugin(ABC):
     MAX_RETRIES: int = 3
     CACHE_TTL: int = 3600  # 1 hour
     TIMEOUT: float = 30.0
+    FEED_CONCURRENCY: int = 10  # Max feeds fetched at once
+    VALIDATORS_TTL: int = 7 * 86400  # Conditional GET validators kept 7 days
+    INCREMENTAL: bool = False  # Chronological sources: scrape from the watermark between full refreshes
+    WATERMARK_OVERLAP: timedelta = timedelta(hours=1)  # Late-indexed items still picked up
+    CACHE_CHUNK_SIZE: int = 100  # Articles per Redis round trip when streaming the cache
 
     def __init__(self, redis_client: Optional[Redis] = None):
         self.client: Optional[httpx.AsyncClient] = None
         self.redis = redis_client
         self.logger = get_logger(self.__class__.__name__)
+        # Set by the scraping task on incremental runs (None = full scrape)
+        self.watermark: Optional[ScrapeWatermark] = None
+        # Conditional GET validators are per keywords + config (set by iter_with_cache)
+        self.validators_scope: str = ""
+        # Validators of this run's 200 responses, stored by commit_validators()
+        self._pending_validators: Dict[str, Dict[str, str]] = {}
 
     @abstractmethod
     async def scrape(self, config: Dict, keywords: List[str]) -> List[ScrapedArticle]:
@@ -67,37 +97,81 @@ class ScraperPlugin(ABC):
         """
         pass
 
-    async def scrape_with_cache(
+    async def iter_articles(
         self,
         config: Dict,
         keywords: List[str]
-    ) -> List[ScrapedArticle]:
+    ) -> AsyncIterator[ScrapedArticle]:
         """
-        Scrape with Redis caching
+        Stream articles from source
 
-        Checks cache first, falls back to scraping if cache miss
+        The default yields the result of scrape(). Plugins fetching several
+        independent feeds or pages override it to yield articles as each
+        one arrives (and implement scrape() on top of it), so callers can
+        store the first articles before the whole source is read.
+
+        Args:
+            config: Source-specific configuration from database
+            keywords: List of keywords for filtering
+
+        Yields:
+            Validated ScrapedArticle objects
+        """
+        for article in await self.scrape(config, keywords):
+            yield article
+
+    async def iter_with_cache(
+        self,
+        config: Dict,
+        keywords: List[str]
+    ) -> AsyncIterator[ScrapedArticle]:
+        """
+        Stream articles with Redis caching
+
+        A cache hit is read back CACHE_CHUNK_SIZE articles at a time. On a
+        miss, articles from iter_articles() are yielded as they arrive and
+        appended to a temporary list, renamed to the cache key once the
+        source is exhausted: an interrupted run never leaves a partial
+        cache entry behind.
         """
         cache_key = self._make_cache_key(keywords, config)
 
-        # Try cache first
-        cached_data = await self._get_cached(cache_key)
-        if cached_data:
-            return [ScrapedArticle(**item) for item in cached_data]
+        cached = False
+        async for chunk in self._iter_cached(cache_key):
+            cached = True
+            for item in chunk:
+                yield ScrapedArticle(**item)
+        if cached:
+            return
 
         # Cache miss - scrape fresh data
         self.logger.info(f"Cache miss for {cache_key}, fetching fresh data")
-        articles = await self.scrape(config, keywords)
+        self.validators_scope = self._params_hash(keywords, config)
+        self._pending_validators = {}
+        writer = _CacheWriter(self, cache_key)
+        async for article in self.iter_articles(config, keywords):
+            await writer.add(article)
+            yield article
+        await writer.commit()
 
-        # Cache the results
-        article_dicts = [article.model_dump(mode='json') for article in articles]
-        await self._set_cached(cache_key, article_dicts)
+    async def scrape_with_cache(
+        self,
+        config: Dict,
+        keywords: List[str]
+    ) -> List[ScrapedArticle]:
+        """
+        Scrape with Redis caching
 
-        return articles
+        Checks cache first, falls back to scraping if cache miss
+        (list form of iter_with_cache)
+        """
+        return [article async for article in self.iter_with_cache(config, keywords)]
 
     async def _retry_request(
         self,
         method: str,
         url: str,
+        conditional: bool = False,
         **kwargs
     ) -> httpx.Response:
         """
@@ -108,16 +182,44 @@ class ScraperPlugin(ABC):
         - 500/502/503/504 (server errors): Retry with backoff
         - 4xx (client errors): No retry, fail immediately
         - Network errors: Retry with backoff
+
+        With conditional=True (GET only, needs Redis), the ETag and
+        Last-Modified of the previous 200 for this URL are sent as
+        If-None-Match / If-Modified-Since. A 304 is returned as-is:
+        callers check `response.status_code == 304` and skip parsing.
+        Validators of a 200 are only stored by commit_validators(), once
+        the run's articles are saved: a failed run fetches the feed again.
         """
         last_exception = None
+        kwargs.setdefault('timeout', self.TIMEOUT)
+        conditional = conditional and method.upper() == 'GET' and self.redis is not None
+
+        if conditional:
+            # Validators are per full URL: the same endpoint with other params is another resource
+            url_key = str(httpx.URL(url, params=kwargs.get('params')))
+            validators = await self._get_validators(url_key)
+            if validators:
+                headers = dict(kwargs.pop('headers', None) or {})
+                if validators.get('etag'):
+                    headers['If-None-Match'] = validators['etag']
+                if validators.get('last_modified'):
+                    headers['If-Modified-Since'] = validators['last_modified']
+                kwargs['headers'] = headers
 
         for attempt in range(self.MAX_RETRIES):
             try:
-                response = await self.client.request(method, url, **kwargs)
+                async with http_clients.host_slot(url):
+                    response = await self.client.request(method, url, **kwargs)
+
+                if response.status_code == 304 and conditional:
+                    self.logger.debug(f"Not modified: {url}")
+                    return response
 
                 # Success or client error (don't retry 4xx except 429)
                 if response.status_code < 500 and response.status_code != 429:
                     response.raise_for_status()
+                    if conditional:
+                        self._remember_validators(url_key, response)
                     return response
 
                 # Server error or rate limit - retry
@@ -144,6 +246,114 @@ class ScraperPlugin(ABC):
         # All retries exhausted
         raise last_exception or httpx.HTTPError(f"Failed after {self.MAX_RETRIES} attempts")
 
+    async def _parse_feed(
+        self,
+        content: bytes,
+        headers: Optional[Dict[str, str]] = None
+    ) -> feedparser.FeedParserDict:
+        """
+        Parse a feed document in the parse thread pool
+
+        Args:
+            content: Raw feed body
+            headers: Response headers (content-type drives encoding detection)
+
+        Returns:
+            feedparser result
+        """
+        loop = asyncio.get_running_loop()
+        response_headers = dict(headers or {})
+        return await loop.run_in_executor(
+            _FEED_PARSE_POOL,
+            lambda: feedparser.parse(content, response_headers=response_headers)
+        )
+
+    async def _get_feed(self, url: str) -> Optional[feedparser.FeedParserDict]:
+        """
+        Download a feed with the shared client (retries, timeout) and parse it
+
+        Args:
+            url: Feed URL
+
+        Returns:
+            feedparser result, or None if the feed is unchanged since the
+            previous fetch (304)
+        """
+        response = await self._retry_request('GET', url, conditional=True)
+        if response.status_code == 304:
+            return None
+        return await self._parse_feed(response.content, response.headers)
+
+    async def _iter_feeds(
+        self,
+        urls: Sequence[str]
+    ) -> AsyncIterator[Tuple[int, Union[feedparser.FeedParserDict, Exception, None]]]:
+        """
+        Fetch and parse many feeds concurrently, yielding each as it completes
+
+        At most FEED_CONCURRENCY downloads are in flight. A failing feed
+        does not abort the others: its result is the exception instead.
+        Unchanged feeds (304) are not parsed: their result is None.
+        Downloads still pending when the consumer stops are cancelled.
+
+        Args:
+            urls: Feed URLs
+
+        Yields:
+            (index in urls, feedparser result / None / exception), in completion order
+        """
+        if self.client is None:
+            # Called outside `async with scraper`: open a client for this batch
+            async with self:
+                async for result in self._iter_feeds(urls):
+                    yield result
+            return
+
+        semaphore = asyncio.Semaphore(self.FEED_CONCURRENCY)
+
+        async def fetch(index: int, url: str):
+            async with semaphore:
+                try:
+                    return index, await self._get_feed(url)
+                except Exception as e:
+                    return index, e
+
+        tasks = [asyncio.ensure_future(fetch(index, url)) for index, url in enumerate(urls)]
+        unchanged = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result = await next_done
+                if result is None:
+                    unchanged += 1
+                yield index, result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if unchanged:
+            self.logger.info(f"{unchanged}/{len(urls)} feeds unchanged since last fetch")
+
+    async def _fetch_feeds(
+        self,
+        urls: Sequence[str]
+    ) -> List[Union[feedparser.FeedParserDict, Exception, None]]:
+        """
+        Fetch and parse many feeds concurrently
+
+        List form of _iter_feeds(): one feedparser result, None (unchanged)
+        or exception per URL, in order.
+
+        Args:
+            urls: Feed URLs
+
+        Returns:
+            One feedparser result, None or exception per URL, in order
+        """
+        results: List[Union[feedparser.FeedParserDict, Exception, None]] = [None] * len(urls)
+        async for index, result in self._iter_feeds(urls):
+            results[index] = result
+        return results
+
     def _calculate_backoff(self, attempt: int, status_code: Optional[int] = None) -> float:
         """
         Exponential backoff with jitter
@@ -163,47 +373,149 @@ class ScraperPlugin(ABC):
 
         return base_delay * jitter
 
-    async def _get_cached(self, cache_key: str) -> Optional[List[dict]]:
-        """Get cached scraper results from Redis"""
+    async def _iter_cached(self, cache_key: str) -> AsyncIterator[List[dict]]:
+        """Read cached scraper results from Redis, CACHE_CHUNK_SIZE at a time"""
         if not self.redis:
-            return None
+            return
 
-        try:
-            cached = await self.redis.get(cache_key)
-            if cached:
+        start = 0
+        while True:
+            try:
+                chunk = await self.redis.lrange(cache_key, start, start + self.CACHE_CHUNK_SIZE - 1)
+            except Exception as e:
+                # Includes entries written in another format (WRONGTYPE): treated as a miss
+                if start == 0:
+                    self.logger.warning(f"Cache read error: {e}")
+                    return
+                raise
+            if not chunk:
+                return
+            if start == 0:
                 self.logger.info(f"Cache hit for {cache_key}")
-                return json.loads(cached)
+            yield [json.loads(item) for item in chunk]
+            if len(chunk) < self.CACHE_CHUNK_SIZE:
+                return
+            start += self.CACHE_CHUNK_SIZE
+
+    def _validators_key(self, url: str) -> str:
+        """Redis key of the conditional GET validators for a URL (within validators_scope)"""
+        digest = hashlib.sha1(f"{self.validators_scope}\x00{url}".encode()).hexdigest()
+        return f"scraper:validators:{digest}"
+
+    async def _get_validators(self, url: str) -> Dict[str, str]:
+        """Get the ETag / Last-Modified stored for a URL"""
+        try:
+            validators = await self.redis.hgetall(self._validators_key(url))
         except Exception as e:
-            self.logger.warning(f"Cache read error: {e}")
-
-        return None
+            self.logger.warning(f"Validators read error: {e}")
+            return {}
+
+        return {
+            (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+            for k, v in validators.items()
+        }
+
+    def _remember_validators(self, url: str, response: httpx.Response) -> None:
+        """Keep the ETag / Last-Modified of a 200 response until commit_validators()"""
+        validators = {
+            field: response.headers[header]
+            for field, header in (('etag', 'etag'), ('last_modified', 'last-modified'))
+            if response.headers.get(header)
+        }
+        if validators:
+            self._pending_validators[url] = validators
+        else:
+            self._pending_validators.pop(url, None)
+
+    async def commit_validators(self) -> None:
+        """
+        Store the validators of this run's 200 responses
 
-    async def _set_cached(self, cache_key: str, data: List[dict]) -> None:
-        """Store scraper results in Redis with TTL"""
-        if not self.redis:
+        Called once the articles of the run are saved. Until then a 304
+        would skip items that never reached the database.
+        """
+        pending, self._pending_validators = self._pending_validators, {}
+        if not pending or self.redis is None:
             return
 
         try:
-            await self.redis.setex(
-                cache_key,
-                self.CACHE_TTL,
-                json.dumps(data, default=str)  # default=str handles datetime
-            )
-            self.logger.info(f"Cached {len(data)} articles for {self.CACHE_TTL}s")
+            async with self.redis.pipeline(transaction=True) as pipe:
+                for url, validators in pending.items():
+                    key = self._validators_key(url)
+                    pipe.delete(key)
+                    pipe.hset(key, mapping=validators)
+                    pipe.expire(key, self.VALIDATORS_TTL)
+                await pipe.execute()
         except Exception as e:
-            self.logger.warning(f"Cache write error: {e}")
+            self.logger.warning(f"Validators write error: {e}")
+
+    def _since(self) -> Optional[datetime]:
+        """
+        Oldest publication time to fetch on this run
+
+        Returns:
+            Watermark minus WATERMARK_OVERLAP (naive UTC), or None on full runs
+        """
+        if self.watermark is None or self.watermark.published_at is None:
+            return None
+        return self.watermark.published_at - self.WATERMARK_OVERLAP
+
+    def filter_new(self, articles: List[ScrapedArticle]) -> List[ScrapedArticle]:
+        """
+        Drop articles published before the watermark (no-op on full runs)
+
+        Plugins that can narrow their requests with _since() do so; this
+        catches the rest so unchanged items are not rewritten.
+        """
+        since = self._since()
+        if since is None:
+            return articles
+        return [a for a in articles if to_utc_naive(a.published_at) >= since]
+
+    def next_watermark(
+        self,
+        articles: List[ScrapedArticle],
+        previous: Optional[ScrapeWatermark] = None
+    ) -> ScrapeWatermark:
+        """
+        Watermark after a run (never moves backwards)
+
+        Override to track more than the newest published_at (e.g. IDs).
+
+        Args:
+            articles: Articles returned by the run
+            previous: Stored watermark
+
+        Returns:
+            New watermark
+        """
+        previous = previous or ScrapeWatermark()
+        seen = [to_utc_naive(a.published_at) for a in articles if a.published_at]
+        if previous.published_at:
+            seen.append(previous.published_at)
+        return replace(previous, published_at=max(seen, default=None))
 
     def _make_cache_key(self, keywords: List[str], config: Dict) -> str:
         """
         Generate unique cache key based on scraper and params
 
-        Format: scraper:{name}:{hash(keywords+config)}
+        Format: scraper:{name}:{hash(keywords+config[+watermark])}
         """
-        params = f"{sorted(keywords)}:{sorted(config.items())}"
-        params_hash = hashlib.md5(params.encode()).hexdigest()[:8]
-
+        params_hash = self._params_hash(keywords, config, self.watermark)
         return f"scraper:{self.name}:{params_hash}"
 
+    def _params_hash(
+        self,
+        keywords: List[str],
+        config: Dict,
+        watermark: Optional[ScrapeWatermark] = None
+    ) -> str:
+        """Short hash of the run parameters"""
+        params = f"{sorted(keywords)}:{sorted(config.items())}"
+        if watermark is not None:
+            params += f":{watermark}"
+        return hashlib.md5(params.encode()).hexdigest()[:8]
+
     async def _quick_match(self, title: str, keywords: List[str]) -> bool:
         """
         Quick keyword match on title (case-insensitive)
@@ -217,18 +529,68 @@ class ScraperPlugin(ABC):
         """
         if not keywords:
             return True  # No filtering if no keywords
-        title_lower = title.lower()
-        return any(kw.lower() in title_lower for kw in keywords)
+        return get_matcher(keywords).contains_any(title)
 
     async def __aenter__(self):
-        """Context manager for httpx.AsyncClient"""
-        self.client = httpx.AsyncClient(
-            timeout=self.TIMEOUT,
-            headers={"User-Agent": "TechWatch/1.0 (Educational Project)"}
-        )
+        """Borrow the shared HTTP client of the running event loop"""
+        self.client = http_clients.get_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close HTTP client"""
-        if self.client:
-            await self.client.aclose()
+        """Give the client back (it stays open for other scrapes)"""
+        self.client = None
+
+
+class _CacheWriter:
+    """
+    Appends streamed articles to a temporary Redis list, published on commit()
+
+    The temporary key expires on its own if the run is abandoned. Redis
+    errors are logged and disable caching for the rest of the run.
+    """
+
+    def __init__(self, scraper: ScraperPlugin, cache_key: str):
+        self.scraper = scraper
+        self.cache_key = cache_key
+        self.partial_key = f"{cache_key}:partial:{uuid.uuid4().hex[:8]}"
+        self.enabled = scraper.redis is not None
+        self.count = 0
+        self._buffer: List[str] = []
+
+    async def add(self, article: ScrapedArticle) -> None:
+        if not self.enabled:
+            return
+        # default=str handles datetime
+        self._buffer.append(json.dumps(article.model_dump(mode='json'), default=str))
+        if len(self._buffer) >= self.scraper.CACHE_CHUNK_SIZE:
+            await self._push()
+
+    async def _push(self) -> None:
+        if not self._buffer:
+            return
+        chunk, self._buffer = self._buffer, []
+        try:
+            async with self.scraper.redis.pipeline(transaction=False) as pipe:
+                pipe.rpush(self.partial_key, *chunk)
+                pipe.expire(self.partial_key, self.scraper.CACHE_TTL)
+                await pipe.execute()
+            self.count += len(chunk)
+        except Exception as e:
+            self.scraper.logger.warning(f"Cache write error: {e}")
+            self.enabled = False
+
+    async def commit(self) -> None:
+        """Publish the complete result under the cache key"""
+        if not self.enabled:
+            return
+        await self._push()
+        if not self.enabled or not self.count:
+            return
+        try:
+            async with self.scraper.redis.pipeline(transaction=True) as pipe:
+                pipe.rename(self.partial_key, self.cache_key)
+                pipe.expire(self.cache_key, self.scraper.CACHE_TTL)
+                await pipe.execute()
+            self.scraper.logger.info(f"Cached {self.count} articles for {self.scraper.CACHE_TTL}s")
+        except Exception as e:
+            self.scraper.logger.warning(f"Cache write error: {e}")
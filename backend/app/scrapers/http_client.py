@@ -0,0 +1,300 @@
+"""
+Worker-scoped HTTP clients for scraper plugins.
+
+One pooled httpx.AsyncClient per event loop, borrowed by every plugin
+instead of each scrape opening (and tearing down) its own: keep-alive
+connections, TLS sessions and resolved addresses survive across sources
+and, with the worker loop of app.tasks.event_loop, across task runs.
+
+Features:
+- Global and per-host connection limits
+- Keep-alive pool with configurable expiry
+- HTTP/2 when the h2 package is installed (SCRAPER_HTTP2)
+- DNS cache in front of the connection pool (SCRAPER_DNS_CACHE_TTL)
+- close() for the Celery worker shutdown signals
+"""
+import asyncio
+import contextlib
+import importlib.util
+import ipaddress
+import socket
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import httpcore
+import httpx
+
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+USER_AGENT = "TechWatch/1.0 (Educational Project)"
+
+
+class CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend resolving hostnames once per TTL
+
+    Wraps the pool's default backend: connect_tcp() dials the cached
+    addresses in turn (TLS still uses the original hostname for SNI and
+    certificate checks). An address that refuses the connection drops
+    the cache entry so the next connection resolves again.
+    """
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, ttl: float):
+        self._backend = backend
+        self._ttl = ttl
+        self._cache: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        """
+        Resolve a hostname (cached)
+
+        Args:
+            host: Hostname or IP literal
+            port: TCP port
+
+        Returns:
+            IP addresses, in resolver order
+        """
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+
+        cached = self._cache.get((host, port))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._cache[(host, port)] = (time.monotonic() + self._ttl, addresses)
+        return addresses
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        last_error: Optional[Exception] = None
+        for address in await self.resolve(host, port):
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout=timeout,
+                    local_address=local_address, socket_options=socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e
+
+        self._cache.pop((host, port), None)
+        raise last_error or httpcore.ConnectError(f"No address for {host}")
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+# httpcore exceptions and their httpx counterparts (same mapping as httpx's own transport)
+_HTTPCORE_ERRORS = {
+    httpcore.TimeoutException: httpx.TimeoutException,
+    httpcore.ConnectTimeout: httpx.ConnectTimeout,
+    httpcore.ReadTimeout: httpx.ReadTimeout,
+    httpcore.WriteTimeout: httpx.WriteTimeout,
+    httpcore.PoolTimeout: httpx.PoolTimeout,
+    httpcore.NetworkError: httpx.NetworkError,
+    httpcore.ConnectError: httpx.ConnectError,
+    httpcore.ReadError: httpx.ReadError,
+    httpcore.WriteError: httpx.WriteError,
+    httpcore.ProxyError: httpx.ProxyError,
+    httpcore.UnsupportedProtocol: httpx.UnsupportedProtocol,
+    httpcore.ProtocolError: httpx.ProtocolError,
+    httpcore.LocalProtocolError: httpx.LocalProtocolError,
+    httpcore.RemoteProtocolError: httpx.RemoteProtocolError,
+}
+
+
+@contextlib.contextmanager
+def _map_httpcore_errors() -> Iterator[None]:
+    try:
+        yield
+    except tuple(_HTTPCORE_ERRORS) as e:
+        # Most specific match (ReadTimeout rather than TimeoutException)
+        mapped = None
+        for core_error, httpx_error in _HTTPCORE_ERRORS.items():
+            if isinstance(e, core_error) and (mapped is None or issubclass(httpx_error, mapped)):
+                mapped = httpx_error
+        raise mapped(str(e)) from e
+
+
+class _PoolResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream):
+        self._stream = stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _map_httpcore_errors():
+            async for part in self._stream:
+                yield part
+
+    async def aclose(self) -> None:
+        if hasattr(self._stream, "aclose"):
+            await self._stream.aclose()
+
+
+class ConnectionPoolTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport over an httpcore connection pool built by the caller
+
+    httpx.AsyncHTTPTransport creates its pool internally, with no public way
+    to pass a network backend: this one takes the pool as is, so the DNS
+    cache plugs in through httpcore's network_backend argument.
+    """
+
+    def __init__(self, pool: httpcore.AsyncConnectionPool):
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _map_httpcore_errors():
+            response = await self._pool.handle_async_request(core_request)
+
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_PoolResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+@dataclass
+class _LoopClients:
+    """Client and per-host slots bound to one event loop"""
+    client: httpx.AsyncClient
+    host_slots: Dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+
+class HTTPClientManager:
+    """
+    Hands out the shared scraper client of the running event loop
+
+    httpx connections belong to the loop that opened them, so clients
+    are kept per loop (dropped with the loop). Plugins borrow the client
+    in ScraperPlugin.__aenter__ and must not close it.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = settings.SCRAPER_MAX_CONNECTIONS,
+        max_keepalive: int = settings.SCRAPER_MAX_KEEPALIVE,
+        max_per_host: int = settings.SCRAPER_MAX_PER_HOST,
+        keepalive_expiry: float = settings.SCRAPER_KEEPALIVE_EXPIRY,
+        http2: bool = settings.SCRAPER_HTTP2,
+        dns_cache_ttl: float = settings.SCRAPER_DNS_CACHE_TTL,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_per_host = max_per_host
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.dns_cache_ttl = dns_cache_ttl
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        if http2 and not self.http2:
+            logger.info("h2 not installed, scraper HTTP client uses HTTP/1.1")
+
+    def _current(self) -> _LoopClients:
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None or state.client.is_closed:
+            state = _LoopClients(client=self._build_client())
+            self._loops[loop] = state
+        return state
+
+    def _build_client(self) -> httpx.AsyncClient:
+        transport: httpx.AsyncBaseTransport
+        if self.dns_cache_ttl > 0:
+            transport = ConnectionPoolTransport(httpcore.AsyncConnectionPool(
+                ssl_context=httpx.create_ssl_context(),
+                max_connections=self.limits.max_connections,
+                max_keepalive_connections=self.limits.max_keepalive_connections,
+                keepalive_expiry=self.limits.keepalive_expiry,
+                http2=self.http2,
+                network_backend=CachingDNSBackend(httpcore.AnyIOBackend(), self.dns_cache_ttl),
+            ))
+        else:
+            transport = httpx.AsyncHTTPTransport(http2=self.http2, limits=self.limits)
+
+        logger.info(
+            f"Opening shared scraper HTTP client (http2={self.http2}, "
+            f"max_connections={self.limits.max_connections}, per_host={self.max_per_host})"
+        )
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=30.0,
+            headers={"User-Agent": USER_AGENT},
+        )
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Shared client of the running event loop (created on first use)"""
+        return self._current().client
+
+    def host_slot(self, url: str) -> asyncio.Semaphore:
+        """
+        Semaphore capping concurrent requests to the URL's host
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Semaphore of the host (max_per_host slots)
+        """
+        host = httpx.URL(url).host
+        slots = self._current().host_slots
+        if host not in slots:
+            slots[host] = asyncio.Semaphore(self.max_per_host)
+        return slots[host]
+
+    async def aclose(self) -> None:
+        """Close the client of the running event loop"""
+        state = self._loops.pop(asyncio.get_running_loop(), None)
+        if state is not None:
+            await state.client.aclose()
+
+    def close(self) -> None:
+        """
+        Close every client whose loop is idle (worker shutdown)
+
+        Clients of a running loop are left to aclose(); those of a
+        closed loop only lose their references.
+        """
+        for loop, state in list(self._loops.items()):
+            if not loop.is_closed() and not loop.is_running():
+                try:
+                    loop.run_until_complete(state.client.aclose())
+                except Exception as e:
+                    logger.warning(f"Error closing scraper HTTP client: {e}")
+        self._loops.clear()
+
+
+http_clients = HTTPClientManager()
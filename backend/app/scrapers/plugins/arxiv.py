@@ -1,11 +1,11 @@
 import xml.etree.ElementTree as ElementTree
-from datetime import datetime
+from datetime import datetime, timedelta
 from urllib.parse import quote
 
 from app.schemas.scraped_article import ScrapedArticle
 from app.scrapers.base import ScraperPlugin
 from app.scrapers.registry import scraper_plugin
-from app.scrapers.strategies.rate_limit import RateLimiter
+from app.scrapers.strategies.rate_limit import DistributedRateLimiter
 
 
 @scraper_plugin(
@@ -31,6 +31,8 @@ class ArxivScraper(ScraperPlugin):
     MAX_RETRIES = 3
     CACHE_TTL = 3600  # 1 hour (research papers don't change often)
     TIMEOUT = 30.0
+    INCREMENTAL = True
+    WATERMARK_OVERLAP = timedelta(days=3)  # Papers are announced a day or more (weekends) after submission
 
     # Arxiv categories for AI/ML research
     CATEGORIES = ["cs.AI", "cs.CL", "cs.LG", "cs.MA"]
@@ -41,7 +43,7 @@ class ArxivScraper(ScraperPlugin):
 
     def __init__(self, redis_client=None):
         super().__init__(redis_client)
-        self.rate_limiter = RateLimiter(requests_per_minute=30)
+        self.rate_limiter = DistributedRateLimiter('arxiv', requests_per_minute=30)
         self.base_url = "https://export.arxiv.org/api/query"
 
     def validate_config(self, config: dict) -> bool:
@@ -110,6 +112,11 @@ class ArxivScraper(ScraperPlugin):
         else:
             search_query = f"({cat_query})"
 
+        # Incremental run: only papers submitted since the watermark
+        since = self._since()
+        if since:
+            search_query += f" AND submittedDate:[{since:%Y%m%d%H%M} TO 999912312359]"
+
         async with self.rate_limiter:
             params = {
                 'search_query': search_query,
@@ -2,7 +2,7 @@ from typing import List, Dict
 from datetime import datetime
 from app.scrapers.base import ScraperPlugin
 from app.scrapers.registry import scraper_plugin
-from app.scrapers.strategies.rate_limit import RateLimiter
+from app.scrapers.strategies.rate_limit import DistributedRateLimiter
 from app.schemas.scraped_article import ScrapedArticle
 
 
@@ -29,10 +29,11 @@ class DevToScraper(ScraperPlugin):
     MAX_RETRIES = 3
     CACHE_TTL = 1800  # 30 minutes
     TIMEOUT = 30.0
+    INCREMENTAL = True
 
     def __init__(self, redis_client=None):
         super().__init__(redis_client)
-        self.rate_limiter = RateLimiter(requests_per_minute=20)
+        self.rate_limiter = DistributedRateLimiter('devto', requests_per_minute=20)
         self.base_url = "https://dev.to/api"
 
     def validate_config(self, config: Dict) -> bool:
@@ -106,7 +107,9 @@ class DevToScraper(ScraperPlugin):
                 'state': 'fresh'  # Get fresh/recent articles
             }
 
-            response = await self._retry_request('GET', url, params=params)
+            response = await self._retry_request('GET', url, params=params, conditional=True)
+            if response.status_code == 304:
+                return []
             data = response.json()
 
         return [self._parse_article(article) for article in data if self._parse_article(article)]
@@ -121,7 +124,9 @@ class DevToScraper(ScraperPlugin):
                 'state': 'fresh'
             }
 
-            response = await self._retry_request('GET', url, params=params)
+            response = await self._retry_request('GET', url, params=params, conditional=True)
+            if response.status_code == 304:
+                return []
             data = response.json()
 
         return [self._parse_article(article) for article in data if self._parse_article(article)]
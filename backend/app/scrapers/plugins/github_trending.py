@@ -3,7 +3,7 @@ from datetime import datetime
 from bs4 import BeautifulSoup
 from app.scrapers.base import ScraperPlugin
 from app.scrapers.registry import scraper_plugin
-from app.scrapers.strategies.rate_limit import RateLimiter
+from app.scrapers.strategies.rate_limit import DistributedRateLimiter
 from app.schemas.scraped_article import ScrapedArticle
 
 
@@ -32,7 +32,7 @@ class GitHubTrendingScraper(ScraperPlugin):
 
     def __init__(self, redis_client=None):
         super().__init__(redis_client)
-        self.rate_limiter = RateLimiter(requests_per_minute=30)
+        self.rate_limiter = DistributedRateLimiter('github', requests_per_minute=30)
         self.base_url = "https://github.com/trending"
 
     def validate_config(self, config: Dict) -> bool:
@@ -1,8 +1,9 @@
-from typing import List, Dict
+import asyncio
+from typing import List, Dict, Tuple
 from datetime import datetime
 from app.scrapers.base import ScraperPlugin
 from app.scrapers.registry import scraper_plugin
-from app.scrapers.strategies.rate_limit import RateLimiter
+from app.scrapers.strategies.rate_limit import DistributedRateLimiter
 from app.schemas.scraped_article import ScrapedArticle
 
 
@@ -20,6 +21,7 @@ class HackerNewsScraper(ScraperPlugin):
 
     Features:
     - Fetches top stories from HN
+    - Concurrent item fetching (bounded worker pool, early stop)
     - Filters by keywords in title
     - Returns validated Pydantic models
     - Best-effort error handling (skips invalid stories)
@@ -29,10 +31,12 @@ class HackerNewsScraper(ScraperPlugin):
     MAX_RETRIES = 3
     CACHE_TTL = 1800  # 30 minutes
     TIMEOUT = 30.0
+    MAX_CONCURRENT_FETCHES = 10  # Item requests in flight at once
+    INCREMENTAL = False  # Ranked front page, not a feed: repeats are dropped by the canonical_url upsert
 
     def __init__(self, redis_client=None):
         super().__init__(redis_client)
-        self.rate_limiter = RateLimiter(requests_per_minute=100)
+        self.rate_limiter = DistributedRateLimiter('hackernews', requests_per_minute=100)
         self.base_url = "https://hacker-news.firebaseio.com/v0"
 
     def validate_config(self, config: Dict) -> bool:
@@ -45,36 +49,26 @@ class HackerNewsScraper(ScraperPlugin):
 
         Strategy:
         1. Get top 500 story IDs
-        2. Fetch each story's details
+        2. Fetch story details concurrently (bounded worker pool, rate limited)
         3. Filter by keywords in title
         4. Parse and validate
-        5. Return up to max_articles matches
+        5. Stop issuing requests once max_articles matches are found
+        6. Return matches in HN ranking order
         """
         max_articles = config.get('max_articles', 50)
+        concurrency = config.get('concurrency', self.MAX_CONCURRENT_FETCHES)
 
         self.logger.info(f"Fetching HN articles for keywords: {keywords}")
 
         # Get top story IDs
         story_ids = await self._get_top_story_ids()
 
-        articles = []
-        errors = 0
-
-        # Fetch stories until we have enough matches
-        for story_id in story_ids[:500]:  # Process top 500
-            if len(articles) >= max_articles:
-                break
-
-            try:
-                article = await self._fetch_and_parse_story(story_id, keywords)
-                if article:  # None if keywords don't match or invalid
-                    articles.append(article)
-
-            except Exception as e:
-                errors += 1
-                self.logger.warning(f"Failed to parse story {story_id}: {e}")
-                # Best effort: continue to next article
-                continue
+        articles, errors = await self._fetch_stories(
+            story_ids[:500],  # Process top 500
+            keywords,
+            max_articles,
+            concurrency
+        )
 
         self.logger.info(
             f"Fetched {len(articles)} HN articles "
@@ -83,6 +77,79 @@ class HackerNewsScraper(ScraperPlugin):
 
         return articles
 
+    async def _fetch_stories(
+        self,
+        story_ids: List[int],
+        keywords: List[str],
+        max_articles: int,
+        concurrency: int
+    ) -> Tuple[List[ScrapedArticle], int]:
+        """
+        Fetch stories with a bounded pool of concurrent workers
+
+        Workers pull IDs in ranking order from a shared queue, so requests are
+        issued top-down exactly like the serial loop (concurrency=1 is the serial
+        path). Every fetch still goes through the rate limiter. Once max_articles
+        matches are collected no new request is issued and in-flight fetches are
+        cancelled.
+
+        Returns:
+            Tuple of (matched articles in ranking order, number of errors)
+        """
+        if max_articles <= 0 or not story_ids:
+            return [], 0
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for rank, story_id in enumerate(story_ids):
+            queue.put_nowait((rank, story_id))
+
+        matches: Dict[int, ScrapedArticle] = {}
+        errors = 0
+        enough = asyncio.Event()
+
+        async def worker():
+            nonlocal errors
+            while not enough.is_set():
+                try:
+                    rank, story_id = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    article = await self._fetch_and_parse_story(story_id, keywords)
+                except Exception as e:
+                    errors += 1
+                    self.logger.warning(f"Failed to parse story {story_id}: {e}")
+                    # Best effort: continue to next article
+                    continue
+
+                if article:  # None if keywords don't match or invalid
+                    matches[rank] = article
+                    if len(matches) >= max_articles:
+                        enough.set()
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(max(1, concurrency), len(story_ids)))
+        ]
+        all_done = asyncio.gather(*workers)
+        enough_reached = asyncio.create_task(enough.wait())
+
+        try:
+            await asyncio.wait(
+                {all_done, enough_reached},
+                return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            # Cancel in-flight fetches and wait for workers to unwind
+            for task in workers:
+                task.cancel()
+            enough_reached.cancel()
+            await asyncio.gather(all_done, enough_reached, return_exceptions=True)
+
+        articles = [matches[rank] for rank in sorted(matches)][:max_articles]
+        return articles, errors
+
     async def _get_top_story_ids(self) -> List[int]:
         """Get list of top story IDs from HN"""
         async with self.rate_limiter:
@@ -1,6 +1,5 @@
 from typing import List, Dict
 from datetime import datetime
-import feedparser
 from app.scrapers.base import ScraperPlugin
 from app.scrapers.registry import scraper_plugin
 from app.schemas.scraped_article import ScrapedArticle
@@ -122,8 +121,10 @@ class MediumScraper(ScraperPlugin):
         """Scrape a single RSS feed"""
         try:
             # Fetch feed
-            response = await self._retry_request('GET', feed_url)
-            feed = feedparser.parse(response.text)
+            response = await self._retry_request('GET', feed_url, conditional=True)
+            if response.status_code == 304:
+                return []
+            feed = await self._parse_feed(response.content, response.headers)
 
             if feed.bozo:
                 self.logger.warning(f"Malformed RSS feed: {feed_url}")
@@ -1,10 +1,10 @@
 from datetime import datetime
-
-import feedparser
+from typing import AsyncIterator
 
 from app.schemas.scraped_article import ScrapedArticle
 from app.scrapers.base import ScraperPlugin
 from app.scrapers.registry import scraper_plugin
+from app.utils.keyword_matcher import get_matcher
 
 
 @scraper_plugin(
@@ -96,16 +96,27 @@ class OfficialBlogsScraper(ScraperPlugin):
         Returns:
             List of ScrapedArticle objects
         """
+        return [article async for article in self.iter_articles(config, keywords)]
+
+    async def iter_articles(self, config: dict, keywords: list[str]) -> AsyncIterator[ScrapedArticle]:
+        """
+        Stream articles feed by feed, as each feed is downloaded
+
+        Args:
+            config: Configuration with feeds list
+            keywords: Optional list of keywords for filtering
+
+        Yields:
+            ScrapedArticle objects
+        """
         feeds = config.get('feeds', self._get_default_feeds())
         max_per_feed = config.get('max_articles_per_feed', 20)
 
         if not feeds:
             self.logger.info("No feeds configured, returning empty list")
-            return []
-
-        articles = []
-        errors = 0
+            return
 
+        named_feeds = []
         for feed_config in feeds:
             feed_name = feed_config.get('name', 'Unknown')
             feed_url = feed_config.get('url')
@@ -113,34 +124,45 @@ class OfficialBlogsScraper(ScraperPlugin):
             if not feed_url:
                 self.logger.warning(f"Skipping feed {feed_name}: no URL")
                 continue
+            named_feeds.append((feed_name, feed_url))
+
+        self.logger.info(f"Fetching {len(named_feeds)} feeds")
+
+        count = 0
+        errors = 0
 
-            try:
-                feed_articles = await self._fetch_feed(feed_url, feed_name, max_per_feed, keywords)
-                articles.extend(feed_articles)
-            except Exception as e:
+        async for index, feed in self._iter_feeds([feed_url for _, feed_url in named_feeds]):
+            feed_name = named_feeds[index][0]
+            if isinstance(feed, Exception):
                 errors += 1
-                self.logger.error(f"Failed to fetch feed {feed_name}: {e}")
+                self.logger.error(f"Failed to fetch feed {feed_name}: {feed}")
+                continue
+
+            if feed is None:
+                # Unchanged since last fetch
                 continue
 
+            for article in self._feed_articles(feed, feed_name, max_per_feed, keywords):
+                count += 1
+                yield article
+
         self.logger.info(
-            f"Scraped {len(articles)} articles from {len(feeds)} feeds "
+            f"Scraped {count} articles from {len(feeds)} feeds "
             f"({errors} errors)"
         )
 
-        return articles
-
-    async def _fetch_feed(
+    def _feed_articles(
         self,
-        feed_url: str,
+        feed,
         feed_name: str,
         max_articles: int,
         keywords: list[str]
     ) -> list[ScrapedArticle]:
         """
-        Fetch and parse a single RSS feed
+        Convert a parsed RSS feed to articles
 
         Args:
-            feed_url: URL of the RSS feed
+            feed: feedparser result
             feed_name: Display name of the feed
             max_articles: Maximum articles to return
             keywords: Keywords for filtering
@@ -148,10 +170,6 @@ class OfficialBlogsScraper(ScraperPlugin):
         Returns:
             List of ScrapedArticle objects
         """
-        self.logger.info(f"Fetching feed: {feed_name} ({feed_url})")
-
-        feed = feedparser.parse(feed_url)
-
         if feed.bozo:
             self.logger.warning(f"Malformed RSS for {feed_name}: {feed.bozo_exception}")
 
@@ -183,8 +201,7 @@ class OfficialBlogsScraper(ScraperPlugin):
         if not keywords:
             return True
 
-        text = f"{article.title} {article.content or ''}".lower()
-        return any(kw.lower() in text for kw in keywords)
+        return get_matcher(keywords).contains_any(f"{article.title} {article.content or ''}")
 
     def _get_default_feeds(self) -> list[dict]:
         """
@@ -3,8 +3,9 @@ from datetime import datetime, timedelta
 import httpx
 from app.scrapers.base import ScraperPlugin
 from app.scrapers.registry import scraper_plugin
-from app.scrapers.strategies.rate_limit import RateLimiter
+from app.scrapers.strategies.rate_limit import DistributedRateLimiter
 from app.schemas.scraped_article import ScrapedArticle
+from app.utils.keyword_matcher import get_matcher
 
 
 @scraper_plugin(
@@ -32,10 +33,11 @@ class RedditScraper(ScraperPlugin):
     MAX_RETRIES = 3
     CACHE_TTL = 1800  # 30 minutes for articles
     TIMEOUT = 30.0
+    INCREMENTAL = False  # 'hot' is ranked, not chronological: repeats are dropped by the canonical_url upsert
 
     def __init__(self, redis_client=None):
         super().__init__(redis_client)
-        self.rate_limiter = RateLimiter(requests_per_minute=60)
+        self.rate_limiter = DistributedRateLimiter('reddit', requests_per_minute=60)
         self.base_url = "https://oauth.reddit.com"
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
@@ -196,9 +198,8 @@ class RedditScraper(ScraperPlugin):
             selftext = data.get('selftext', '')
 
             # Filter by keywords (check title and selftext)
-            text_to_search = f"{title} {selftext}".lower()
             if keywords:
-                if not any(kw.lower() in text_to_search for kw in keywords):
+                if not get_matcher(keywords).contains_any(f"{title} {selftext}"):
                     return None
 
             # Build tags from flair and subreddit
@@ -1,6 +1,5 @@
 from typing import List, Dict
 from datetime import datetime
-import feedparser
 import re
 from app.scrapers.base import ScraperPlugin
 from app.scrapers.registry import scraper_plugin
@@ -164,8 +163,10 @@ class TwitterNitterScraper(ScraperPlugin):
     ) -> List[ScrapedArticle]:
         """Scrape a single Nitter RSS feed"""
         try:
-            response = await self._retry_request('GET', feed_url)
-            feed = feedparser.parse(response.text)
+            response = await self._retry_request('GET', feed_url, conditional=True)
+            if response.status_code == 304:
+                return []
+            feed = await self._parse_feed(response.content, response.headers)
 
             if feed.bozo:
                 self.logger.warning(f"Malformed RSS feed: {feed_url}")
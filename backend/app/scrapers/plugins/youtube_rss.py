@@ -1,6 +1,5 @@
-from typing import List, Dict, Any
+from typing import AsyncIterator, List, Dict, Any
 from datetime import datetime
-import feedparser
 from app.scrapers.base import ScraperPlugin
 from app.scrapers.registry import scraper_plugin
 from app.schemas.scraped_article import ScrapedYouTubeVideo
@@ -18,11 +17,12 @@ class YouTubeRSSScraper(ScraperPlugin):
     Features:
     - Monitors RSS feeds from subscribed channels
     - No API quota consumption
-    - Fast and reliable
+    - Channels fetched concurrently (FEED_CONCURRENCY at a time)
     - Runs every 30 minutes
     """
 
     CACHE_TTL = 1800  # 30 minutes
+    INCREMENTAL = True
 
     def validate_config(self, config: Dict) -> bool:
         """No special config required - fetches channels from DB"""
@@ -69,38 +69,52 @@ class YouTubeRSSScraper(ScraperPlugin):
         Returns:
             List of ScrapedYouTubeVideo objects
         """
+        return [video async for video in self.iter_articles(config, keywords)]
+
+    async def iter_articles(self, config: Dict, keywords: List[str]) -> AsyncIterator[ScrapedYouTubeVideo]:
+        """
+        Stream new videos channel by channel, as each feed is downloaded
+
+        Args:
+            config: Scraper configuration (unused, fetches all active channels)
+            keywords: Filter videos by keywords (optional)
+
+        Yields:
+            ScrapedYouTubeVideo objects
+        """
         channels = await self._get_active_channels()
 
-        videos = []
-        for channel in channels:
-            try:
-                # Fetch RSS feed
-                feed = feedparser.parse(channel.rss_feed_url)
+        count = 0
+        async for index, feed in self._iter_feeds([channel.rss_feed_url for channel in channels]):
+            channel = channels[index]
+            if isinstance(feed, Exception):
+                self.logger.error(f"RSS error for {channel.channel_name}: {feed}")
+                continue
 
-                if feed.bozo:
-                    self.logger.warning(f"Malformed RSS for {channel.channel_name}")
-                    continue
+            if feed is None:
+                # Unchanged since last poll
+                continue
 
-                # Parse entries
-                for entry in feed.entries:
-                    try:
-                        video = self._parse_rss_entry(entry, channel)
+            if feed.bozo and not feed.entries:
+                self.logger.warning(f"Malformed RSS for {channel.channel_name}")
+                continue
 
-                        # Optional keyword filtering
-                        if keywords and not self._matches_keywords(video, keywords):
-                            continue
+            # Parse entries
+            for entry in feed.entries:
+                try:
+                    video = self._parse_rss_entry(entry, channel)
 
-                        videos.append(video)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to parse entry: {e}")
+                    # Optional keyword filtering
+                    if keywords and not self._matches_keywords(video, keywords):
                         continue
+                except Exception as e:
+                    self.logger.warning(f"Failed to parse entry: {e}")
+                    continue
 
-            except Exception as e:
-                self.logger.error(f"RSS error for {channel.channel_name}: {e}")
-                continue
+                count += 1
+                yield video
 
-        self.logger.info(f"Scraped {len(videos)} videos from {len(channels)} channels")
-        return videos
+        self.logger.info(f"Scraped {count} videos from {len(channels)} channels")
 
     def _parse_rss_entry(self, entry: Any, channel: Any) -> ScrapedYouTubeVideo:
         """
@@ -10,6 +10,7 @@ from app.config import settings
 from app.schemas.scraped_article import ScrapedYouTubeVideo
 from app.scrapers.base import ScraperPlugin
 from app.scrapers.registry import scraper_plugin
+from app.utils.keyword_matcher import get_matcher
 from app.youtube.quota_manager import YouTubeQuotaManager
 
 
@@ -258,40 +259,39 @@ class YouTubeTrendingScraper(ScraperPlugin):
         include_shorts = config.get("include_shorts", True)
         min_view_count = config.get("min_view_count", 0)
 
+        # Normalize keywords once (not once per video)
+        keyword_strings = []
+        weights = []
+        for keyword_data in keywords:
+            # Handle both dict and string formats
+            if isinstance(keyword_data, str):
+                keyword = keyword_data
+                weight = 1.0
+            elif isinstance(keyword_data, dict):
+                keyword = keyword_data.get("keyword", "")
+                weight = keyword_data.get("weight", 1.0)
+            else:
+                self.logger.warning(f"Invalid keyword type: {type(keyword_data)}, skipping")
+                continue
+
+            if not isinstance(keyword, str):
+                self.logger.warning(f"Invalid keyword value type: {type(keyword)}, skipping")
+                continue
+
+            keyword_strings.append(keyword)
+            weights.append(weight)
+
+        matcher = get_matcher(keyword_strings)
         filtered_videos = []
 
         for video in videos:
             # Build searchable text: title + description + tags (case-insensitive)
-            searchable_text = (
-                f"{video.title} {video.content or ''} {' '.join(video.tags or [])}"
-            ).lower()
+            searchable_text = f"{video.title} {video.content or ''} {' '.join(video.tags or [])}"
 
             # Calculate relevance score by matching keywords
-            relevance_score = 0.0
-            matched_keywords = 0
-
-            for keyword_data in keywords:
-                # Handle both dict and string formats
-                if isinstance(keyword_data, str):
-                    keyword = keyword_data
-                    weight = 1.0
-                elif isinstance(keyword_data, dict):
-                    keyword = keyword_data.get("keyword", "")
-                    weight = keyword_data.get("weight", 1.0)
-                else:
-                    self.logger.warning(f"Invalid keyword type: {type(keyword_data)}, skipping")
-                    continue
-
-                if not isinstance(keyword, str):
-                    self.logger.warning(f"Invalid keyword value type: {type(keyword)}, skipping")
-                    continue
-
-                keyword = keyword.lower()
-
-                # Case-insensitive substring match
-                if keyword and keyword in searchable_text:
-                    relevance_score += weight
-                    matched_keywords += 1
+            matched = matcher.matched_indices(searchable_text)
+            relevance_score = sum(weights[i] for i in sorted(matched))
+            matched_keywords = len(matched)
 
             # Skip if below minimum keyword matches threshold
             if matched_keywords < min_keyword_matches:
@@ -1,99 +1,382 @@
-from typing import List, Dict, Union
+from datetime import datetime, timedelta
+from typing import List, Dict, Set, Union, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, func, or_, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.models.article import Article
 from app.models.source import Source
+from app.config import settings
 from app.schemas.scraped_article import ScrapedArticle
+from app.scrapers.watermarks import to_utc_naive
 from app.utils.logger import get_logger
+from app.utils.response_cache import TAG_ARTICLES, invalidate_tags_async
+from app.utils.simhash import NearDuplicateIndex, article_fingerprint
+from app.utils.urls import canonicalize_url
 
 logger = get_logger(__name__)
 
+# Computed once instead of per article
+ARTICLE_COLUMNS = frozenset(c.name for c in Article.__table__.columns)
+# Kept from the first copy stored (the conflict target is canonical_url)
+IMMUTABLE_COLUMNS = frozenset({'url', 'canonical_url'})
+VIDEO_SOURCE_TYPES = ('youtube_rss', 'youtube_trending', 'youtube')
 
-async def save_articles(
-    articles: List[Union[Dict, ScrapedArticle]],
-    source_type: str,
-    db: Session
-) -> int:
+# Rows per statement (keeps bind parameter counts well under driver limits)
+BULK_CHUNK_SIZE = 500
+
+
+def _normalize_article(
+    article: Union[Dict, ScrapedArticle],
+    source_id: int,
+    source_type: str
+) -> Dict:
     """
-    Save articles to database with deduplication
+    Convert a scraped article into a dict of Article column values
 
     Args:
-        articles: List of article dictionaries or ScrapedArticle models
+        article: Article dictionary or ScrapedArticle model
+        source_id: ID of the source the article belongs to
         source_type: Type of source (reddit, hackernews, etc.)
-        db: Database session
 
     Returns:
-        Number of articles saved (new + updated)
-
-    Logic:
-        - Check if article URL already exists
-        - If exists: update with new data
-        - If new: insert
+        Dict restricted to valid Article columns
     """
-    # Get source_id from source_type
-    source = db.query(Source).filter_by(type=source_type).first()
-    if not source:
-        logger.error(f"Source not found for type: {source_type}")
-        return 0
+    # Convert ScrapedArticle to dict if needed
+    if isinstance(article, ScrapedArticle):
+        # mode='python' converts Pydantic types (HttpUrl, etc.) to native Python types
+        article_data = article.model_dump(mode='python', exclude={'raw_data'})
+    else:
+        article_data = article.copy()
 
-    saved_count = 0
+    # Convert HttpUrl objects to strings
+    for key in ['url', 'thumbnail_url']:
+        if key in article_data and article_data[key] is not None:
+            article_data[key] = str(article_data[key])
 
-    for article in articles:
-        try:
-            # Convert ScrapedArticle to dict if needed
-            if isinstance(article, ScrapedArticle):
-                # mode='python' converts Pydantic types (HttpUrl, etc.) to native Python types
-                article_data = article.model_dump(mode='python', exclude={'raw_data'})
-            else:
-                article_data = article.copy()
+    # Deduplication key, whichever scraper produced the URL
+    article_data['canonical_url'] = canonicalize_url(article_data['url'])
 
-            # Convert HttpUrl objects to strings
-            for key in ['url', 'thumbnail_url']:
-                if key in article_data and article_data[key] is not None:
-                    article_data[key] = str(article_data[key])
+    # Remove source_type and set source_id instead
+    article_data.pop('source_type', None)
+    article_data['source_id'] = source_id
 
-            # Remove source_type and set source_id instead
-            original_source_type = article_data.pop('source_type', None)
-            article_data['source_id'] = source.id
+    # Set is_video based on source_type
+    if source_type in VIDEO_SOURCE_TYPES:
+        article_data['is_video'] = True
 
-            # Set is_video based on source_type
-            if source_type in ('youtube_rss', 'youtube_trending', 'youtube'):
-                article_data['is_video'] = True
+    return {k: v for k, v in article_data.items() if k in ARTICLE_COLUMNS}
 
-            # Check if article already exists by URL
-            existing = db.query(Article).filter_by(url=article_data['url']).first()
 
-            # Filter to only include valid Article fields
-            valid_fields = {c.name for c in Article.__table__.columns}
-            filtered_data = {k: v for k, v in article_data.items() if k in valid_fields}
+def _chunks(items: List, size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
 
-            if existing:
-                # Update existing article
-                for key, value in filtered_data.items():
-                    if hasattr(existing, key) and value is not None:
-                        setattr(existing, key, value)
 
-                logger.debug(f"Updated article: {filtered_data['url']}")
-            else:
-                # Create new article
-                article = Article(**filtered_data)
-                db.add(article)
-                logger.debug(f"Created new article: {filtered_data['url']}")
+async def upsert_articles(
+    articles: List[Union[Dict, ScrapedArticle]],
+    source_type: str,
+    db: Session,
+    source_id: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Bulk insert/update a batch of articles, deduplicated on canonical URL
 
-            saved_count += 1
+    Args:
+        articles: List of article dictionaries or ScrapedArticle models
+        source_type: Type of source (reddit, hackernews, etc.)
+        db: Database session
+        source_id: Source ID if already known (skips the Source lookup)
 
+    Returns:
+        Dict with inserted, updated, unchanged, failed and near_duplicates counts
+
+    Logic:
+        - Normalize the whole batch once (last occurrence of a canonical URL wins)
+        - Fingerprint title + content; new articles close to a recent one
+          are linked to its canonical article (duplicate_of_id)
+        - PostgreSQL: INSERT ... ON CONFLICT (canonical_url) DO UPDATE, only
+          touching rows whose values actually change
+        - Other dialects (SQLite in tests): one IN lookup for existing
+          canonical URLs, then update changed rows and add new ones
+        - Existing values are never overwritten with None, and the stored
+          url stays the one first seen
+    """
+    stats = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0, 'near_duplicates': 0}
+
+    # Get source_id from source_type
+    if source_id is None:
+        source_id = db.query(Source.id).filter_by(type=source_type).scalar()
+        if source_id is None:
+            logger.error(f"Source not found for type: {source_type}")
+            return stats
+
+    rows_by_canonical: Dict[str, Dict] = {}
+    for article in articles:
+        try:
+            row = _normalize_article(article, source_id, source_type)
+            rows_by_canonical[row['canonical_url']] = row
         except Exception as e:
             url = article.url if isinstance(article, ScrapedArticle) else article.get('url', 'unknown')
             logger.error(f"Error saving article {url}: {e}")
-            continue
+            stats['failed'] += 1
+
+    rows = list(rows_by_canonical.values())
+    if not rows:
+        return stats
 
-    # Commit all changes
     try:
+        stats['near_duplicates'] = _link_near_duplicates(rows, db)
+
+        if db.get_bind().dialect.name == 'postgresql':
+            _upsert_postgresql(rows, db, stats)
+        else:
+            _upsert_generic(rows, db, stats)
+
         db.commit()
-        logger.info(f"Saved {saved_count} articles from {source_type}")
+        if stats['inserted'] or stats['updated']:
+            await invalidate_tags_async(TAG_ARTICLES)
+        logger.info(
+            f"Saved articles from {source_type}: {stats['inserted']} inserted, "
+            f"{stats['updated']} updated, {stats['unchanged']} unchanged, "
+            f"{stats['near_duplicates']} near-duplicates"
+        )
     except Exception as e:
         db.rollback()
         logger.error(f"Error committing articles: {e}")
         raise
 
-    return saved_count
+    return stats
+
+
+def _link_near_duplicates(rows: List[Dict], db: Session) -> int:
+    """
+    Fingerprint rows and link new near-duplicates to their canonical article
+
+    Candidates are articles published within DUPLICATE_WINDOW_DAYS of the
+    batch. A duplicate points at the root of the match's cluster, so every
+    copy of a story shares one canonical article. Rows whose canonical URL
+    is already stored keep their current link; duplicates inside a single
+    batch are not detected (they have no ID yet).
+
+    Returns:
+        Number of new rows marked as near-duplicates
+    """
+    fingerprinted = []
+    for row in rows:
+        row['simhash'] = article_fingerprint(row.get('title'), row.get('content'))
+        row['duplicate_of_id'] = None  # Never overwrites a stored link (None is ignored on update)
+        if row['simhash'] is not None:
+            fingerprinted.append(row)
+    if not fingerprinted:
+        return 0
+
+    existing_urls = set()
+    for chunk in _chunks([row['canonical_url'] for row in fingerprinted], BULK_CHUNK_SIZE):
+        existing_urls.update(db.scalars(
+            select(Article.canonical_url).where(Article.canonical_url.in_(chunk))
+        ))
+    new_rows = [row for row in fingerprinted if row['canonical_url'] not in existing_urls]
+    if not new_rows:
+        return 0
+
+    window = timedelta(days=settings.DUPLICATE_WINDOW_DAYS)
+    dates = [to_utc_naive(row['published_at']) for row in new_rows if row.get('published_at')]
+    dates = dates or [datetime.utcnow()]
+    candidates = db.execute(
+        select(Article.id, Article.simhash, Article.duplicate_of_id, Article.published_at).where(
+            Article.simhash.isnot(None),
+            Article.published_at.between(min(dates) - window, max(dates) + window)
+        )
+    ).all()
+    if not candidates:
+        return 0
+
+    index = NearDuplicateIndex()
+    by_id = {}
+    for candidate in candidates:
+        index.add(candidate.id, candidate.simhash)
+        by_id[candidate.id] = candidate
+
+    linked = 0
+    for row in new_rows:
+        match = by_id.get(index.nearest(row['simhash']))
+        published_at = to_utc_naive(row.get('published_at'))
+        if match is None or (published_at and abs(published_at - match.published_at) > window):
+            continue
+        row['duplicate_of_id'] = match.duplicate_of_id or match.id
+        linked += 1
+    return linked
+
+
+def _upsert_postgresql(rows: List[Dict], db: Session, stats: Dict[str, int]) -> None:
+    """Upsert with INSERT ... ON CONFLICT, one statement per chunk and column set"""
+    table = Article.__table__
+
+    # Multi-row VALUES needs identical keys; scrapers produce uniform rows so
+    # this is normally a single group
+    groups: Dict[frozenset, List[Dict]] = {}
+    for row in rows:
+        groups.setdefault(frozenset(row), []).append(row)
+
+    for keys, group in groups.items():
+        update_cols = [k for k in keys if k not in IMMUTABLE_COLUMNS]
+
+        for chunk in _chunks(group, BULK_CHUNK_SIZE):
+            stmt = pg_insert(table).values(chunk)
+            excluded = stmt.excluded
+            # Keep existing values when the scraped value is None
+            new_values = {
+                col: func.coalesce(excluded[col], table.c[col]) for col in update_cols
+            }
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['canonical_url'],
+                set_=new_values,
+                where=or_(*[
+                    table.c[col].is_distinct_from(value)
+                    for col, value in new_values.items()
+                ]) if new_values else None
+            ).returning(
+                # xmax is 0 for freshly inserted tuples
+                literal_column('(xmax = 0)').label('inserted')
+            )
+
+            returned = db.execute(stmt).all()
+            inserted = sum(1 for r in returned if r.inserted)
+            stats['inserted'] += inserted
+            stats['updated'] += len(returned) - inserted
+            stats['unchanged'] += len(chunk) - len(returned)
+
+
+def _upsert_generic(rows: List[Dict], db: Session, stats: Dict[str, int]) -> None:
+    """Upsert via a single IN lookup per chunk (SQLite and other dialects)"""
+    for chunk in _chunks(rows, BULK_CHUNK_SIZE):
+        urls = [row['canonical_url'] for row in chunk]
+        existing = {
+            article.canonical_url: article
+            for article in db.scalars(select(Article).where(Article.canonical_url.in_(urls)))
+        }
+
+        new_articles = []
+        for row in chunk:
+            article = existing.get(row['canonical_url'])
+            if article is None:
+                new_articles.append(Article(**row))
+                continue
+
+            changed = False
+            for key, value in row.items():
+                if key in IMMUTABLE_COLUMNS:
+                    continue
+                if value is not None and getattr(article, key) != value:
+                    setattr(article, key, value)
+                    changed = True
+
+            if changed:
+                stats['updated'] += 1
+            else:
+                stats['unchanged'] += 1
+
+        db.add_all(new_articles)
+        stats['inserted'] += len(new_articles)
+
+
+class ArticleSink:
+    """
+    Streaming writer for one source run
+
+    Articles are written with upsert_articles() every batch_size distinct
+    canonical URLs. Each micro-batch is committed (and the article caches
+    invalidated), so the first articles show up in the feed while the
+    source is still being scraped, and only one batch of articles is held
+    in memory. As with a single upsert_articles() call, the last copy of a
+    canonical URL wins: a repeat replaces the pending copy, or updates the
+    row if its first copy was already written.
+
+    Args:
+        db: Database session
+        source_type: Type of source (reddit, hackernews, etc.)
+        source_id: Source ID if already known (skips the Source lookup)
+        batch_size: Articles per write (default: SCRAPING_SINK_BATCH_SIZE)
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        source_type: str,
+        source_id: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ):
+        self.db = db
+        self.source_type = source_type
+        self.source_id = source_id
+        self.batch_size = batch_size or settings.SCRAPING_SINK_BATCH_SIZE
+        self.stats = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0, 'near_duplicates': 0}
+        self.received = 0
+        self.batches = 0
+        self._pending: Dict[str, Union[Dict, ScrapedArticle]] = {}
+        self._written: Set[str] = set()
+        self._rewritten = 0  # Rows written again by a later batch
+
+    @property
+    def saved(self) -> int:
+        """Distinct articles stored so far (new + updated + unchanged)"""
+        return self.stats['inserted'] + self.stats['updated'] + self.stats['unchanged'] - self._rewritten
+
+    async def add(self, article: Union[Dict, ScrapedArticle]) -> None:
+        """
+        Queue an article, writing the batch once it is full
+
+        Args:
+            article: ScrapedArticle or article dictionary (dicts need a url,
+                upsert_articles() checks the rest)
+        """
+        self.received += 1
+        if isinstance(article, ScrapedArticle):
+            canonical_url = article.canonical_url
+        elif article.get('url'):
+            canonical_url = canonicalize_url(article['url'])
+        else:
+            logger.error(f"Skipping article without URL: {article.get('title', 'unknown')}")
+            self.stats['failed'] += 1
+            return
+
+        self._pending[canonical_url] = article
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write the queued articles"""
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        stats = await upsert_articles(list(batch.values()), self.source_type, self.db, source_id=self.source_id)
+        for key, value in stats.items():
+            self.stats[key] += value
+        self._rewritten += len(batch.keys() & self._written)
+        self._written.update(batch)
+        self.batches += 1
+
+
+async def save_articles(
+    articles: List[Union[Dict, ScrapedArticle]],
+    source_type: str,
+    db: Session,
+    source_id: Optional[int] = None
+) -> int:
+    """
+    Save articles to database with deduplication
+
+    Args:
+        articles: List of article dictionaries or ScrapedArticle models
+        source_type: Type of source (reddit, hackernews, etc.)
+        db: Database session
+        source_id: Source ID if already known (skips the Source lookup)
+
+    Returns:
+        Number of articles saved (new + updated + unchanged duplicates)
+
+    See upsert_articles() for the separate inserted/updated/unchanged counts.
+    """
+    stats = await upsert_articles(articles, source_type, db, source_id=source_id)
+    return stats['inserted'] + stats['updated'] + stats['unchanged']
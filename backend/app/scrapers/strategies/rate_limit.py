@@ -2,10 +2,21 @@ import asyncio
 import time
 from typing import Optional
 
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.utils.logger import get_logger
+from app.utils.redis_clients import LoopRedisClients
+
+logger = get_logger(__name__)
+
 
 class RateLimiter:
     """
-    Token bucket rate limiter.
+    Token bucket rate limiter (in-process).
+
+    Each caller reserves a token, possibly going into debt, and sleeps
+    exactly until its token is refilled: no polling, FIFO order.
 
     Args:
         requests_per_minute: Nombre de requêtes autorisées par minute
@@ -18,19 +29,26 @@ class RateLimiter:
         self.lock = asyncio.Lock()
 
     async def __aenter__(self):
-        async with self.lock:
-            await self._wait_for_token()
-            self.tokens -= 1
+        await self.acquire()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         pass
 
-    async def _wait_for_token(self):
-        """Attend qu'un token soit disponible"""
-        while self.tokens < 1:
-            await asyncio.sleep(0.1)
-            self._refill_tokens()
+    async def acquire(self, cost: float = 1) -> None:
+        """Réserve `cost` tokens et attend qu'ils soient disponibles"""
+        async with self.lock:
+            wait = self._reserve(cost)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _reserve(self, cost: float = 1) -> float:
+        """Prend `cost` tokens et retourne le temps d'attente (secondes) avant de les utiliser"""
+        self._refill_tokens()
+        self.tokens -= cost
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens * 60 / self.rate
 
     def _refill_tokens(self):
         """Remplit les tokens basé sur le temps écoulé"""
@@ -39,3 +57,109 @@ class RateLimiter:
         # Ajouter tokens basé sur le taux (rate/60 tokens par seconde)
         self.tokens = min(self.rate, self.tokens + (elapsed * self.rate / 60))
         self.last_update = now
+
+
+# Token bucket shared by every worker. Tokens may go negative: each caller
+# reserves the next token and gets back how long to wait (ms) before using
+# it. Time comes from the Redis server so worker clocks do not matter.
+#   KEYS[1]: bucket key
+#   ARGV[1]: capacity (burst), ARGV[2]: refill rate in tokens per ms,
+#   ARGV[3]: tokens taken by this call
+TOKEN_BUCKET_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3]) or 1
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1])
+local ts = tonumber(bucket[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - cost
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+
+local wait = 0
+if tokens < 0 then
+    wait = math.ceil(-tokens / rate)
+end
+redis.call('PEXPIRE', KEYS[1], wait + math.ceil(capacity / rate))
+return wait
+"""
+
+# Back off this long after a Redis error before trying it again
+REDIS_RETRY_AFTER = 30.0
+
+_redis = LoopRedisClients(socket_connect_timeout=1, socket_timeout=1)
+_unavailable_until = 0.0
+
+
+def _async_client() -> aioredis.Redis:
+    """Async client for the running event loop (connections are loop-bound)"""
+    return _redis.get()
+
+
+class DistributedRateLimiter:
+    """
+    Token bucket rate limiter shared through Redis, keyed by provider.
+
+    Same interface as RateLimiter (`async with limiter:`), but every
+    worker and every concurrent run draws from one bucket per provider,
+    so API limits hold globally. Falls back to an in-process bucket while
+    Redis is unreachable.
+
+    Args:
+        provider: Bucket name (e.g. "hackernews")
+        requests_per_minute: Nombre de tokens autorisés par minute (burst inclus);
+            usually requests, or API tokens when callers pass a cost to acquire()
+    """
+
+    def __init__(self, provider: str, requests_per_minute: int = 60):
+        self.provider = provider
+        self.rate = requests_per_minute
+        self.key = f"rate_limit:{provider}"
+        self._local = RateLimiter(requests_per_minute)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def acquire(self, cost: float = 1) -> None:
+        """Reserve `cost` tokens (e.g. API tokens of a request) and wait until they are available"""
+        wait = await self._reserve(cost)
+        if wait is None:
+            await self._local.acquire(cost)
+        elif wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _reserve(self, cost: float = 1) -> Optional[float]:
+        """
+        Reserve tokens in the shared bucket
+
+        Args:
+            cost: Number of tokens to take
+
+        Returns:
+            Seconds to wait before using it, or None if Redis is unavailable
+        """
+        global _unavailable_until
+        if time.monotonic() < _unavailable_until:
+            return None
+
+        try:
+            wait_ms = await _async_client().eval(
+                TOKEN_BUCKET_SCRIPT, 1, self.key, self.rate, self.rate / 60000, cost
+            )
+        except (RedisError, OSError) as e:
+            _unavailable_until = time.monotonic() + REDIS_RETRY_AFTER
+            logger.warning(f"Rate limiter Redis unavailable ({e}), using local bucket for {self.provider}")
+            return None
+
+        return int(wait_ms) / 1000
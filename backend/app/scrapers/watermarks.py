@@ -0,0 +1,89 @@
+"""
+Incremental scraping watermarks.
+
+Each source remembers the newest item it has seen (source_watermarks).
+Incremental runs hand that position to the plugin, which fetches and
+returns only newer items; every SCRAPING_FULL_REFRESH_HOURS a full run
+re-reads everything so changing counters (points, upvotes, views) are
+refreshed.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.source_watermark import SourceWatermark
+
+
+@dataclass(frozen=True)
+class ScrapeWatermark:
+    """Position reached by the previous scrape of a source"""
+    published_at: Optional[datetime] = None  # Newest published_at seen (naive UTC)
+    external_id: Optional[str] = None  # Highest external ID seen (monotonic IDs only)
+
+
+def to_utc_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalize a datetime to naive UTC (the articles.published_at convention)"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def load_watermark(
+    db: Session,
+    source_id: int,
+    now: Optional[datetime] = None
+) -> Tuple[Optional[ScrapeWatermark], bool]:
+    """
+    Load the watermark of a source
+
+    Args:
+        db: Database session
+        source_id: Source ID
+        now: Reference time (defaults to utcnow)
+
+    Returns:
+        Tuple of (stored watermark or None, whether a full refresh is due)
+    """
+    now = now or datetime.utcnow()
+    row = db.query(SourceWatermark).filter_by(source_id=source_id).first()
+    if row is None:
+        return None, True
+
+    watermark = ScrapeWatermark(published_at=row.last_published_at, external_id=row.last_external_id)
+    full_refresh_due = (
+        row.last_full_scrape_at is None
+        or now - row.last_full_scrape_at >= timedelta(hours=settings.SCRAPING_FULL_REFRESH_HOURS)
+        or watermark.published_at is None
+    )
+    return watermark, full_refresh_due
+
+
+def save_watermark(
+    db: Session,
+    source_id: int,
+    watermark: ScrapeWatermark,
+    full_refresh: bool,
+    now: Optional[datetime] = None
+) -> None:
+    """
+    Store the watermark of a source (does not commit)
+
+    Args:
+        db: Database session
+        source_id: Source ID
+        watermark: New position
+        full_refresh: Whether this run was a full refresh
+        now: Reference time (defaults to utcnow)
+    """
+    row = db.query(SourceWatermark).filter_by(source_id=source_id).first()
+    if row is None:
+        row = SourceWatermark(source_id=source_id)
+        db.add(row)
+
+    row.last_published_at = watermark.published_at
+    row.last_external_id = watermark.external_id
+    if full_refresh:
+        row.last_full_scrape_at = now or datetime.utcnow()
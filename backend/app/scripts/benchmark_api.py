@@ -0,0 +1,125 @@
+"""
+Load benchmark for the read API
+
+Fires concurrent GET requests at a running backend for a fixed duration
+and reports requests/second and latency percentiles per endpoint. Run it
+once against the sync-session build and once against the async-session
+build (same database, same worker count) to compare. Recorded runs:
+docs/async-read-endpoints-benchmark.md
+
+Usage:
+    python -m app.scripts.benchmark_api --base-url http://localhost:8000
+    # or
+    poetry run python -m app.scripts.benchmark_api -c 100 -d 30 /api/articles /api/analytics/summary
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+import httpx
+
+DEFAULT_ENDPOINTS = [
+    "/api/articles?limit=20",
+    "/api/articles/best-of-week",
+    "/api/videos?limit=20",
+    "/api/analytics/summary",
+    "/api/analytics/daily-stats?days=30",
+    "/api/comments/article/1",
+]
+
+
+async def _worker(client: httpx.AsyncClient, path: str, deadline: float,
+                  latencies: List[float], errors: List[int]):
+    """Send requests back to back until the deadline"""
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+        except httpx.HTTPError:
+            errors.append(0)
+        latencies.append(time.perf_counter() - start)
+
+
+async def benchmark_endpoint(base_url: str, path: str, concurrency: int, duration: float) -> Dict:
+    """
+    Benchmark one endpoint
+
+    Args:
+        base_url: Backend URL
+        path: Endpoint path (with query string)
+        concurrency: Number of concurrent connections
+        duration: Duration in seconds
+
+    Returns:
+        Dict with requests, errors, rps and p50/p95/p99 latencies (ms)
+    """
+    latencies: List[float] = []
+    errors: List[int] = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        # Warm up connections and caches
+        await asyncio.gather(*[client.get(path) for _ in range(min(concurrency, 10))],
+                             return_exceptions=True)
+
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(*[
+            _worker(client, path, deadline, latencies, errors) for _ in range(concurrency)
+        ])
+        elapsed = time.perf_counter() - start
+
+    if not latencies:
+        return {'path': path, 'requests': 0, 'errors': len(errors), 'rps': 0.0,
+                'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        'path': path,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'rps': len(latencies) / elapsed,
+        'p50': quantiles[49] * 1000,
+        'p95': quantiles[94] * 1000,
+        'p99': quantiles[98] * 1000,
+    }
+
+
+async def run(base_url: str, endpoints: List[str], concurrency: int, duration: float):
+    """Benchmark endpoints one after another and print a report"""
+    print(f"\n📊 {base_url} - {concurrency} connections, {duration:.0f}s per endpoint")
+    print("-" * 88)
+    print(f"{'endpoint':<42}{'req/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>9}")
+    print("-" * 88)
+
+    total_requests = 0
+    for path in endpoints:
+        result = await benchmark_endpoint(base_url, path, concurrency, duration)
+        total_requests += result['requests']
+        print(
+            f"{result['path']:<42}{result['rps']:>10.1f}{result['p50']:>9.1f}"
+            f"{result['p95']:>9.1f}{result['p99']:>9.1f}{result['errors']:>9}"
+        )
+
+    print("-" * 88)
+    print(f"{'total requests':<42}{total_requests:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load benchmark for the read API")
+    parser.add_argument("endpoints", nargs="*", default=DEFAULT_ENDPOINTS)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("-c", "--concurrency", type=int, default=50)
+    parser.add_argument("-d", "--duration", type=float, default=15.0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.base_url, args.endpoints, args.concurrency, args.duration))
+
+
+if __name__ == "__main__":
+    main()
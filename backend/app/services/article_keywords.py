@@ -0,0 +1,95 @@
+"""
+Article <-> keyword links (article_keywords).
+
+Written by the scoring tasks for every scored article so that trend
+detection and "articles for keyword X" are index lookups on
+(keyword_id, article_id) instead of substring scans over article text.
+"""
+from typing import Dict, List, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+
+from app.models.article import Article
+from app.models.article_keyword import ArticleKeyword
+from app.models.keyword import Keyword
+from app.services.user_scoring import FIELD_BOOSTS
+from app.utils.keyword_matcher import get_matcher
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Rows per INSERT / article ids per DELETE
+LINK_CHUNK_SIZE = 1000
+
+
+class ArticleKeywordService:
+    """Service maintaining article_keywords."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def link_articles(self, articles: Sequence[Article], keywords: Sequence[Keyword]) -> int:
+        """
+        Replace the keyword links of articles in bulk.
+
+        relevance_score = keyword weight x boost of the strongest field the
+        keyword appears in (same boosts as personalized scoring). Does not
+        commit.
+
+        Args:
+            articles: Articles to (re)link
+            keywords: Active keywords
+
+        Returns:
+            Number of links written
+        """
+        if not articles:
+            return 0
+
+        matcher = get_matcher(kw.keyword for kw in keywords)
+        rows: List[Dict] = []
+
+        for article in articles:
+            matched_fields = matcher.matched_fields(
+                title=article.title or '',
+                content=article.content or '',
+                summary=article.summary or '',
+                tags=' '.join(article.tags or [])
+            )
+            for i, fields in matched_fields.items():
+                keyword = keywords[i]
+                boost = max(FIELD_BOOSTS[field] for field in fields)
+                rows.append({
+                    'article_id': article.id,
+                    'keyword_id': keyword.id,
+                    'relevance_score': (keyword.weight or 1.0) * boost,
+                })
+
+        article_ids = [article.id for article in articles]
+        for i in range(0, len(article_ids), LINK_CHUNK_SIZE):
+            self.db.query(ArticleKeyword).filter(
+                ArticleKeyword.article_id.in_(article_ids[i:i + LINK_CHUNK_SIZE])
+            ).delete(synchronize_session=False)
+
+        for i in range(0, len(rows), LINK_CHUNK_SIZE):
+            self.db.execute(insert(ArticleKeyword.__table__), rows[i:i + LINK_CHUNK_SIZE])
+
+        logger.debug(f"Linked {len(article_ids)} articles to keywords ({len(rows)} links)")
+        return len(rows)
+
+
+def has_keyword(keyword_id: int) -> ColumnElement:
+    """
+    Filter on articles linked to a keyword
+
+    Args:
+        keyword_id: Keyword ID
+
+    Returns:
+        WHERE clause for an Article query (uses idx_article_keywords_keyword_article)
+    """
+    return Article.id.in_(
+        select(ArticleKeyword.article_id).where(ArticleKeyword.keyword_id == keyword_id)
+    )
@@ -0,0 +1,114 @@
+"""
+Full-text search for the `search` parameter of list endpoints.
+
+PostgreSQL: generated `articles.search_vector` tsvector column (title > author
+> content) with a GIN index, queried with prefix terms and ranked with
+ts_rank_cd; snippets come from ts_headline.
+SQLite (tests): external-content FTS5 table `articles_fts`, kept in sync by
+triggers (see app/models/article.py), ranked with bm25.
+"""
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Integer, column, func, literal_column, table
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Query
+from sqlalchemy.sql import ColumnElement
+
+from app.models.article import Article
+from app.models.comment import Comment
+
+# Text search configuration, inlined so expressions match the indexes
+TS_CONFIG = literal_column("'english'::regconfig")
+
+SNIPPET_START = "<mark>"
+SNIPPET_STOP = "</mark>"
+
+# Upper bound on terms per query (each one is a prefix match)
+MAX_TERMS = 8
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+_search_vector = literal_column("articles.search_vector", type_=TSVECTOR)
+_articles_fts = table("articles_fts", column("rowid", Integer))
+_fts_table_ref = literal_column("articles_fts")
+
+
+def search_terms(search: str) -> List[str]:
+    """
+    Split user input into search terms
+
+    Args:
+        search: Raw search string
+
+    Returns:
+        Lowercased word tokens (punctuation and operators dropped)
+    """
+    return [term.lower() for term in _TERM_RE.findall(search or "")][:MAX_TERMS]
+
+
+def _tsquery(terms: List[str]) -> ColumnElement:
+    """to_tsquery matching every term as a prefix ('rust':* & 'async':*)"""
+    return func.to_tsquery(TS_CONFIG, " & ".join(f"'{term}':*" for term in terms))
+
+
+def apply_article_search(
+    query: Query,
+    search: str,
+    dialect_name: str
+) -> Tuple[Query, Optional[ColumnElement], Optional[ColumnElement]]:
+    """
+    Restrict an Article query to full-text matches
+
+    Args:
+        query: Query selecting Article
+        search: Raw search string (every word must match, as a prefix)
+        dialect_name: Database dialect (db.get_bind().dialect.name)
+
+    Returns:
+        Tuple of (filtered query, rank expression, snippet expression);
+        rank and snippet are None when the input has no searchable word.
+        Higher rank = more relevant. Snippets highlight matches with <mark>.
+    """
+    terms = search_terms(search)
+    if not terms:
+        return query, None, None
+
+    if dialect_name == "postgresql":
+        tsquery = _tsquery(terms)
+        query = query.filter(_search_vector.op("@@")(tsquery))
+        rank = func.ts_rank_cd(_search_vector, tsquery)
+        snippet = func.ts_headline(
+            TS_CONFIG,
+            func.concat_ws(" ", Article.title, Article.content),
+            tsquery,
+            f"StartSel={SNIPPET_START}, StopSel={SNIPPET_STOP}, MaxFragments=2, MinWords=8, MaxWords=25"
+        )
+        return query, rank, snippet
+
+    # FTS5: implicit AND of quoted prefix terms
+    fts_query = " ".join(f'"{term}"*' for term in terms)
+    query = query.join(_articles_fts, _articles_fts.c.rowid == Article.id).filter(
+        _fts_table_ref.op("MATCH")(fts_query)
+    )
+    # bm25 is lower-is-better; column weights: title, content, author
+    rank = -func.bm25(_fts_table_ref, 10.0, 1.0, 5.0)
+    snippet = func.snippet(_fts_table_ref, -1, SNIPPET_START, SNIPPET_STOP, "…", 24)
+    return query, rank, snippet
+
+
+def comment_search_filter(search: str, dialect_name: str) -> ColumnElement:
+    """
+    Filter expression for full-text search in comment content
+
+    Args:
+        search: Raw search string
+        dialect_name: Database dialect
+
+    Returns:
+        WHERE clause (GIN expression index on PostgreSQL, ILIKE elsewhere)
+    """
+    terms = search_terms(search)
+    if dialect_name == "postgresql" and terms:
+        return func.to_tsvector(TS_CONFIG, Comment.content).op("@@")(_tsquery(terms))
+    return Comment.content.ilike(f"%{search}%")
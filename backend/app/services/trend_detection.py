@@ -0,0 +1,218 @@
+"""
+Set-based, incremental trend detection.
+
+Per-keyword daily aggregates (articles published that day and linked to
+the keyword in article_keywords at scoring time) are kept in
+keyword_daily_stats. Each run only recomputes the days that contain
+articles changed or relinked since the previous run (one INSERT ... SELECT),
+then rolls the window up into today's Trend rows with one bulk upsert.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, case, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.article import Article
+from app.models.article_keyword import ArticleKeyword
+from app.models.keyword import Keyword
+from app.models.keyword_daily_stat import KeywordDailyStat
+from app.models.trend import Trend
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Changed-article lookups reach back this far before the watermark, so rows
+# committed while the previous run was in progress are not missed
+WATERMARK_OVERLAP = timedelta(minutes=10)
+
+
+class TrendDetectionService:
+    """Service computing keyword trends from recent articles."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def detect(self, days: int = 7, full: bool = False, today: Optional[date] = None) -> Dict:
+        """
+        Refresh daily keyword stats and today's trends.
+
+        Args:
+            days: Window size in days (articles published since today - days)
+            full: Recompute every day of the window instead of changed days only
+            today: Reference day (defaults to date.today())
+
+        Returns:
+            Dict with mode, days_recomputed, stats_rows, trends_upserted
+            and keywords_analyzed
+        """
+        today = today or date.today()
+        start_date = today - timedelta(days=days)
+
+        keywords = self.db.query(Keyword).filter(Keyword.is_active == True).all()
+        stats = {
+            'mode': 'full',
+            'days_recomputed': 0,
+            'stats_rows': 0,
+            'trends_upserted': 0,
+            'keywords_analyzed': len(keywords),
+        }
+        if not keywords:
+            return stats
+
+        watermark = self.db.query(func.max(KeywordDailyStat.computed_at)).scalar()
+        keywords_changed = watermark is not None and self.db.query(Keyword.id).filter(
+            func.coalesce(Keyword.updated_at, Keyword.created_at) > watermark
+        ).first() is not None
+
+        if full or watermark is None or keywords_changed:
+            dirty_days = {start_date + timedelta(days=i) for i in range(days + 1)}
+            dirty_days |= self._changed_days(start_date, since=None)
+        else:
+            stats['mode'] = 'incremental'
+            dirty_days = self._changed_days(start_date, since=watermark - WATERMARK_OVERLAP)
+
+        if dirty_days:
+            stats['stats_rows'] = self._recompute_days(dirty_days)
+            stats['days_recomputed'] = len(dirty_days)
+
+        # Days that left the window are no longer needed
+        self.db.query(KeywordDailyStat).filter(
+            KeywordDailyStat.date < start_date
+        ).delete(synchronize_session=False)
+
+        stats['trends_upserted'] = self._upsert_trends(keywords, start_date, today)
+        self.db.commit()
+
+        logger.info(
+            f"Trend detection ({stats['mode']}): {stats['days_recomputed']} days recomputed, "
+            f"{stats['stats_rows']} keyword-days, {stats['trends_upserted']} trends"
+        )
+        return stats
+
+    def _changed_days(self, start_date: date, since: Optional[datetime]) -> Set[date]:
+        """Publication days (within the window) of articles changed or relinked since a time"""
+        query = self.db.query(func.date(Article.published_at)).filter(
+            Article.published_at >= datetime.combine(start_date, time.min)
+        )
+        if since is not None:
+            query = query.filter(or_(
+                Article.updated_at > since,
+                Article.id.in_(
+                    select(ArticleKeyword.article_id).where(ArticleKeyword.created_at > since)
+                )
+            ))
+
+        # SQLite returns DATE() as a string
+        return {
+            date.fromisoformat(day) if isinstance(day, str) else day
+            for (day,) in query.distinct()
+        }
+
+    def _recompute_days(self, days: Set[date]) -> int:
+        """
+        Rebuild keyword_daily_stats rows for the given days.
+
+        Aggregated in the database from article_keywords (one INSERT ... SELECT).
+
+        Returns:
+            Number of (keyword, day) rows written
+        """
+        day = func.date(Article.published_at)
+        day_ranges = or_(*[
+            and_(
+                Article.published_at >= datetime.combine(first, time.min),
+                Article.published_at < datetime.combine(last + timedelta(days=1), time.min)
+            )
+            for first, last in _day_ranges(days)
+        ])
+        aggregates = select(
+            Keyword.keyword,
+            day,
+            func.count(Article.id),
+            func.sum(func.coalesce(Article.score, 0.0))
+        ).select_from(ArticleKeyword).join(
+            Article, Article.id == ArticleKeyword.article_id
+        ).join(
+            Keyword, Keyword.id == ArticleKeyword.keyword_id
+        ).where(
+            day_ranges,
+            Keyword.is_active == True
+        ).group_by(Keyword.keyword, day)
+
+        self.db.query(KeywordDailyStat).filter(
+            KeywordDailyStat.date.in_(days)
+        ).delete(synchronize_session=False)
+
+        result = self.db.execute(
+            insert(KeywordDailyStat.__table__).from_select(
+                ['keyword', 'date', 'article_count', 'score_sum'], aggregates
+            )
+        )
+        return result.rowcount
+
+    def _upsert_trends(self, keywords: List[Keyword], start_date: date, today: date) -> int:
+        """Roll the window up into today's Trend rows (one statement)"""
+        by_keyword = {kw.keyword: kw for kw in keywords}
+        yesterday = today - timedelta(days=1)
+
+        window = self.db.query(
+            KeywordDailyStat.keyword,
+            func.sum(KeywordDailyStat.article_count).label('article_count'),
+            func.sum(KeywordDailyStat.score_sum).label('score_sum'),
+            func.sum(case(
+                (KeywordDailyStat.date == today, KeywordDailyStat.article_count),
+                (KeywordDailyStat.date == yesterday, -KeywordDailyStat.article_count),
+                else_=0
+            )).label('delta')
+        ).filter(
+            KeywordDailyStat.date >= start_date,
+            KeywordDailyStat.keyword.in_(list(by_keyword))
+        ).group_by(KeywordDailyStat.keyword)
+
+        rows = []
+        for keyword, article_count, score_sum, delta in window:
+            if not article_count:
+                continue
+            kw = by_keyword[keyword]
+            avg_score = score_sum / article_count
+            rows.append({
+                'keyword': keyword,
+                'category': kw.category,
+                # Simple formula: (article_count * keyword_weight * avg_score) / 10
+                'trend_score': (article_count * kw.weight * avg_score) / 10,
+                'article_count': article_count,
+                'article_count_delta': delta,
+                'date': today,
+            })
+
+        if not rows:
+            return 0
+
+        dialect = self.db.get_bind().dialect.name
+        upsert = sqlite_insert if dialect == 'sqlite' else pg_insert
+        stmt = upsert(Trend.__table__).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['keyword', 'date'],
+            set_={
+                'category': stmt.excluded.category,
+                'trend_score': stmt.excluded.trend_score,
+                'article_count': stmt.excluded.article_count,
+                'article_count_delta': stmt.excluded.article_count_delta,
+            }
+        )
+        self.db.execute(stmt)
+        return len(rows)
+
+
+def _day_ranges(days: Iterable[date]) -> List[Tuple[date, date]]:
+    """Merge days into (first, last) runs of consecutive days"""
+    ranges: List[Tuple[date, date]] = []
+    for day in sorted(days):
+        if ranges and day == ranges[-1][1] + timedelta(days=1):
+            ranges[-1] = (ranges[-1][0], day)
+        else:
+            ranges.append((day, day))
+    return ranges
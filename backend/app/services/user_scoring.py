@@ -4,17 +4,33 @@ Personalized article scoring service.
 Calculates relevance scores for articles based on each user's keywords.
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.models.article import Article
 from app.models.user_keyword import UserKeyword
 from app.models.user_article_score import UserArticleScore
+from app.utils.keyword_matcher import get_matcher
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Articles per match matrix (the score matrix is articles x users)
+ARTICLE_BATCH_SIZE = 500
+
+# Rows per upsert statement
+UPSERT_CHUNK_SIZE = 1000
+
+# Field boosts, strongest first (a keyword counts once, with its best field).
+# keyword_matches counts the same fields as the score, summary included.
+FIELD_BOOSTS = {'title': 2.0, 'tags': 1.5, 'content': 1.0, 'summary': 1.0}
+
 
 class UserScoringService:
     """Service for calculating personalized article scores."""
@@ -50,26 +66,29 @@ class UserScoringService:
             # No keywords = use global score
             return article.score or 0.0
 
-        # Build searchable text
-        text = f"{article.title or ''} {article.content or ''} {article.summary or ''}".lower()
-        tags_text = ' '.join(article.tags or []).lower()
-        full_text = f"{text} {tags_text}"
+        # One pass over every searchable field, hits tagged with their field
+        matched_fields = get_matcher(kw.keyword for kw in user_keywords).matched_fields(
+            title=article.title or '',
+            content=article.content or '',
+            summary=article.summary or '',
+            tags=' '.join(article.tags or [])
+        )
 
         total_score = 0.0
         total_weight = 0.0
         matches = 0
 
-        for kw in user_keywords:
-            keyword_lower = kw.keyword.lower()
+        for i, kw in enumerate(user_keywords):
             weight = kw.weight or 1.0
+            fields = matched_fields.get(i)
 
             # Check for keyword match
-            if keyword_lower in full_text:
+            if fields:
                 # Boost based on where keyword appears
                 boost = 1.0
-                if keyword_lower in (article.title or '').lower():
+                if 'title' in fields:
                     boost = 2.0  # Title match is more important
-                elif keyword_lower in tags_text:
+                elif 'tags' in fields:
                     boost = 1.5  # Tag match is also important
 
                 total_score += weight * boost * 20  # Base score per match
@@ -111,56 +130,182 @@ class UserScoringService:
         Returns:
             Number of articles scored
         """
-        # Get user's keywords
-        user_keywords = self.db.query(UserKeyword).filter(
-            UserKeyword.user_id == user_id,
-            UserKeyword.is_active == True
-        ).all()
-
-        if not user_keywords:
+        stats = self.score_articles_for_users([user_id], article_ids, limit)
+        if not stats['users']:
             logger.info(f"User {user_id} has no keywords, skipping scoring")
-            return 0
+        return stats['articles']
+
+    def score_articles_for_users(
+        self,
+        user_ids: Optional[List[int]] = None,
+        article_ids: Optional[List[int]] = None,
+        limit: int = 500
+    ) -> Dict[str, int]:
+        """
+        Score a set of articles for many users at once.
+
+        Same formula as score_article_for_user(), computed with matrices:
+        one article x keyword boost matrix per batch (one matcher pass per
+        article) times a user x keyword weight matrix, then one bulk upsert.
+
+        Args:
+            user_ids: Users to score for (all users with active keywords if None)
+            article_ids: Articles to score (recent articles missing a score for
+                at least one of the users if None)
+            limit: Max articles to score
+
+        Returns:
+            Dict with users, articles and scores (rows written) counts
+        """
+        stats = {'users': 0, 'articles': 0, 'scores': 0}
+
+        users, vocabulary, weights, counts = self._keyword_matrices(user_ids)
+        if not users:
+            return stats
+        stats['users'] = len(users)
 
-        # Get articles to score
-        query = self.db.query(Article)
+        query = self.db.query(
+            Article.id, Article.title, Article.content, Article.summary,
+            Article.tags, Article.score
+        )
         if article_ids:
             query = query.filter(Article.id.in_(article_ids))
         else:
-            # Score recent articles that don't have a score yet for this user
-            scored_ids = self.db.query(UserArticleScore.article_id).filter(
-                UserArticleScore.user_id == user_id
-            ).subquery()
-            query = query.filter(~Article.id.in_(scored_ids))
+            fully_scored = select(UserArticleScore.article_id).where(
+                UserArticleScore.user_id.in_(users)
+            ).group_by(UserArticleScore.article_id).having(func.count() >= len(users))
+            query = query.filter(~Article.id.in_(fully_scored), Article.duplicate_of_id.is_(None))
 
         articles = query.order_by(Article.published_at.desc()).limit(limit).all()
-
-        scored_count = 0
-        for article in articles:
-            score = self.score_article_for_user(article, user_id, user_keywords)
-
-            # Upsert score
-            existing = self.db.query(UserArticleScore).filter(
-                UserArticleScore.user_id == user_id,
-                UserArticleScore.article_id == article.id
-            ).first()
-
-            if existing:
-                existing.score = score
-                existing.scored_at = datetime.utcnow()
-            else:
-                user_score = UserArticleScore(
-                    user_id=user_id,
-                    article_id=article.id,
-                    score=score,
-                    keyword_matches=self._count_matches(article, user_keywords)
-                )
-                self.db.add(user_score)
-
-            scored_count += 1
+        if not articles:
+            return stats
+
+        matcher = get_matcher(vocabulary)
+        total_weight = np.asarray(weights.sum(axis=1)).ravel()
+        scored_at = datetime.utcnow()
+
+        for offset in range(0, len(articles), ARTICLE_BATCH_SIZE):
+            batch = articles[offset:offset + ARTICLE_BATCH_SIZE]
+            boosts = self._boost_matrix(batch, matcher, len(vocabulary))
+
+            # (articles x keywords) @ (keywords x users) -> articles x users
+            weighted = (boosts @ weights.T).toarray() * 20  # Base score per match
+            matches = ((boosts > 0).astype(np.float64) @ counts.T).toarray()
+            scores = self._final_scores(
+                weighted, matches, total_weight,
+                np.array([a.score if a.score is not None else np.nan for a in batch])
+            )
+
+            rows = [
+                {
+                    'user_id': user_id,
+                    'article_id': article.id,
+                    'score': float(scores[i, j]),
+                    'keyword_matches': int(matches[i, j]),
+                    'scored_at': scored_at,
+                }
+                for i, article in enumerate(batch)
+                for j, user_id in enumerate(users)
+            ]
+            self._upsert_scores(rows)
+            stats['scores'] += len(rows)
 
         self.db.commit()
-        logger.info(f"Scored {scored_count} articles for user {user_id}")
-        return scored_count
+        stats['articles'] = len(articles)
+        logger.info(
+            f"Scored {stats['articles']} articles for {stats['users']} users "
+            f"({stats['scores']} scores)"
+        )
+        return stats
+
+    def _keyword_matrices(
+        self,
+        user_ids: Optional[List[int]]
+    ) -> Tuple[List[int], List[str], sparse.csr_matrix, sparse.csr_matrix]:
+        """
+        Build user x keyword matrices from active user keywords.
+
+        Keywords are deduplicated case-insensitively across users; a user with
+        the same keyword twice gets both weights (and counts) summed.
+
+        Returns:
+            Tuple of (user ids, keyword vocabulary, weight matrix, count matrix)
+        """
+        query = self.db.query(UserKeyword.user_id, UserKeyword.keyword, UserKeyword.weight).filter(
+            UserKeyword.is_active == True
+        )
+        if user_ids is not None:
+            query = query.filter(UserKeyword.user_id.in_(user_ids))
+
+        user_index: Dict[int, int] = {}
+        keyword_index: Dict[str, int] = {}
+        rows, cols, values = [], [], []
+        for user_id, keyword, weight in query.order_by(UserKeyword.user_id):
+            rows.append(user_index.setdefault(user_id, len(user_index)))
+            cols.append(keyword_index.setdefault(keyword.lower(), len(keyword_index)))
+            values.append(weight or 1.0)
+
+        shape = (len(user_index), len(keyword_index))
+        # COO -> CSR sums duplicate (user, keyword) entries
+        weights = sparse.coo_matrix((values, (rows, cols)), shape=shape).tocsr()
+        counts = sparse.coo_matrix((np.ones(len(values)), (rows, cols)), shape=shape).tocsr()
+        return list(user_index), list(keyword_index), weights, counts
+
+    def _boost_matrix(self, articles: Sequence, matcher, n_keywords: int) -> sparse.csr_matrix:
+        """Article x keyword matrix of the best field boost per match (0 = no match)"""
+        best: Dict[Tuple[int, int], float] = {}
+        for i, article in enumerate(articles):
+            for hit in matcher.find(
+                title=article.title or '',
+                content=article.content or '',
+                summary=article.summary or '',
+                tags=' '.join(article.tags or [])
+            ):
+                key = (i, hit.index)
+                best[key] = max(best.get(key, 0.0), FIELD_BOOSTS[hit.field])
+
+        if not best:
+            return sparse.csr_matrix((len(articles), n_keywords))
+        (rows, cols), values = zip(*best.keys()), list(best.values())
+        return sparse.csr_matrix((values, (rows, cols)), shape=(len(articles), n_keywords))
+
+    @staticmethod
+    def _final_scores(
+        weighted: np.ndarray,
+        matches: np.ndarray,
+        total_weight: np.ndarray,
+        global_scores: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized version of the score_article_for_user() formula"""
+        raw = np.divide(
+            weighted, total_weight,
+            out=np.zeros_like(weighted), where=total_weight != 0
+        ) + np.minimum(matches * 5, 25)
+
+        # Blend with global score (20% global, 80% personalized)
+        blend_global = np.nan_to_num(global_scores, nan=50.0)[:, None]
+        matched = np.clip(raw * 0.8 + blend_global * 0.2, 0, 100)
+
+        # No matches - 30% of global score
+        unmatched = np.maximum(0, np.nan_to_num(global_scores, nan=0.0) * 0.3)[:, None]
+        return np.where(matches > 0, matched, unmatched)
+
+    def _upsert_scores(self, rows: List[Dict]) -> None:
+        """Insert or update (user_id, article_id) scores in bulk"""
+        dialect = self.db.get_bind().dialect.name
+        insert = sqlite_insert if dialect == 'sqlite' else pg_insert
+
+        for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            stmt = insert(UserArticleScore.__table__).values(rows[i:i + UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['user_id', 'article_id'],
+                set_={
+                    'score': stmt.excluded.score,
+                    'keyword_matches': stmt.excluded.keyword_matches,
+                    'scored_at': stmt.excluded.scored_at,
+                }
+            )
+            self.db.execute(stmt)
 
     def rescore_user_articles(self, user_id: int) -> int:
         """
@@ -189,11 +334,6 @@ class UserScoringService:
         ).first()
         return score.score if score else None
 
-    def _count_matches(self, article: Article, keywords: List[UserKeyword]) -> int:
-        """Count how many keywords match an article."""
-        text = f"{article.title or ''} {article.content or ''} {' '.join(article.tags or [])}".lower()
-        return sum(1 for kw in keywords if kw.keyword.lower() in text)
-
 
 def score_new_articles_for_all_users(db: Session) -> dict:
     """
@@ -203,25 +343,15 @@ def score_new_articles_for_all_users(db: Session) -> dict:
     Returns:
         Dict with stats
     """
-    from app.models.user import User
-
-    # Get users with keywords
-    users_with_keywords = db.query(User.id).join(UserKeyword).distinct().all()
-    user_ids = [u[0] for u in users_with_keywords]
+    # One pass over the new articles for every user with active keywords
+    stats = UserScoringService(db).score_articles_for_users()
 
-    if not user_ids:
+    if not stats['users']:
         logger.info("No users with keywords found")
         return {"users": 0, "articles_scored": 0}
 
-    service = UserScoringService(db)
-    total_scored = 0
-
-    for user_id in user_ids:
-        scored = service.score_articles_for_user(user_id)
-        total_scored += scored
-
-    logger.info(f"Scored articles for {len(user_ids)} users, total {total_scored} scores")
+    logger.info(f"Scored articles for {stats['users']} users, total {stats['scores']} scores")
     return {
-        "users": len(user_ids),
-        "articles_scored": total_scored
+        "users": stats['users'],
+        "articles_scored": stats['scores']
     }
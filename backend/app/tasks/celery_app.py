@@ -1,6 +1,8 @@
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_shutdown, worker_shutdown
 from app.config import settings
+from app.tasks.event_loop import shutdown_worker_loop
 
 # Create Celery app
 celery_app = Celery(
@@ -28,6 +30,11 @@ celery_app.conf.update(
     worker_max_tasks_per_child=1000,
 )
 
+# Close pooled HTTP clients and the async task loop when a worker process
+# exits (prefork children) or the worker stops (solo / threads pools)
+worker_process_shutdown.connect(shutdown_worker_loop, weak=False)
+worker_shutdown.connect(shutdown_worker_loop, weak=False)
+
 # Celery Beat schedule - Automated periodic tasks
 celery_app.conf.beat_schedule = {
     'scrape-youtube-trending-every-6-hours': {
@@ -65,6 +72,10 @@ celery_app.conf.beat_schedule = {
             'article_ids': None  # Score all unscored articles
         },
     },
+    'refresh-tfidf-model-hourly': {
+        'task': 'refresh_tfidf_model',
+        'schedule': crontab(minute=10),  # Every hour at :10 (before scoring)
+    },
     'summarize-new-articles-daily': {
         'task': 'summarize_articles',
         'schedule': crontab(hour=9, minute=0),  # Daily at 09:00
@@ -75,9 +86,20 @@ celery_app.conf.beat_schedule = {
             'expires': 7200,  # Task expires after 2 hours
         }
     },
-    'detect-trends-daily': {
+    'collect-summary-batches': {
+        'task': 'collect_summary_batches',
+        'schedule': crontab(minute='*/30'),  # Every 30 min (no-op unless SUMMARY_USE_BATCHES)
+    },
+    'detect-trends-hourly': {
         'task': 'detect_trends',
-        'schedule': crontab(hour=10, minute=0),  # Daily at 10:00 (after scoring)
+        'schedule': crontab(minute=20),  # Hourly at :20, incremental (changed days only)
+    },
+    'detect-trends-full-daily': {
+        'task': 'detect_trends',
+        'schedule': crontab(hour=10, minute=0),  # Daily at 10:00, full window (picks up deletions)
+        'kwargs': {
+            'full': True
+        },
     },
     'cleanup-old-trends-weekly': {
         'task': 'cleanup_old_trends',
@@ -0,0 +1,49 @@
+"""
+Per-process event loop for async Celery tasks.
+
+asyncio.run() creates and closes a loop per task, which throws away
+every connection pool bound to it (the shared scraper HTTP client among
+them). Tasks run their coroutines on one long-lived loop per worker
+process instead; the worker shutdown signals close it.
+"""
+import asyncio
+from typing import Any, Coroutine, Optional, TypeVar
+
+from app.scrapers.http_client import http_clients
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the worker loop (created on first use, after fork)
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(coro)
+
+
+def shutdown_worker_loop(**kwargs) -> None:
+    """Close the shared HTTP clients and the worker loop (Celery shutdown signal handler)"""
+    global _loop
+    http_clients.close()
+
+    if _loop is not None and not _loop.is_closed():
+        try:
+            _loop.run_until_complete(_loop.shutdown_asyncgens())
+        finally:
+            _loop.close()
+            logger.info("Worker event loop closed")
+    _loop = None
@@ -2,14 +2,30 @@
 Celery tasks for article scoring
 """
 
+from datetime import datetime, timedelta, timezone
+
+import redis
+
 from app.tasks.celery_app import celery_app
+from app.tasks.event_loop import run_async
+from app.config import settings
 from app.database import SessionLocal
 from app.models import Article, Keyword
-from app.nlp import ArticleScorer, ArticleSummarizer
+from app.nlp import ArticleSummarizer, get_scorer
+from app.nlp.summary_cache import SummaryCache, summary_cache_key
+from app.nlp.tfidf_model import CorpusTfidfModel, load_tfidf_model
+from app.services.article_keywords import ArticleKeywordService
 from app.utils.logger import get_logger
+from app.utils.response_cache import TAG_ARTICLES, invalidate_tags
 
 logger = get_logger(__name__)
 
+# Redis set of submitted Message Batches waiting for collect_summary_batches
+SUMMARY_BATCHES_KEY = "summaries:pending_batches"
+SUMMARY_MAX_WORDS = 200
+
+_batches_client: redis.Redis | None = None
+
 
 @celery_app.task(name="score_articles")
 def score_articles(article_ids: list[int] = None):
@@ -47,24 +63,28 @@ def score_articles(article_ids: list[int] = None):
         else:
             # Score articles without score or with score = 0
             articles = db.query(Article).filter(
-                (Article.score == None) | (Article.score == 0)
+                (Article.score == None) | (Article.score == 0),
+                Article.duplicate_of_id.is_(None)  # Each story is scored once (canonical article)
             ).limit(500).all()  # Process up to 500 articles at a time
 
         if not articles:
             logger.info("No articles to score")
             return {"status": "success", "articles_scored": 0}
 
-        # Initialize scorer
-        scorer = ArticleScorer(language="en")  # TODO: detect language per article
+        # Worker-lifetime scorer (spaCy model loaded once per process)
+        scorer = get_scorer("en")  # TODO: detect language per article
+
+        # Batched through nlp.pipe, results come back in article order
+        results = scorer.score_batch(
+            (f"{article.title} {article.content or ''}" for article in articles),
+            keyword_data,
+            batch_size=settings.SCORING_BATCH_SIZE,
+            n_process=settings.SCORING_N_PROCESS
+        )
 
         scored_count = 0
-        for article in articles:
+        for article, result in zip(articles, results):
             try:
-                text = f"{article.title} {article.content or ''}"
-
-                # Score article
-                result = scorer.score_article(text, keyword_data)
-
                 # Update article - Convert NumPy types to Python natives
                 article.score = float(result["overall_score"])
                 article.category = str(result["category"])
@@ -78,8 +98,12 @@ def score_articles(article_ids: list[int] = None):
                 logger.error(f"Error scoring article {article.id}: {e}")
                 continue
 
+        # Per-keyword relevance, used by trends and keyword filters
+        links = ArticleKeywordService(db).link_articles(articles, keywords)
+
         db.commit()
-        logger.info(f"Scoring complete: {scored_count} articles scored")
+        invalidate_tags(TAG_ARTICLES)
+        logger.info(f"Scoring complete: {scored_count} articles scored, {links} keyword links")
 
         return {
             "status": "success",
@@ -128,13 +152,11 @@ def rescore_all_articles(force_all: bool = True):
 
         logger.info(f"Rescoring with {len(keyword_data)} active keywords")
 
-        # Fetch all articles
-        if force_all:
-            articles = db.query(Article).all()
-        else:
-            articles = db.query(Article).filter(
-                (Article.score == None) | (Article.score == 0)
-            ).all()
+        # Fetch all articles (near-duplicates are never scored)
+        query = db.query(Article).filter(Article.duplicate_of_id.is_(None))
+        if not force_all:
+            query = query.filter((Article.score == None) | (Article.score == 0))
+        articles = query.all()
 
         if not articles:
             logger.info("No articles to rescore")
@@ -142,17 +164,20 @@ def rescore_all_articles(force_all: bool = True):
 
         logger.info(f"Rescoring {len(articles)} articles...")
 
-        # Initialize scorer
-        scorer = ArticleScorer(language="en")
+        # Worker-lifetime scorer (spaCy model loaded once per process)
+        scorer = get_scorer("en")
+
+        # Batched through nlp.pipe, results come back in article order
+        results = scorer.score_batch(
+            (f"{article.title} {article.content or ''}" for article in articles),
+            keyword_data,
+            batch_size=settings.SCORING_BATCH_SIZE,
+            n_process=settings.SCORING_N_PROCESS
+        )
 
         scored_count = 0
-        for article in articles:
+        for article, result in zip(articles, results):
             try:
-                text = f"{article.title} {article.content or ''}"
-
-                # Score article
-                result = scorer.score_article(text, keyword_data)
-
                 # Update article
                 article.score = float(result["overall_score"])
                 article.category = str(result["category"])
@@ -167,8 +192,12 @@ def rescore_all_articles(force_all: bool = True):
                 logger.error(f"Error scoring article {article.id}: {e}")
                 continue
 
+        # Per-keyword relevance, used by trends and keyword filters
+        links = ArticleKeywordService(db).link_articles(articles, keywords)
+
         db.commit()
-        logger.info(f"Rescore complete: {scored_count} articles rescored")
+        invalidate_tags(TAG_ARTICLES)
+        logger.info(f"Rescore complete: {scored_count} articles rescored, {links} keyword links")
 
         return {
             "status": "success",
@@ -186,68 +215,191 @@ def rescore_all_articles(force_all: bool = True):
         db.close()
 
 
+def _article_texts(query):
+    """Stream (id, text) pairs without loading ORM objects"""
+    for article_id, title, content in query.yield_per(1000):
+        yield article_id, f"{title} {content or ''}"
+
+
+@celery_app.task(name="refresh_tfidf_model")
+def refresh_tfidf_model(full_refit: bool = False):
+    """
+    Fit or update the corpus TF-IDF model used by the scorer
+
+    Args:
+        full_refit: Rebuild vocabulary from the whole corpus even if the model is recent
+
+    Returns:
+        Dict avec statistiques
+
+    Logic:
+        - No model, full_refit, or model older than TFIDF_FULL_REFIT_DAYS: fit on all articles
+        - Otherwise: fold articles added since the last run into the document frequencies
+        - Model file is replaced atomically; workers reload it on their next scoring call
+    """
+    db = SessionLocal()
+    path = settings.TFIDF_MODEL_PATH
+
+    try:
+        model = None if full_refit else load_tfidf_model(path)
+        max_age = timedelta(days=settings.TFIDF_FULL_REFIT_DAYS)
+        if model is not None and datetime.now(timezone.utc) - model.fitted_at > max_age:
+            model = None
+
+        query = db.query(Article.id, Article.title, Article.content).order_by(Article.id)
+        last_id = 0
+
+        if model is None:
+            ids = []
+
+            def texts():
+                for article_id, text in _article_texts(query):
+                    ids.append(article_id)
+                    yield text
+
+            model = CorpusTfidfModel.fit(texts())
+            model.last_article_id = ids[-1] if ids else 0
+            mode, documents = "full", model.n_docs
+        else:
+            rows = list(_article_texts(query.filter(Article.id > model.last_article_id)))
+            if rows:
+                last_id = rows[-1][0]
+            documents = model.partial_fit([text for _, text in rows], last_id)
+            mode = "incremental"
+
+        model.save(path)
+        logger.info(f"TF-IDF model refreshed ({mode}): {documents} documents, {model.n_docs} total")
+
+        return {
+            "status": "success",
+            "mode": mode,
+            "documents_added": documents,
+            "total_documents": model.n_docs,
+            "vocabulary_size": len(model.doc_freq)
+        }
+
+    except ValueError as e:
+        # Empty corpus (or only stop words): nothing to fit yet
+        logger.warning(f"TF-IDF model not fitted: {e}")
+        return {"status": "skipped", "reason": str(e)}
+
+    except Exception as e:
+        logger.error(f"Error in refresh_tfidf_model task: {e}")
+        return {"status": "error", "error": str(e)}
+
+    finally:
+        db.close()
+
+
 @celery_app.task(name="summarize_articles")
-def summarize_articles(article_ids: list[int] = None):
+def summarize_articles(article_ids: list[int] = None, use_batches: bool = None):
     """
     Génère des résumés IA pour les articles
 
     Args:
         article_ids: Liste d'IDs d'articles à résumer (si None, résume les non-résumés)
+        use_batches: Soumet le backlog à l'API Message Batches au lieu d'appels directs
+            (défaut: SUMMARY_USE_BATCHES; ignoré si article_ids est fourni)
 
     Returns:
         Dict avec statistiques
     """
+    if use_batches is None:
+        use_batches = settings.SUMMARY_USE_BATCHES
+    use_batches = use_batches and not article_ids
+
     db = SessionLocal()
 
     try:
+        # Initialize summarizer
+        summarizer = ArticleSummarizer()
+
+        if not summarizer.client:
+            logger.warning("Claude API not configured - skipping summarization")
+            return {"status": "skipped", "reason": "no_api_key"}
+
+        if use_batches and _pending_batches().scard(SUMMARY_BATCHES_KEY):
+            # Same backlog would be submitted twice: wait for collect_summary_batches
+            logger.info("Summary batch still pending - skipping submission")
+            return {"status": "skipped", "reason": "batch_pending"}
+
         # Fetch articles to summarize
         if article_ids:
             articles = db.query(Article).filter(Article.id.in_(article_ids)).all()
         else:
             # Summarize articles without summary
+            limit = settings.SUMMARY_BATCH_MAX_ARTICLES if use_batches else settings.SUMMARY_MAX_ARTICLES
             articles = db.query(Article).filter(
                 Article.summary == None,
-                Article.content.isnot(None)
-            ).limit(50).all()  # Limit to avoid API quota
+                Article.content.isnot(None),
+                Article.duplicate_of_id.is_(None)  # Near-duplicates share the canonical summary
+            ).limit(limit).all()  # Limit to avoid API quota
 
         if not articles:
             logger.info("No articles to summarize")
             return {"status": "success", "articles_summarized": 0}
 
-        # Initialize summarizer
-        summarizer = ArticleSummarizer()
-
-        if not summarizer.client:
-            logger.warning("Claude API not configured - skipping summarization")
-            return {"status": "skipped", "reason": "no_api_key"}
-
-        summarized_count = 0
+        # Cached summaries first, then one request per distinct content
+        # (syndicated copies of a post share the same summary)
+        cache = SummaryCache(db)
+        keys = {
+            article.id: summary_cache_key(article.content, summarizer.model, SUMMARY_MAX_WORDS)
+            for article in articles
+            if article.content
+        }
+        summaries_by_key = cache.get_many(keys.values())
+        pending = {}
         for article in articles:
-            try:
-                # Synchronous call - Anthropic SDK handles async internally
-                summary = summarizer.summarize_sync(
-                    article.title,
-                    article.content,
-                    max_length=200
-                )
+            key = keys.get(article.id)
+            if key and key not in summaries_by_key:
+                pending.setdefault(key, article)
+        cache_hits = len(keys) - len(pending)
+
+        payload = [
+            {"id": str(article.id), "title": article.title, "content": article.content}
+            for article in pending.values()
+        ]
 
-                if summary:
-                    article.summary = summary
-                    summarized_count += 1
+        if use_batches:
+            summarized_count = _apply_summaries(articles, _summaries_by_article(keys, summaries_by_key))
+            db.commit()
+            batch_id = run_async(summarizer.submit_batch(payload, max_length=SUMMARY_MAX_WORDS)) if payload else None
+            if batch_id:
+                _pending_batches().sadd(SUMMARY_BATCHES_KEY, batch_id)
+            cache.record(hits=cache_hits, misses=len(pending))
+            if summarized_count:
+                invalidate_tags(TAG_ARTICLES)
+            return {
+                "status": "submitted",
+                "batch_id": batch_id,
+                "articles_submitted": len(payload),
+                "articles_summarized": summarized_count,
+                "cache_hits": cache_hits,
+                "total_articles": len(articles)
+            }
 
-                if summarized_count % 5 == 0:
-                    logger.info(f"Summarized {summarized_count}/{len(articles)} articles")
+        if payload:
+            generated = run_async(summarizer.summarize_batch(payload, max_length=SUMMARY_MAX_WORDS))
+            new_summaries = {key: generated.get(str(article.id)) for key, article in pending.items()}
+            cache.set_many(new_summaries, summarizer.model)
+            summaries_by_key.update({key: summary for key, summary in new_summaries.items() if summary})
 
-            except Exception as e:
-                logger.error(f"Error summarizing article {article.id}: {e}")
-                continue
+        summarized_count = _apply_summaries(articles, _summaries_by_article(keys, summaries_by_key))
+        cache.record(hits=cache_hits, misses=len(pending))
 
         db.commit()
-        logger.info(f"Summarization complete: {summarized_count} articles summarized")
+        if summarized_count:
+            invalidate_tags(TAG_ARTICLES)
+        logger.info(
+            f"Summarization complete: {summarized_count} articles summarized "
+            f"({cache_hits} from cache, {len(pending)} API requests)"
+        )
 
         return {
             "status": "success",
             "articles_summarized": summarized_count,
+            "cache_hits": cache_hits,
+            "api_requests": len(pending),
             "total_articles": len(articles)
         }
 
@@ -258,3 +410,90 @@ def summarize_articles(article_ids: list[int] = None):
 
     finally:
         db.close()
+
+
+@celery_app.task(name="collect_summary_batches")
+def collect_summary_batches():
+    """
+    Enregistre les résumés des batches terminés (soumis par summarize_articles)
+
+    Returns:
+        Dict avec statistiques
+    """
+    store = _pending_batches()
+    batch_ids = store.smembers(SUMMARY_BATCHES_KEY)
+    if not batch_ids:
+        return {"status": "success", "batches_collected": 0, "articles_summarized": 0}
+
+    db = SessionLocal()
+
+    try:
+        summarizer = ArticleSummarizer()
+        if not summarizer.client:
+            logger.warning("Claude API not configured - skipping batch collection")
+            return {"status": "skipped", "reason": "no_api_key"}
+
+        cache = SummaryCache(db)
+        collected = 0
+        summarized_count = 0
+        for batch_id in batch_ids:
+            summaries = run_async(summarizer.fetch_batch_results(batch_id))
+            if summaries is None:
+                continue  # Still processing
+
+            articles = db.query(Article).filter(
+                Article.id.in_([int(article_id) for article_id in summaries]),
+                Article.summary == None
+            ).all()
+            summarized_count += _apply_summaries(articles, summaries)
+            cache.set_many({
+                summary_cache_key(article.content, summarizer.model, SUMMARY_MAX_WORDS): summaries[str(article.id)]
+                for article in articles
+                if article.content
+            }, summarizer.model)
+            db.commit()
+            store.srem(SUMMARY_BATCHES_KEY, batch_id)
+            collected += 1
+
+        if summarized_count:
+            invalidate_tags(TAG_ARTICLES)
+        logger.info(f"Collected {collected} summary batches: {summarized_count} articles summarized")
+
+        return {
+            "status": "success",
+            "batches_collected": collected,
+            "batches_pending": len(batch_ids) - collected,
+            "articles_summarized": summarized_count
+        }
+
+    except Exception as e:
+        logger.error(f"Error in collect_summary_batches task: {e}")
+        db.rollback()
+        return {"status": "error", "error": str(e)}
+
+    finally:
+        db.close()
+
+
+def _apply_summaries(articles: list[Article], summaries: dict[str, str]) -> int:
+    """Copie les résumés générés sur les articles, retourne le nombre d'articles mis à jour"""
+    count = 0
+    for article in articles:
+        summary = summaries.get(str(article.id))
+        if summary:
+            article.summary = summary
+            count += 1
+    return count
+
+
+def _summaries_by_article(keys: dict[int, str], summaries_by_key: dict[str, str]) -> dict[str, str]:
+    """Résumés indexés par ID d'article (format de _apply_summaries)"""
+    return {str(article_id): summaries_by_key[key] for article_id, key in keys.items() if key in summaries_by_key}
+
+
+def _pending_batches() -> redis.Redis:
+    """Redis client holding the IDs of submitted, not yet collected summary batches"""
+    global _batches_client
+    if _batches_client is None:
+        _batches_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _batches_client
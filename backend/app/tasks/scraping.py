@@ -1,14 +1,18 @@
-from typing import List, Dict, Optional, Any
+import asyncio
+from typing import AsyncIterator, List, Dict, Optional, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
 import redis.asyncio as redis
 from app.tasks.celery_app import celery_app
-from app.database import get_db
+from app.tasks.event_loop import run_async
+from app.database import SessionLocal, get_db
 from app.models.source import Source
 from app.models.keyword import Keyword
 from app.models.scraping_run import ScrapingRun
 from app.scrapers.registry import ScraperRegistry
-from app.scrapers.storage import save_articles
+from app.scrapers.base import ScraperPlugin
+from app.scrapers.storage import ArticleSink, save_articles
+from app.scrapers.watermarks import load_watermark, save_watermark
 from app.utils.logger import get_logger
 from app.config import settings
 
@@ -180,12 +184,11 @@ def scrape_youtube_trending(self, config: Dict[str, Any] = None, run_scoring: bo
         # With custom config
         result = scrape_youtube_trending.delay({'region_code': 'GB', 'max_results': 25})
     """
-    import asyncio
     from app.tasks.scoring import score_articles
 
     db = next(get_db())
     try:
-        result = asyncio.run(
+        result = run_async(
             scrape_youtube_trending_async(
                 db=db,
                 config=config,
@@ -203,10 +206,172 @@ def scrape_youtube_trending(self, config: Dict[str, Any] = None, run_scoring: bo
         db.close()
 
 
+async def _article_stream(
+    scraper,
+    config: Dict,
+    keywords: List[str]
+) -> AsyncIterator:
+    """
+    Articles of a source, as they are scraped (cache included)
+
+    Scrapers outside the plugin hierarchy only provide scrape_with_cache().
+    """
+    if isinstance(scraper, ScraperPlugin):
+        async for article in scraper.iter_with_cache(config, keywords):
+            yield article
+        return
+
+    for article in await scraper.scrape_with_cache(config, keywords):
+        yield article
+
+
+async def _scrape_source(
+    source: Source,
+    registry: ScraperRegistry,
+    redis_client,
+    keywords: List[str],
+    db: Session,
+    source_timeout: float
+) -> Dict:
+    """
+    Scrape a single source and save its articles
+
+    Args:
+        source: Source to scrape
+        registry: Scraper registry
+        redis_client: Redis client for caching (optional)
+        keywords: Keywords to filter articles
+        db: Database session
+        source_timeout: Deadline in seconds for the scrape itself
+
+    Returns:
+        Per-source result dictionary (status, counts, duration)
+    """
+    source_start_time = datetime.utcnow()
+
+    # Snapshot attributes up front: the source is loaded in the caller's session,
+    # which may commit (and expire it) while this one awaits network I/O
+    source_id = source.id
+    source_name = source.name
+    source_type = source.type
+    source_config = source.config
+
+    logger.info(f"Scraping source: {source_name} ({source_type})")
+
+    # Get scraper from registry
+    scraper = registry.get(source_type)
+    if not scraper:
+        logger.warning(f"No scraper found for source type: {source_type}")
+        return {
+            'source': source_name,
+            'status': 'error',
+            'error': 'Scraper not found'
+        }
+
+    # Inject Redis client for caching
+    if redis_client:
+        scraper.redis = redis_client
+
+    # Inject YouTube channels for youtube_rss scraper
+    if source_type == 'youtube_rss':
+        from app.models.youtube_channel import YouTubeChannel
+        channels = db.query(YouTubeChannel).filter_by(is_active=True).all()
+        scraper._channels = channels
+        logger.info(f"Injected {len(channels)} YouTube channels")
+
+    # Incremental sources start from their watermark between full refreshes
+    incremental = getattr(scraper, 'INCREMENTAL', False)
+    previous_watermark, full_refresh = None, True
+    if incremental:
+        previous_watermark, full_refresh = load_watermark(db, source_id)
+        if not full_refresh:
+            scraper.watermark = previous_watermark
+            logger.info(f"Incremental scrape of {source_name} from {previous_watermark.published_at}")
+
+    # Validate config
+    if not scraper.validate_config(source_config):
+        logger.error(f"Invalid config for source {source_name}")
+        return {
+            'source': source_name,
+            'status': 'error',
+            'error': 'Invalid configuration'
+        }
+
+    # Stream articles into the database in micro-batches, bounded by the per-source deadline
+    sink = ArticleSink(db, source_type, source_id=source_id)
+    new_watermark = previous_watermark
+
+    async def consume() -> None:
+        nonlocal new_watermark
+        async with scraper:
+            async for article in _article_stream(scraper, source_config, keywords):
+                if incremental:
+                    new_watermark = scraper.next_watermark([article], new_watermark)
+                    if not scraper.filter_new([article]):
+                        continue
+                await sink.add(article)
+
+    try:
+        await asyncio.wait_for(consume(), timeout=source_timeout)
+    except asyncio.TimeoutError:
+        # Batches already written stay; the watermark does not move
+        await sink.flush()
+        logger.error(
+            f"Timed out scraping {source_name} after {source_timeout}s "
+            f"({sink.saved} articles saved before the deadline)"
+        )
+        return {
+            'source': source_name,
+            'status': 'error',
+            'error': f'Timed out after {source_timeout}s',
+            'articles_scraped': sink.received,
+            'articles_saved': sink.saved
+        }
+    await sink.flush()
+
+    # Feeds answered with 200 are only skipped (304) next time once their articles are stored
+    if isinstance(scraper, ScraperPlugin):
+        await scraper.commit_validators()
+
+    scraped_count = sink.received
+    saved_count = sink.saved
+    save_stats = sink.stats
+    logger.info(
+        f"Saved {saved_count}/{scraped_count} articles from {source_name} in {sink.batches} batches "
+        f"({save_stats['inserted']} new, {save_stats['updated']} updated, "
+        f"{save_stats['unchanged']} unchanged, {scraped_count - saved_count} duplicates)"
+    )
+
+    # Update source last_scraped_at (and watermark, once articles are stored)
+    db.query(Source).filter_by(id=source_id).update({'last_scraped_at': datetime.utcnow()})
+    if incremental:
+        save_watermark(db, source_id, new_watermark, full_refresh)
+    db.commit()
+
+    # Calculate duration
+    duration_seconds = (datetime.utcnow() - source_start_time).total_seconds()
+
+    return {
+        'source': source_name,
+        'status': 'success',
+        'articles_scraped': scraped_count,
+        'articles_saved': saved_count,
+        'articles_inserted': save_stats['inserted'],
+        'articles_updated': save_stats['updated'],
+        'articles_unchanged': save_stats['unchanged'],
+        'duplicates': scraped_count - saved_count,
+        'articles_near_duplicate': save_stats['near_duplicates'],
+        'mode': 'full' if full_refresh else 'incremental',
+        'duration_seconds': round(duration_seconds, 2)
+    }
+
+
 async def scrape_all_sources_async(
     db: Session,
     keywords: List[str] = None,
-    task_id: Optional[str] = None
+    task_id: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    source_timeout: Optional[float] = None
 ) -> Dict:
     """
     Scrape all active sources and save articles to database (async business logic)
@@ -215,6 +380,9 @@ async def scrape_all_sources_async(
         db: Database session
         keywords: List of keywords to filter articles (optional, fetched from DB if None)
         task_id: Task ID for tracking (optional)
+        max_concurrency: Max sources scraped at once (default: settings.SCRAPING_MAX_CONCURRENCY,
+            1 = sequential)
+        source_timeout: Per-source deadline in seconds (default: settings.SCRAPING_SOURCE_TIMEOUT)
 
     Returns:
         Dictionary with scraping results and statistics
@@ -222,11 +390,17 @@ async def scrape_all_sources_async(
     This function:
     1. Fetches active keywords from database (if not provided)
     2. Fetches all active sources from database
-    3. For each source, gets the appropriate scraper from registry
-    4. Runs scraper with Redis caching enabled
-    5. Saves articles to database with deduplication
-    6. Logs results to scraping_runs table
+    3. Runs one asyncio task per source (each with its own session), capped by max_concurrency
+    4. Each task scrapes with Redis caching and saves with deduplication
+    5. Logs results to scraping_runs table
+
+    Wall-clock time is roughly that of the slowest source rather than the sum.
     """
+    if max_concurrency is None:
+        max_concurrency = settings.SCRAPING_MAX_CONCURRENCY
+    if source_timeout is None:
+        source_timeout = settings.SCRAPING_SOURCE_TIMEOUT
+
     # Get keywords from database if not provided
     if keywords is None:
         active_keywords = db.query(Keyword).filter_by(is_active=True).all()
@@ -252,11 +426,6 @@ async def scrape_all_sources_async(
     db.commit()
 
     registry = ScraperRegistry()
-    total_articles_scraped = 0
-    total_articles_saved = 0
-    sources_scraped = 0
-    errors_count = 0
-    results = []
 
     # Initialize Redis client for caching
     redis_client = None
@@ -269,91 +438,42 @@ async def scrape_all_sources_async(
     try:
         # Get all active sources
         active_sources = db.query(Source).filter_by(is_active=True).all()
-        logger.info(f"Found {len(active_sources)} active sources")
-
-        for source in active_sources:
-            source_start_time = datetime.utcnow()
+        logger.info(
+            f"Found {len(active_sources)} active sources "
+            f"(concurrency={max_concurrency}, timeout={source_timeout}s)"
+        )
 
-            try:
-                logger.info(f"Scraping source: {source.name} ({source.type})")
-
-                # Get scraper from registry
-                scraper = registry.get(source.type)
-                if not scraper:
-                    logger.warning(f"No scraper found for source type: {source.type}")
-                    errors_count += 1
-                    results.append({
-                        'source': source.name,
-                        'status': 'error',
-                        'error': 'Scraper not found'
-                    })
-                    continue
-
-                # Inject Redis client for caching
-                if redis_client:
-                    scraper.redis = redis_client
-
-                # Inject YouTube channels for youtube_rss scraper
-                if source.type == 'youtube_rss':
-                    from app.models.youtube_channel import YouTubeChannel
-                    channels = db.query(YouTubeChannel).filter_by(is_active=True).all()
-                    scraper._channels = channels
-                    logger.info(f"Injected {len(channels)} YouTube channels")
-
-                # Validate config
-                if not scraper.validate_config(source.config):
-                    logger.error(f"Invalid config for source {source.name}")
-                    errors_count += 1
-                    results.append({
-                        'source': source.name,
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_source(source: Source) -> Dict:
+            source_name = source.name
+            async with semaphore:
+                # One session per source: a failed flush cannot leave the other sources
+                # (or the run record) on a session that needs a rollback
+                source_db = SessionLocal(bind=db.get_bind())
+                try:
+                    return await _scrape_source(
+                        source, registry, redis_client, keywords, source_db, source_timeout
+                    )
+                except Exception as e:
+                    source_db.rollback()
+                    logger.error(f"Error scraping {source_name}: {str(e)}", exc_info=True)
+                    return {
+                        'source': source_name,
                         'status': 'error',
-                        'error': 'Invalid configuration'
-                    })
-                    continue
-
-                # Scrape articles with caching
-                async with scraper:
-                    # Use scrape_with_cache to leverage Redis caching
-                    articles = await scraper.scrape_with_cache(source.config, keywords)
-
-                scraped_count = len(articles)
-                total_articles_scraped += scraped_count
-                logger.info(f"Scraped {scraped_count} articles from {source.name}")
-
-                # Save articles to database
-                saved_count = 0
-                if articles:
-                    saved_count = await save_articles(articles, source.type, db)
-                    total_articles_saved += saved_count
-                    logger.info(f"Saved {saved_count} articles from {source.name} ({scraped_count - saved_count} duplicates)")
-
-                sources_scraped += 1
-
-                # Update source last_scraped_at
-                source.last_scraped_at = datetime.utcnow()
-                db.commit()
-
-                # Calculate duration
-                duration_seconds = (datetime.utcnow() - source_start_time).total_seconds()
-
-                results.append({
-                    'source': source.name,
-                    'status': 'success',
-                    'articles_scraped': scraped_count,
-                    'articles_saved': saved_count,
-                    'duplicates': scraped_count - saved_count,
-                    'duration_seconds': round(duration_seconds, 2)
-                })
+                        'error': str(e)
+                    }
+                finally:
+                    source_db.close()
 
-            except Exception as e:
-                logger.error(f"Error scraping {source.name}: {str(e)}", exc_info=True)
-                errors_count += 1
-                results.append({
-                    'source': source.name,
-                    'status': 'error',
-                    'error': str(e)
-                })
-                continue
+        results = await asyncio.gather(*(run_source(source) for source in active_sources))
+
+        succeeded = [r for r in results if r['status'] == 'success']
+        sources_scraped = len(succeeded)
+        errors_count = len(results) - sources_scraped
+        # Timed-out sources keep the batches written before their deadline
+        total_articles_scraped = sum(r.get('articles_scraped', 0) for r in results)
+        total_articles_saved = sum(r.get('articles_saved', 0) for r in results)
 
         # Determine overall status
         if errors_count == 0:
@@ -393,7 +513,7 @@ async def scrape_all_sources_async(
             'duplicates': total_articles_scraped - total_articles_saved,
             'errors': errors_count,
             'keywords_used': keywords,
-            'results': results
+            'results': list(results)
         }
 
     except Exception as e:
@@ -447,7 +567,6 @@ def scrape_all_sources(self, keywords: List[str] = None, run_scoring: bool = Tru
         # Or apply async
         task = scrape_all_sources.apply_async(kwargs={'keywords': ['AI', 'blockchain']})
     """
-    import asyncio
     from app.tasks.scoring import score_articles
 
     # Get database session
@@ -455,7 +574,7 @@ def scrape_all_sources(self, keywords: List[str] = None, run_scoring: bool = Tru
 
     try:
         # Run the async function
-        result = asyncio.run(
+        result = run_async(
             scrape_all_sources_async(
                 db=db,
                 keywords=keywords,
@@ -0,0 +1,135 @@
+"""
+Multi-keyword matcher (Aho-Corasick)
+
+Replaces `any(kw.lower() in text for kw in keywords)` loops: the keyword set is
+compiled once into an automaton and every occurrence of every keyword is found
+in a single pass over the text, whatever the number of keywords.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+import ahocorasick
+
+# Joins fields for a single pass; never part of a keyword so hits cannot span fields
+FIELD_SEPARATOR = "\x00"
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """One keyword occurrence (positions index into the lowercased field)"""
+    index: int  # Position of the keyword in the list the matcher was built from
+    keyword: str
+    field: str
+    start: int
+    end: int
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive substring matcher for a fixed keyword list
+
+    Use get_matcher() rather than instantiating directly so the automaton is
+    built once per keyword set. Empty keywords never match.
+    """
+
+    def __init__(self, keywords: Sequence[str]):
+        self.keywords = tuple(keywords)
+        self._automaton = ahocorasick.Automaton()
+
+        # Lowercased pattern -> indices of every keyword that lowercases to it
+        patterns: Dict[str, List[int]] = {}
+        for i, keyword in enumerate(self.keywords):
+            pattern = keyword.lower()
+            if pattern and FIELD_SEPARATOR not in pattern:
+                patterns.setdefault(pattern, []).append(i)
+
+        for pattern, indices in patterns.items():
+            self._automaton.add_word(pattern, (len(pattern), tuple(indices)))
+
+        self._empty = not patterns
+        if not self._empty:
+            self._automaton.make_automaton()
+
+    def _iter_raw(self, text_lower: str) -> Iterator[Tuple[int, int, Tuple[int, ...]]]:
+        """Yield (start, end, keyword indices) for each occurrence in lowercased text"""
+        if self._empty or not text_lower:
+            return
+        for end_index, (length, indices) in self._automaton.iter(text_lower):
+            yield end_index - length + 1, end_index + 1, indices
+
+    def find(self, text: str = "", **fields: str) -> List[KeywordHit]:
+        """
+        Every keyword occurrence across one or more named fields
+
+        Args:
+            text: Unnamed text (reported as field "text")
+            **fields: Named fields, e.g. title=..., content=...
+
+        Returns:
+            List of KeywordHit in text order
+        """
+        if text:
+            fields = {"text": text, **fields}
+
+        names = []
+        offsets = []
+        parts = []
+        position = 0
+        for name, value in fields.items():
+            if not value:
+                continue
+            value = value.lower()
+            names.append(name)
+            offsets.append(position)
+            parts.append(value)
+            position += len(value) + len(FIELD_SEPARATOR)
+
+        hits = []
+        for start, end, indices in self._iter_raw(FIELD_SEPARATOR.join(parts)):
+            field_pos = bisect_right(offsets, start) - 1
+            offset = offsets[field_pos]
+            for i in indices:
+                hits.append(KeywordHit(
+                    index=i,
+                    keyword=self.keywords[i],
+                    field=names[field_pos],
+                    start=start - offset,
+                    end=end - offset
+                ))
+        return hits
+
+    def matched_indices(self, text: str) -> Set[int]:
+        """Indices of keywords present in text"""
+        return {i for _, _, indices in self._iter_raw(text.lower()) for i in indices}
+
+    def matched_fields(self, **fields: str) -> Dict[int, Set[str]]:
+        """Map keyword index -> names of the fields it appears in"""
+        result: Dict[int, Set[str]] = {}
+        for hit in self.find(**fields):
+            result.setdefault(hit.index, set()).add(hit.field)
+        return result
+
+    def contains_any(self, text: str) -> bool:
+        """True if at least one keyword is present (stops at the first hit)"""
+        return next(self._iter_raw(text.lower()), None) is not None
+
+
+@lru_cache(maxsize=256)
+def _compiled(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def get_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """
+    Shared matcher for a keyword list, built once per distinct list
+
+    Args:
+        keywords: Keywords in the order hit indices refer to
+
+    Returns:
+        Cached KeywordMatcher
+    """
+    return _compiled(tuple(keywords))
@@ -0,0 +1,223 @@
+"""
+Pagination helpers shared by list endpoints
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import DateTime, Select, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql import ColumnElement
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Query parameter pattern for ?count=
+COUNT_MODE_PATTERN = "^(exact|estimated|none)$"
+
+
+def count_rows(db: Session, query: Union[Query, Select]) -> int:
+    """
+    Exact COUNT(*) of a Query or Select (ordering and pagination ignored)
+
+    With an AsyncSession: await db.run_sync(count_rows, stmt)
+    """
+    stmt = query.statement if isinstance(query, Query) else query
+    stmt = stmt.order_by(None).limit(None).offset(None)
+    return db.execute(select(func.count()).select_from(stmt.subquery())).scalar()
+
+
+def estimate_count(db: Session, query: Union[Query, Select]) -> int:
+    """
+    Planner row estimate for a query (PostgreSQL), exact count elsewhere
+
+    Much cheaper than COUNT(*) on large filtered joins; accuracy depends on
+    table statistics (ANALYZE), so only use it for display purposes.
+
+    With an AsyncSession: await db.run_sync(estimate_count, stmt)
+
+    Args:
+        db: Database session
+        query: Filtered Query or Select (ordering and pagination are ignored)
+
+    Returns:
+        Estimated number of rows
+    """
+    stmt = query.statement if isinstance(query, Query) else query
+    stmt = stmt.order_by(None).limit(None).offset(None)
+    bind = db.get_bind()
+
+    if bind.dialect.name != 'postgresql':
+        return count_rows(db, stmt)
+
+    try:
+        compiled = stmt.compile(
+            dialect=bind.dialect,
+            compile_kwargs={"render_postcompile": True}
+        )
+        # Savepoint so a failed EXPLAIN does not abort the request transaction
+        with db.begin_nested():
+            plan = db.connection().exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+            ).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.warning(f"Row estimate failed, falling back to COUNT: {e}")
+        return count_rows(db, stmt)
+
+
+def encode_cursor(sort: str, values: Sequence[Any]) -> str:
+    """
+    Opaque cursor for keyset pagination
+
+    Args:
+        sort: Sort name the cursor belongs to
+        values: Sort key values of the last row, id last
+
+    Returns:
+        URL-safe token
+    """
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps({"s": sort, "v": payload}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, keys: Sequence[ColumnElement]) -> List[Any]:
+    """
+    Decode a cursor made by encode_cursor for the same sort
+
+    Args:
+        cursor: Token from a previous page's nextCursor
+        sort: Current sort name
+        keys: Sort key expressions followed by the id column
+
+    Returns:
+        Key values, datetimes restored
+
+    Raises:
+        ValueError: Malformed cursor, or cursor from another sort
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        values = data["v"]
+        cursor_sort = data["s"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+
+    if cursor_sort != sort or not isinstance(values, list) or len(values) != len(keys):
+        raise ValueError("Cursor does not match the requested sort")
+
+    try:
+        return [
+            datetime.fromisoformat(v) if isinstance(key.type, DateTime) and v is not None else v
+            for key, v in zip(keys, values)
+        ]
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def _keyset_query(query, sort, sort_keys, id_column, limit, offset, cursor):
+    """Add sort key columns, ordering, cursor filter and LIMIT to a Query or Select"""
+    keys = [*sort_keys, id_column]
+    labels = [f"_sort_key_{i}" for i in range(len(keys))]
+
+    query = query.add_columns(
+        *[key.label(label) for key, label in zip(keys, labels)]
+    ).order_by(*[key.desc() for key in keys])
+
+    if cursor:
+        values = decode_cursor(cursor, sort, keys)
+        bound = [literal(value, type_=key.type) for key, value in zip(keys, values)]
+        query = query.filter(tuple_(*keys) < tuple_(*bound))
+    elif offset:
+        query = query.offset(offset)
+
+    return query.limit(limit + 1), labels
+
+
+def _keyset_page(rows, sort, labels, limit):
+    """Trim the extra row and build the next cursor"""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(sort, [getattr(last, label) for label in labels])
+
+    return rows, has_more, next_cursor
+
+
+def keyset_paginate(
+    query: Query,
+    sort: str,
+    sort_keys: Sequence[ColumnElement],
+    id_column: ColumnElement,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None
+) -> Tuple[List[Any], bool, Optional[str]]:
+    """
+    Order a query by (sort keys DESC, id DESC) and fetch one page
+
+    With a cursor the page starts after the cursor row (a row-value
+    comparison, served by a matching composite index) and offset is ignored;
+    without one, offset applies. Either way one extra row is fetched for
+    hasMore and the returned cursor points at the last row of the page.
+
+    Sort keys must not be NULL (coalesce nullable columns).
+
+    Args:
+        query: Filtered query, without ordering or pagination
+        sort: Sort name (embedded in the cursor)
+        sort_keys: Sort key expressions, most significant first
+        id_column: Unique tie-breaker column
+        limit: Page size
+        offset: Rows to skip when no cursor is given
+        cursor: Cursor from a previous page
+
+    Returns:
+        Tuple of (rows, has_more, next_cursor)
+
+    Raises:
+        ValueError: Invalid cursor
+    """
+    query, labels = _keyset_query(query, sort, sort_keys, id_column, limit, offset, cursor)
+    return _keyset_page(query.all(), sort, labels, limit)
+
+
+async def keyset_paginate_async(
+    db: AsyncSession,
+    stmt: Select,
+    sort: str,
+    sort_keys: Sequence[ColumnElement],
+    id_column: ColumnElement,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None
+) -> Tuple[List[Any], bool, Optional[str]]:
+    """
+    keyset_paginate for a Select executed on an AsyncSession
+
+    Args:
+        db: Async database session
+        stmt: Filtered select, without ordering or pagination
+        (other arguments as keyset_paginate)
+
+    Returns:
+        Tuple of (rows, has_more, next_cursor)
+
+    Raises:
+        ValueError: Invalid cursor
+    """
+    stmt, labels = _keyset_query(stmt, sort, sort_keys, id_column, limit, offset, cursor)
+    rows = (await db.execute(stmt)).all()
+    return _keyset_page(rows, sort, labels, limit)
@@ -0,0 +1,48 @@
+"""
+Async Redis clients bound to the running event loop
+
+redis.asyncio connections belong to the loop that opened them, and a
+Celery worker may run several loops over its lifetime. Clients are kept
+per loop in a WeakKeyDictionary (as the scraper HTTP clients are), so a
+client never outlives its loop and a new loop never gets a client bound
+to a dead one.
+
+Usage:
+
+    _redis = LoopRedisClients(decode_responses=True, socket_timeout=1)
+
+    async def handler():
+        await _redis.get().incr("counter")
+"""
+
+import asyncio
+import weakref
+from typing import Any
+
+import redis.asyncio as aioredis
+
+from app.config import settings
+
+
+class LoopRedisClients:
+    """
+    One async client per event loop, created on first use
+
+    Args:
+        options: Keyword arguments for redis.asyncio.from_url
+    """
+
+    def __init__(self, **options: Any):
+        self.options = options
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aioredis.Redis]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self) -> aioredis.Redis:
+        """Client of the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = aioredis.from_url(settings.REDIS_URL, **self.options)
+            self._clients[loop] = client
+        return client
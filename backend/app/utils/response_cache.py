@@ -0,0 +1,275 @@
+"""
+Redis-backed response cache for hot read endpoints
+
+Usage:
+
+    @router.get("/analytics/summary")
+    @cached_response(ttl=300, tags=[TAG_ARTICLES, TAG_TRENDS])
+    async def get_analytics_summary(db: Session = Depends(get_db)):
+        ...
+
+- Responses are stored as serialized JSON, keyed by route and query params
+- Single-flight: on a miss only one request per key recomputes (in-process
+  future + Redis lock across workers), the others wait for its result
+- Tag invalidation: every tag has a version counter that is part of the
+  cache key; invalidate_tags() (invalidate_tags_async() from async code)
+  bumps it, so stale entries are never read again and simply expire
+- Redis being unavailable never fails a request: the route is computed
+  directly and Redis is skipped for a short while
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import time
+import uuid
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+import redis
+import redis.asyncio as aioredis
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+
+from app.config import settings
+from app.utils.logger import get_logger
+from app.utils.redis_clients import LoopRedisClients
+
+logger = get_logger(__name__)
+
+# Invalidation tags
+TAG_ARTICLES = "articles"  # Articles inserted/updated/deleted or (re)scored
+TAG_KEYWORDS = "keywords"  # Global keywords created/updated/deleted
+TAG_TRENDS = "trends"  # Trends detected or cleaned up
+
+KEY_PREFIX = "response_cache"
+
+# Seconds to skip Redis after a connection error
+UNAVAILABLE_BACKOFF = 30.0
+
+# How often a waiting request checks whether the recompute finished
+LOCK_POLL_INTERVAL = 0.05
+
+_SIMPLE_TYPES = (str, int, float, bool, type(None))
+
+_async_redis = LoopRedisClients(decode_responses=True, socket_connect_timeout=1, socket_timeout=1)
+_sync_client: Optional[redis.Redis] = None
+_inflight: Dict[str, asyncio.Future] = {}
+_unavailable_until = 0.0
+
+
+def _async_client() -> aioredis.Redis:
+    """Async client for the running event loop (connections are loop-bound)"""
+    return _async_redis.get()
+
+
+def _sync_redis() -> redis.Redis:
+    """Sync client used for invalidation (Celery tasks)"""
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=1,
+            socket_timeout=1
+        )
+    return _sync_client
+
+
+def _available() -> bool:
+    return settings.RESPONSE_CACHE_ENABLED and time.monotonic() >= _unavailable_until
+
+
+def _mark_unavailable(error: Exception) -> None:
+    global _unavailable_until
+    _unavailable_until = time.monotonic() + UNAVAILABLE_BACKOFF
+    logger.warning(f"Response cache disabled for {UNAVAILABLE_BACKOFF:.0f}s: {error}")
+
+
+def _tag_key(tag: str) -> str:
+    return f"{KEY_PREFIX}:tag:{tag}"
+
+
+def _params_digest(kwargs: Dict[str, Any]) -> str:
+    """Stable digest of the simple (query/path) parameters of a call"""
+    params = {k: v for k, v in sorted(kwargs.items()) if isinstance(v, _SIMPLE_TYPES)}
+    raw = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+async def _cache_key(client: aioredis.Redis, name: str, tags: Tuple[str, ...], kwargs: Dict) -> str:
+    versions = await client.mget([_tag_key(tag) for tag in tags]) if tags else []
+    version = ".".join(v or "0" for v in versions)
+    return f"{KEY_PREFIX}:{name}:{_params_digest(kwargs)}:{version}"
+
+
+async def _release_lock(client: aioredis.Redis, lock_key: str, token: str) -> None:
+    # Only release our own lock (it may have expired and been taken over)
+    if await client.get(lock_key) == token:
+        await client.delete(lock_key)
+
+
+async def _compute_shared(
+    client: aioredis.Redis,
+    key: str,
+    ttl: int,
+    lock_timeout: float,
+    compute: Callable[[], Awaitable[str]]
+) -> Tuple[str, bool]:
+    """
+    Recompute a missing entry once across workers
+
+    Returns:
+        Tuple of (body, served_from_cache)
+    """
+    lock_key = f"{key}:lock"
+    token = uuid.uuid4().hex
+
+    if await client.set(lock_key, token, nx=True, px=int(lock_timeout * 1000)):
+        try:
+            body = await compute()
+            await client.set(key, body, ex=ttl)
+            return body, False
+        finally:
+            await _release_lock(client, lock_key, token)
+
+    # Another worker is recomputing: wait for its result, up to the lock timeout
+    deadline = time.monotonic() + lock_timeout
+    while time.monotonic() < deadline:
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+        cached = await client.get(key)
+        if cached is not None:
+            return cached, True
+
+    logger.warning(f"Timed out waiting for cache recompute of {key}, computing locally")
+    return await compute(), False
+
+
+def _json_response(body: str, status: str) -> Response:
+    return Response(content=body, media_type="application/json", headers={"X-Cache": status})
+
+
+def cached_response(
+    ttl: int,
+    tags: Iterable[str] = (),
+    lock_timeout: float = 10.0
+) -> Callable:
+    """
+    Cache the JSON response of an async FastAPI route in Redis
+
+    Place it under the @router decorator. The cache key is built from the
+    function name, its simple-typed arguments (query and path params) and
+    the current version of each tag. Dependencies such as the DB session
+    are ignored.
+
+    Args:
+        ttl: Time to live of an entry in seconds
+        tags: Tags whose invalidation drops the entry (see invalidate_tags)
+        lock_timeout: Max seconds a recompute may hold the lock / others wait
+
+    Returns:
+        Decorator
+    """
+    tags = tuple(tags)
+
+    def decorator(func: Callable) -> Callable:
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError("cached_response only supports async routes")
+
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            async def compute() -> str:
+                result = await func(*args, **kwargs)
+                return json.dumps(jsonable_encoder(result), separators=(",", ":"))
+
+            if not _available():
+                return _json_response(await compute(), "BYPASS")
+
+            try:
+                client = _async_client()
+                key = await _cache_key(client, name, tags, kwargs)
+                cached = await client.get(key)
+            except (redis.RedisError, OSError) as e:
+                _mark_unavailable(e)
+                return _json_response(await compute(), "BYPASS")
+
+            if cached is not None:
+                return _json_response(cached, "HIT")
+
+            # Requests of this worker share one recompute
+            pending = _inflight.get(key)
+            if pending is not None:
+                body, _ = await asyncio.shield(pending)
+                return _json_response(body, "HIT")
+
+            future = asyncio.get_running_loop().create_future()
+            _inflight[key] = future
+            try:
+                try:
+                    body, from_cache = await _compute_shared(client, key, ttl, lock_timeout, compute)
+                except (redis.RedisError, OSError) as e:
+                    _mark_unavailable(e)
+                    body, from_cache = await compute(), False
+                future.set_result((body, from_cache))
+            except BaseException as e:
+                future.set_exception(e)
+                # Nobody else may be waiting; avoid "exception never retrieved"
+                future.exception()
+                raise
+            finally:
+                _inflight.pop(key, None)
+
+            return _json_response(body, "HIT" if from_cache else "MISS")
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_tags(*tags: str) -> None:
+    """
+    Invalidate every cached response carrying one of the tags
+
+    Synchronous (one INCR per tag) for Celery tasks and other sync code;
+    async code uses invalidate_tags_async. Errors are logged, not raised:
+    entries still expire with their TTL.
+
+    Args:
+        tags: Tags to invalidate
+    """
+    if not tags or not _available():
+        return
+
+    try:
+        pipe = _sync_redis().pipeline(transaction=False)
+        for tag in tags:
+            pipe.incr(_tag_key(tag))
+        pipe.execute()
+        logger.debug(f"Invalidated response cache tags: {', '.join(tags)}")
+    except (redis.RedisError, OSError) as e:
+        _mark_unavailable(e)
+
+
+async def invalidate_tags_async(*tags: str) -> None:
+    """
+    Same as invalidate_tags, on the event loop's async client
+
+    For async handlers: a slow or unreachable Redis must not block the loop.
+
+    Args:
+        tags: Tags to invalidate
+    """
+    if not tags or not _available():
+        return
+
+    try:
+        pipe = _async_client().pipeline(transaction=False)
+        for tag in tags:
+            pipe.incr(_tag_key(tag))
+        await pipe.execute()
+        logger.debug(f"Invalidated response cache tags: {', '.join(tags)}")
+    except (redis.RedisError, OSError) as e:
+        _mark_unavailable(e)
@@ -0,0 +1,138 @@
+"""
+SimHash fingerprints for near-duplicate detection
+
+The same story arrives from several sources (HN, Reddit, Medium, Dev.to,
+official blogs) under different URLs and with small edits. A 64-bit
+SimHash over word shingles of title + content maps such copies to
+fingerprints a few bits apart, while unrelated texts differ in about
+half of their bits.
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections import Counter
+from typing import Optional
+
+import numpy as np
+
+FINGERPRINT_BITS = 64
+SHINGLE_SIZE = 3  # Words per shingle
+MIN_WORDS = 8  # Shorter texts are too unstable to fingerprint
+MAX_WORDS = 2000  # Beginning of the text is enough to identify a story
+MAX_DISTANCE = 6  # Hamming distance at or below which two texts are near-duplicates
+
+_MASK = (1 << FINGERPRINT_BITS) - 1
+_BIT_SHIFTS = np.arange(FINGERPRINT_BITS, dtype=np.uint64)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"\w+")
+
+
+def _words(text: str) -> list[str]:
+    text = unicodedata.normalize("NFKC", _TAG_RE.sub(" ", text)).casefold()
+    return _WORD_RE.findall(text)[:MAX_WORDS]
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> Optional[int]:
+    """
+    Calcule l'empreinte SimHash d'un texte
+
+    Args:
+        text: Texte brut ou HTML
+
+    Returns:
+        Empreinte signée 64 bits (stockable en BIGINT), ou None si le texte est trop court
+    """
+    words = _words(text)
+    if len(words) < MIN_WORDS:
+        return None
+
+    shingles = Counter(
+        " ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)
+    )
+
+    hashes = np.fromiter((_feature_hash(s) for s in shingles), dtype=np.uint64, count=len(shingles))
+    weights = np.fromiter(shingles.values(), dtype=np.int64, count=len(shingles))
+
+    # (shingles x bits) of +1/-1, weighted by shingle frequency, summed per bit
+    bits = ((hashes[:, None] >> _BIT_SHIFTS) & np.uint64(1)).astype(np.int64)
+    vector = ((2 * bits - 1) * weights[:, None]).sum(axis=0)
+
+    fingerprint = sum(1 << bit for bit in np.flatnonzero(vector > 0).tolist())
+    # Two's complement so the value fits a signed 64-bit column
+    return fingerprint - (1 << FINGERPRINT_BITS) if fingerprint >> (FINGERPRINT_BITS - 1) else fingerprint
+
+
+def article_fingerprint(title: Optional[str], content: Optional[str]) -> Optional[int]:
+    """Empreinte d'un article (titre + contenu)"""
+    return simhash(f"{title or ''}\n{content or ''}")
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Nombre de bits différents entre deux empreintes"""
+    return ((a ^ b) & _MASK).bit_count()
+
+
+def band_keys(fingerprint: int, max_distance: int = MAX_DISTANCE) -> list[tuple[int, int]]:
+    """
+    Clés LSH d'une empreinte
+
+    The fingerprint is cut into max_distance + 1 bands: two fingerprints
+    at most max_distance bits apart agree on at least one whole band
+    (pigeonhole), so only fingerprints sharing a band need comparing.
+    """
+    bands = max_distance + 1
+    value = fingerprint & _MASK
+    keys = []
+    start = 0
+    for band in range(bands):
+        width = (FINGERPRINT_BITS - start) // (bands - band)
+        keys.append((band, (value >> start) & ((1 << width) - 1)))
+        start += width
+    return keys
+
+
+class NearDuplicateIndex:
+    """
+    Index en mémoire des empreintes (recherche du plus proche voisin à MAX_DISTANCE près)
+
+    Args:
+        max_distance: Distance de Hamming max pour un quasi-doublon
+    """
+
+    def __init__(self, max_distance: int = MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._fingerprints: dict[int, int] = {}
+        self._buckets: dict[tuple[int, int], list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def add(self, item_id: int, fingerprint: int) -> None:
+        """Ajoute une empreinte à l'index"""
+        self._fingerprints[item_id] = fingerprint
+        for key in band_keys(fingerprint, self.max_distance):
+            self._buckets.setdefault(key, []).append(item_id)
+
+    def nearest(self, fingerprint: int) -> Optional[int]:
+        """
+        Cherche le quasi-doublon le plus proche
+
+        Returns:
+            ID de l'empreinte la plus proche (la plus ancienne à distance égale), ou None
+        """
+        candidates = {
+            item_id
+            for key in band_keys(fingerprint, self.max_distance)
+            for item_id in self._buckets.get(key, ())
+        }
+        best = None
+        for item_id in candidates:
+            distance = hamming_distance(fingerprint, self._fingerprints[item_id])
+            if distance <= self.max_distance and (best is None or (distance, item_id) < best):
+                best = (distance, item_id)
+        return best[1] if best else None
@@ -0,0 +1,169 @@
+"""
+URL canonicalization for article deduplication
+
+Every scraped URL is reduced to one canonical form so that the same
+content maps to one row whichever scraper produced it:
+
+- https scheme, lowercase host without "www.", no default port, no fragment
+- tracking parameters removed (utm_*, ref, fbclid, ...), others sorted
+- no trailing slash
+- per-site rules for the short, mobile and alternate forms of YouTube,
+  Medium, Reddit, Hacker News, arXiv, X/Twitter and GitHub URLs
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+Query = List[Tuple[str, str]]
+
+# Dropped everywhere (exact names, lowercase); site rules drop site-specific ones
+# (Medium ?source=, YouTube ?si=&t=, X ?s=)
+TRACKING_PARAMS = frozenset({
+    "ref", "ref_src", "ref_url", "referrer",
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "twclid", "igshid",
+    "mc_cid", "mc_eid", "_hsenc", "_hsmi", "mkt_tok",
+})
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_", "oly_")
+
+_DEFAULT_PORTS = {":80", ":443"}
+_MEDIUM_POST_ID = re.compile(r"(?:^|-)([0-9a-f]{10,12})$")
+_YOUTUBE_ID = re.compile(r"^[\w-]{11}$")
+_ARXIV_ID = re.compile(r"^(\d{4}\.\d{4,5}|[a-z\-]+(?:\.[A-Z]{2})?/\d{7})(?:v\d+)?(?:\.pdf)?$")
+
+
+def _youtube(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    """youtu.be/ID, /shorts/ID, /embed/ID, /live/ID and m. -> youtube.com/watch?v=ID"""
+    parts = path.strip("/").split("/")
+    video_id = None
+    if host == "youtu.be":
+        video_id = parts[0]
+    elif parts[0] in ("shorts", "embed", "live", "v") and len(parts) > 1:
+        video_id = parts[1]
+    elif parts[0] == "watch":
+        video_id = dict(query).get("v")
+
+    if video_id and _YOUTUBE_ID.match(video_id):
+        return "youtube.com", "/watch", [("v", video_id)]
+    return "youtube.com", path, query
+
+
+def _medium(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    """medium.com/@user/slug-ID, publication and custom subdomains -> medium.com/p/ID"""
+    last = path.rstrip("/").rsplit("/", 1)[-1]
+    match = _MEDIUM_POST_ID.search(last)
+    if match:
+        return "medium.com", f"/p/{match.group(1)}", []
+    return host, path, query
+
+
+def _reddit(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    """old./new./np. reddit and redd.it -> reddit.com/comments/ID"""
+    parts = path.strip("/").split("/")
+    if host == "redd.it" and parts[0]:
+        return "reddit.com", f"/comments/{parts[0]}", []
+    if "comments" in parts:
+        index = parts.index("comments")
+        if index + 1 < len(parts):
+            return "reddit.com", f"/comments/{parts[index + 1]}", []
+    return "reddit.com", path, query
+
+
+def _hackernews(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    """Only the item id identifies a story"""
+    return host, path, [(k, v) for k, v in query if k == "id"]
+
+
+def _arxiv(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    """abs/pdf, any version -> arxiv.org/abs/ID"""
+    parts = path.strip("/").split("/", 1)
+    if len(parts) == 2 and parts[0] in ("abs", "pdf", "html"):
+        match = _ARXIV_ID.match(parts[1])
+        if match:
+            return "arxiv.org", f"/abs/{match.group(1)}", []
+    return "arxiv.org", path, query
+
+
+def _twitter(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    """twitter.com, mobile. and x.com -> x.com/user/status/ID"""
+    match = re.match(r"^/([^/]+)/status(?:es)?/(\d+)", path)
+    if match:
+        return "x.com", f"/{match.group(1).lower()}/status/{match.group(2)}", []
+    return "x.com", path, query
+
+
+def _github(host: str, path: str, query: Query) -> Tuple[str, str, Query]:
+    """Owner and repository names are case-insensitive"""
+    return host, path.lower(), query
+
+
+# Host (without "www.") -> rule(host, path, query) -> (host, path, query)
+SITE_RULES: Dict[str, Callable[[str, str, Query], Tuple[str, str, Query]]] = {
+    "youtube.com": _youtube,
+    "m.youtube.com": _youtube,
+    "music.youtube.com": _youtube,
+    "youtu.be": _youtube,
+    "medium.com": _medium,
+    "reddit.com": _reddit,
+    "old.reddit.com": _reddit,
+    "new.reddit.com": _reddit,
+    "np.reddit.com": _reddit,
+    "redd.it": _reddit,
+    "news.ycombinator.com": _hackernews,
+    "arxiv.org": _arxiv,
+    "export.arxiv.org": _arxiv,
+    "twitter.com": _twitter,
+    "mobile.twitter.com": _twitter,
+    "x.com": _twitter,
+    "github.com": _github,
+}
+
+
+def _site_rule(host: str) -> Optional[Callable[[str, str, Query], Tuple[str, str, Query]]]:
+    rule = SITE_RULES.get(host)
+    if rule is None and host.endswith(".medium.com"):
+        rule = _medium  # Custom publication subdomains
+    return rule
+
+
+def _is_tracking(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Forme canonique d'une URL d'article
+
+    Args:
+        url: URL telle que scrapée
+
+    Returns:
+        URL canonique (l'URL d'origine, nettoyée, si elle n'est pas http(s))
+    """
+    url = str(url).strip()
+    parts = urlsplit(url)
+    if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    port = f":{parts.port}" if parts.port else ""
+    if port in _DEFAULT_PORTS:
+        port = ""
+
+    path = re.sub(r"/{2,}", "/", parts.path) or "/"
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking(key)
+    ]
+
+    rule = _site_rule(host)
+    if rule is not None:
+        host, path, query = rule(host, path, query)
+
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return urlunsplit(("https", f"{host}{port}", path, urlencode(sorted(query)), ""))
@@ -1,23 +1,24 @@
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
-from app.database import Base
+from sqlalchemy.pool import NullPool
+from app.database import Base, async_database_url
 import fakeredis.aioredis
 
 
 @pytest.fixture(scope="function")
-def db_session():
+def db_session(tmp_path):
     """
-    Create an in-memory SQLite database for testing
+    Create a temporary SQLite database for testing
 
+    File-backed (not :memory:) so async_db can open the same database.
     Scope: function - creates a fresh database for each test
     """
-    # Create in-memory SQLite database with thread checking disabled
+    # Create SQLite database with thread checking disabled
     engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool  # Use static pool for thread safety
+        f"sqlite:///{tmp_path / 'test.db'}",
+        connect_args={"check_same_thread": False}
     )
 
     # Import models needed for tests
@@ -32,6 +33,8 @@ def db_session():
         Base.metadata.tables['keywords'],
         Base.metadata.tables['article_keywords'],
         Base.metadata.tables['youtube_channels'],
+        Base.metadata.tables['source_watermarks'],
+        Base.metadata.tables['summary_cache'],
     ]
 
     for table in tables_to_create:
@@ -49,6 +52,29 @@ def db_session():
     engine.dispose()
 
 
+@pytest.fixture(scope="function")
+def async_db(db_session):
+    """
+    Override for get_async_db, on the same database as db_session
+
+    Usage: app.dependency_overrides[get_async_db] = async_db
+    Data added through db_session must be committed to be visible.
+    Each request gets its own session (and aiosqlite connection).
+    """
+    url = async_database_url(db_session.get_bind().url.render_as_string(hide_password=False))
+    engine = create_async_engine(url, poolclass=NullPool)
+    factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async def override():
+        async with factory() as session:
+            yield session
+
+    override.engine = engine  # For statement listeners (engine.sync_engine)
+    yield override
+
+    engine.sync_engine.dispose()
+
+
 @pytest.fixture(scope="function")
 async def redis_client():
     """
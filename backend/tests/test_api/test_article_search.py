@@ -0,0 +1,107 @@
+"""
+Tests for full-text search through the `search` parameter
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from app.database import get_async_db, get_db
+from app.main import app
+from app.models.article import Article
+from app.models.source import Source
+from app.services.search import apply_article_search, search_terms
+
+
+@pytest.fixture
+def client(db_session, async_db):
+    source = Source(name="HackerNews", type="hackernews", config={}, is_active=True)
+    db_session.add(source)
+    db_session.flush()
+
+    articles = [
+        ("Rust async runtimes compared", "Tokio and async-std benchmarks", "alice"),
+        ("Weekly digest", "A short note about rust and asynchronous code in Python", "bob"),
+        ("Python packaging", "uv, pip and poetry", "rustacean"),
+        ("Kubernetes operators", "Writing controllers in Go", "carol"),
+    ]
+    for i, (title, content, author) in enumerate(articles):
+        db_session.add(Article(
+            title=title, content=content, author=author, url=f"https://example.com/{i}",
+            score=50.0 - i, published_at=datetime(2026, 1, 1 + i), source_id=source.id
+        ))
+    db_session.commit()
+
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_async_db] = async_db
+    yield TestClient(app), db_session
+    app.dependency_overrides.clear()
+
+
+def _titles(client, url):
+    return [a["title"] for a in client.get(url).json()["data"]]
+
+
+def test_search_terms_drop_operators():
+    assert search_terms('Rust "async" OR -python*') == ["rust", "async", "or", "python"]
+    assert search_terms("!!!") == []
+
+
+def test_prefix_and_all_terms(client):
+    client, _ = client
+
+    # "rust" prefixes "rustacean" (author); "async" + "rust" needs both words
+    assert set(_titles(client, "/api/articles?search=rust")) == {
+        "Rust async runtimes compared", "Weekly digest", "Python packaging"
+    }
+    assert set(_titles(client, "/api/articles?search=rust%20async")) == {
+        "Rust async runtimes compared", "Weekly digest"
+    }
+    assert _titles(client, "/api/articles?search=nomatch") == []
+
+
+def test_ranked_by_relevance_with_snippets(client):
+    client, _ = client
+    data = client.get("/api/articles?search=rust%20async").json()
+
+    assert data["total"] == 2
+    assert data["data"][0]["title"] == "Rust async runtimes compared"  # Title hit ranks first
+    assert "<mark>" in data["data"][1]["search_snippet"]
+
+    by_date = client.get("/api/articles?search=rust&sort=date").json()["data"]
+    assert [a["title"] for a in by_date][0] == "Python packaging"
+
+
+def test_index_follows_updates_and_deletes(client):
+    client, db = client
+    article = db.query(Article).filter_by(title="Kubernetes operators").one()
+    article.content = "Operators written in Rust"
+    db.commit()
+
+    assert "Kubernetes operators" in _titles(client, "/api/articles?search=rust")
+
+    db.query(Article).filter_by(id=article.id).delete()
+    db.commit()
+    assert "Kubernetes operators" not in _titles(client, "/api/articles?search=rust")
+
+
+def test_relevance_cursor_pages(client):
+    client, _ = client
+    first = client.get("/api/articles?search=rust&limit=2").json()
+    second = client.get(f"/api/articles?search=rust&limit=2&cursor={first['nextCursor']}").json()
+
+    ids = [a["id"] for a in first["data"] + second["data"]]
+    assert len(ids) == len(set(ids)) == 3
+    assert second["hasMore"] is False
+
+
+def test_postgresql_uses_search_vector():
+    query, rank, snippet = apply_article_search(Query(Article), "rust async", "postgresql")
+    sql = str(query.statement.compile(dialect=postgresql.dialect()))
+
+    assert "articles.search_vector @@ to_tsquery('english'::regconfig" in sql
+    assert "ILIKE" not in sql.upper()
+    assert rank is not None and snippet is not None
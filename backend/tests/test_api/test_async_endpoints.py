@@ -0,0 +1,100 @@
+"""
+Tests for read endpoints served by the async session (get_async_db)
+"""
+
+from datetime import date, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, async_database_url, get_async_db
+from app.main import app
+from app.models.article import Article
+from app.models.comment import Comment
+from app.models.keyword import Keyword
+from app.models.source import Source
+from app.models.trend import Trend
+from app.models.user import User
+from app.utils import response_cache
+
+
+@pytest.fixture
+def client(db_session, async_db, monkeypatch):
+    engine = db_session.get_bind()
+    for name in ("trends", "users", "comments"):
+        Base.metadata.tables[name].create(engine, checkfirst=True)
+
+    # No Redis here: serve every request from the database
+    monkeypatch.setattr(response_cache.settings, "RESPONSE_CACHE_ENABLED", False)
+
+    source = Source(name="HackerNews", type="hackernews", config={}, is_active=True)
+    user = User(email="alice@example.com", username="alice")
+    db_session.add_all([source, user, Keyword(keyword="rust", category="dev", weight=1.0)])
+    db_session.flush()
+    db_session.add_all([
+        Article(title=f"Article {i}", url=f"https://example.com/{i}", source_id=source.id,
+                category="dev" if i % 2 else "ai", score=10.0 * i,
+                published_at=datetime(2026, 1, 1 + i))
+        for i in range(4)
+    ])
+    db_session.add_all([
+        Trend(keyword="rust", category="dev", trend_score=5.0, article_count=3, date=date.today()),
+        Trend(keyword="go", category="dev", trend_score=2.0, article_count=1, date=date.today()),
+    ])
+    parent = Comment(author_id=user.id, target_type="article", target_id=1, content="First")
+    db_session.add(parent)
+    db_session.flush()
+    db_session.add_all([
+        Comment(author_id=user.id, target_type="article", target_id=1, content="Second"),
+        Comment(author_id=user.id, target_type="article", target_id=1, content="Reply", parent_id=parent.id),
+        Comment(author_id=user.id, target_type="article", target_id=1, content="[deleted]",
+                parent_id=parent.id, is_deleted=True),
+    ])
+    db_session.commit()
+
+    app.dependency_overrides[get_async_db] = async_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_analytics_summary(client):
+    body = client.get("/api/analytics/summary").json()
+
+    assert body["total_articles"] == 4
+    assert body["total_sources"] == 1
+    assert body["total_keywords"] == 1
+    assert body["articles_by_category"] == {"ai": 2, "dev": 2}
+    assert [t["keyword"] for t in body["top_trends"]] == ["rust", "go"]
+
+
+def test_top_keywords(client):
+    body = client.get("/api/analytics/top-keywords?limit=1").json()
+
+    assert body == {"top_keywords": [
+        {"keyword": "rust", "category": "dev", "total_articles": 3, "avg_score": 5.0}
+    ]}
+
+
+def test_article_comments_with_reply_counts(client):
+    body = client.get("/api/comments/article/1").json()
+
+    assert body["total"] == 2
+    assert {c["content"]: c["replies_count"] for c in body["data"]} == {"First": 1, "Second": 0}
+    assert body["data"][0]["author"]["username"] == "alice"
+
+
+def test_comment_replies(client):
+    assert [c["content"] for c in client.get("/api/comments/1/replies").json()["data"]] == ["Reply"]
+    assert client.get("/api/comments/999/replies").status_code == 404
+
+
+def test_article_by_id(client):
+    assert client.get("/api/articles/2").json()["title"] == "Article 1"
+    assert client.get("/api/articles/999").status_code == 404
+
+
+def test_async_database_url():
+    assert async_database_url("postgresql://u:p@db:5432/app") == "postgresql+asyncpg://u:p@db:5432/app"
+    assert async_database_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+    with pytest.raises(ValueError):
+        async_database_url("mysql://u:p@db/app")
@@ -0,0 +1,96 @@
+"""
+Tests for cursor (keyset) pagination on list endpoints
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import get_async_db, get_db
+from app.main import app
+from app.models.article import Article
+from app.models.source import Source
+
+
+@pytest.fixture
+def client(db_session, async_db):
+    """17 articles with tied and NULL scores, 6 of them bookmarked"""
+    source = Source(name="HackerNews", type="hackernews", config={}, is_active=True)
+    db_session.add(source)
+    db_session.flush()
+
+    for i in range(17):
+        db_session.add(Article(
+            title=f"Article {i}", url=f"https://example.com/{i}",
+            score=None if i % 5 == 0 else float(i % 3) * 10,
+            upvotes=i % 4, comments_count=i % 2,
+            published_at=datetime(2026, 1, 1 + i % 6),
+            is_bookmarked=i % 3 == 0,
+            bookmarked_at=datetime(2026, 2, 1 + i) if i % 3 == 0 and i != 9 else None,
+            source_id=source.id
+        ))
+    db_session.commit()
+
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_async_db] = async_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _walk(client, url, key="data"):
+    """Follow nextCursor until the last page, returning ids in order"""
+    ids, cursor, pages = [], None, 0
+    while True:
+        page = client.get(url + (f"&cursor={cursor}" if cursor else "")).json()
+        ids += [item["id"] for item in page[key]]
+        pages += 1
+        cursor = page["nextCursor"]
+        assert page["hasMore"] == (cursor is not None)
+        if not cursor:
+            return ids, pages
+
+
+@pytest.mark.parametrize("sort", ["score", "date", "popularity"])
+def test_cursor_walk_matches_offset_order(client, sort):
+    full = client.get(f"/api/articles?sort={sort}&limit=200").json()
+    expected = [a["id"] for a in full["data"]]
+
+    ids, pages = _walk(client, f"/api/articles?sort={sort}&limit=4")
+
+    assert full["total"] == 17
+    assert ids == expected
+    assert pages == 5
+
+
+def test_cursor_mode_skips_total(client):
+    first = client.get("/api/articles?limit=4").json()
+    second = client.get(f"/api/articles?limit=4&cursor={first['nextCursor']}").json()
+
+    assert first["total"] == 17
+    assert second["total"] is None
+    assert not set(a["id"] for a in first["data"]) & set(a["id"] for a in second["data"])
+
+
+def test_score_sort_puts_unscored_last(client):
+    data = client.get("/api/articles?sort=score&limit=200").json()["data"]
+    scores = [a["score"] for a in data]
+
+    assert scores[-4:] == [None] * 4
+    assert scores[:-4] == sorted(scores[:-4], reverse=True)
+
+
+def test_library_cursor_walk(client):
+    full = client.get("/api/library?limit=200").json()
+    ids, _ = _walk(client, "/api/library?limit=2", key="items")
+
+    assert full["total"] == 6
+    assert full["unread_count"] == 6
+    assert ids == [item["id"] for item in full["items"]]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "eyJzIjoiZGF0ZSIsInYiOlsxLDJdfQ"])
+def test_invalid_or_foreign_cursor_is_rejected(client, cursor):
+    response = client.get(f"/api/articles?sort=score&cursor={cursor}")
+
+    assert response.status_code == 400
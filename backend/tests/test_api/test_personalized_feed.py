@@ -0,0 +1,145 @@
+"""
+Tests for GET /api/personalized/feed
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.auth.deps import get_current_user
+from app.database import Base, get_async_db, get_db
+from app.main import app
+from app.models.article import Article
+from app.models.source import Source
+from app.models.user import User
+from app.models.user_article_score import UserArticleScore
+from app.models.user_keyword import UserKeyword
+
+
+@pytest.fixture
+def feed_client(db_session, async_db):
+    """Client authenticated as a user with keywords and scores for 5 of 8 articles"""
+    engine = db_session.get_bind()
+    for name in ('users', 'user_keywords', 'user_article_scores'):
+        Base.metadata.tables[name].create(engine, checkfirst=True)
+
+    source = Source(name="HackerNews", type="hackernews", config={}, is_active=True)
+    user = User(email="alice@example.com", username="alice")
+    db_session.add_all([source, user])
+    db_session.flush()
+    db_session.add(UserKeyword(user_id=user.id, keyword="rust", weight=1.0))
+
+    for i in range(8):
+        article = Article(
+            title=f"Article {i}", url=f"https://example.com/{i}", score=10.0 + i,
+            source_id=source.id, published_at=datetime(2026, 1, i + 1)
+        )
+        db_session.add(article)
+        db_session.flush()
+        if i < 5:
+            db_session.add(UserArticleScore(
+                user_id=user.id, article_id=article.id, score=90.0 - i, keyword_matches=i
+            ))
+    db_session.commit()
+
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_async_db] = async_db
+    app.dependency_overrides[get_current_user] = lambda: user
+    yield TestClient(app), async_db.engine.sync_engine
+    app.dependency_overrides.clear()
+
+
+def _count_selects(engine, fn):
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return result, [s for s in statements if "FROM articles" in s]
+
+
+def test_feed_page_is_a_single_select(feed_client):
+    client, engine = feed_client
+
+    response, article_selects = _count_selects(
+        engine, lambda: client.get("/api/personalized/feed?limit=200")
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(article_selects) == 1
+    assert data["total"] == 8
+    assert data["hasMore"] is False
+    assert [a["personalized_score"] for a in data["data"][:5]] == [90.0, 89.0, 88.0, 87.0, 86.0]
+    assert data["data"][1]["keyword_matches"] == 1
+    assert data["data"][5]["personalized_score"] is None
+
+
+def test_feed_exact_count_past_last_page(feed_client):
+    client, _ = feed_client
+
+    data = client.get("/api/personalized/feed?limit=5&offset=10").json()
+
+    assert data["data"] == []
+    assert data["total"] == 8
+    assert data["hasMore"] is False
+
+
+def test_feed_without_count(feed_client):
+    client, engine = feed_client
+
+    response, article_selects = _count_selects(
+        engine, lambda: client.get("/api/personalized/feed?limit=3&offset=3&count=none")
+    )
+    data = response.json()
+
+    assert len(article_selects) == 1
+    assert data["total"] is None
+    assert len(data["data"]) == 3
+    assert data["hasMore"] is True
+
+    last = client.get("/api/personalized/feed?limit=3&offset=6&count=none").json()
+    assert len(last["data"]) == 2
+    assert last["hasMore"] is False
+
+
+def test_feed_estimated_count(feed_client):
+    """SQLite has no planner estimate: falls back to the exact count"""
+    client, _ = feed_client
+
+    data = client.get("/api/personalized/feed?limit=3&count=estimated").json()
+
+    assert data["total"] == 8
+    assert data["hasMore"] is True
+
+
+def test_feed_cursor_pages(feed_client):
+    client, _ = feed_client
+    expected = [a["id"] for a in client.get("/api/personalized/feed?limit=200").json()["data"]]
+
+    first = client.get("/api/personalized/feed?limit=5").json()
+    second = client.get(f"/api/personalized/feed?limit=5&cursor={first['nextCursor']}").json()
+
+    assert [a["id"] for a in first["data"] + second["data"]] == expected
+    assert second["total"] == 8
+    assert second["hasMore"] is False
+    assert second["nextCursor"] is None
+
+
+@pytest.mark.parametrize("count", ["exact", "none"])
+def test_feed_search_snippet(feed_client, db_session, count):
+    client, _ = feed_client
+    article = db_session.query(Article).filter_by(title="Article 2").one()
+    article.content = "A rust rewrite of the scheduler"
+    db_session.commit()
+
+    data = client.get(f"/api/personalized/feed?search=rust&count={count}").json()
+
+    assert [a["title"] for a in data["data"]] == ["Article 2"]
+    assert "<mark>rust</mark>" in data["data"][0]["search_snippet"]
+    if count == "exact":
+        assert data["total"] == 1
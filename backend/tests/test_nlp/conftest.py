@@ -0,0 +1,31 @@
+"""
+Shared fixtures for NLP tests
+"""
+
+import numpy as np
+import pytest
+import spacy
+
+from app.nlp import scorer as scorer_module
+from app.nlp.scorer import get_scorer
+
+VOCAB = ["python", "rust", "data", "claude", "ai", "learning", "machine", "kubernetes"]
+
+
+@pytest.fixture
+def fake_spacy(monkeypatch):
+    """Replace spacy.load with a blank English pipeline that has word vectors"""
+    loads = []
+
+    def fake_load(model_name, **kwargs):
+        loads.append(model_name)
+        nlp = spacy.blank("en")
+        rng = np.random.default_rng(42)
+        for word in VOCAB:
+            nlp.vocab.set_vector(word, rng.standard_normal(16).astype("float32"))
+        return nlp
+
+    monkeypatch.setattr(scorer_module.spacy, "load", fake_load)
+    get_scorer.cache_clear()
+    yield loads
+    get_scorer.cache_clear()
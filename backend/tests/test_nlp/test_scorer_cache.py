@@ -0,0 +1,90 @@
+"""
+Tests for the process-wide scorer and its keyword vector cache
+"""
+
+import numpy as np
+import pytest
+
+from app.nlp.scorer import ArticleScorer, get_scorer
+
+KEYWORDS = [
+    {"keyword": "python", "weight": 2.0, "category": "dev"},
+    {"keyword": "rust", "weight": 1.0, "category": "dev"},
+    {"keyword": "unknownword", "weight": 1.0, "category": "other"},
+]
+
+
+def test_get_scorer_loads_model_once(fake_spacy):
+    """Repeated task runs reuse the same scorer and spaCy model"""
+    first = get_scorer("en")
+    second = get_scorer("en")
+
+    assert first is second
+    assert len(fake_spacy) == 1
+
+
+def test_semantic_score_matches_doc_similarity(fake_spacy):
+    """Vectorized cached similarity gives the same result as Doc.similarity"""
+    scorer = ArticleScorer(language="en")
+    doc = scorer.nlp("machine learning with python and data")
+
+    expected_sims = []
+    for kw in KEYWORDS:
+        kw_doc = scorer.nlp(kw["keyword"])
+        if kw_doc.has_vector:
+            expected_sims.append(doc.similarity(kw_doc) * kw["weight"])
+    expected = max(0.0, min(100.0, np.mean(sorted(expected_sims, reverse=True)[:5]) * 100))
+
+    assert scorer._semantic_similarity_score(doc, KEYWORDS) == pytest.approx(expected, rel=1e-5)
+
+
+def test_keyword_vectors_parsed_once_per_keyword_set(fake_spacy, monkeypatch):
+    """Keywords are parsed once per keyword set, not once per article"""
+    scorer = ArticleScorer(language="en")
+    calls = []
+    original_pipe = scorer.nlp.pipe
+
+    def counting_pipe(texts, *args, **kwargs):
+        texts = list(texts)
+        calls.append(texts)
+        return original_pipe(texts, *args, **kwargs)
+
+    monkeypatch.setattr(scorer.nlp, "pipe", counting_pipe)
+
+    for text in ["python news", "rust release", "ai learning"]:
+        scorer._semantic_similarity_score(scorer.nlp(text), KEYWORDS)
+    assert len(calls) == 1
+
+    # Active keyword set changed: cache is rebuilt
+    scorer._semantic_similarity_score(scorer.nlp("python"), KEYWORDS + [{"keyword": "claude"}])
+    assert len(calls) == 2
+    assert "claude" in calls[-1]
+
+
+def test_score_batch_matches_score_article(fake_spacy):
+    """Batched scoring yields the same results as per-article scoring, in order"""
+    scorer = ArticleScorer(language="en")
+    texts = [
+        "Python data pipelines with machine learning",
+        "",
+        "Rust and python interop",
+        None,
+        "Kubernetes operators in practice",
+    ]
+
+    batched = list(scorer.score_batch(iter(texts), KEYWORDS, batch_size=2))
+    expected = [scorer.score_article(text, KEYWORDS) for text in texts]
+
+    assert len(batched) == len(texts)
+    for got, want in zip(batched, expected):
+        assert got["category"] == want["category"]
+        assert got["overall_score"] == pytest.approx(want["overall_score"])
+        assert got["scores"] == pytest.approx(want["scores"])
+
+
+def test_score_batch_without_keywords(fake_spacy):
+    """No keywords means an empty result per text"""
+    scorer = ArticleScorer(language="en")
+    results = list(scorer.score_batch(["python", "rust"], []))
+
+    assert [r["overall_score"] for r in results] == [0.0, 0.0]
@@ -0,0 +1,224 @@
+"""
+Tests for the async Claude summarizer, against a local stub of the Anthropic API
+"""
+
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from app.models import Article
+from app.nlp import summarizer as summarizer_module
+from app.nlp import summary_cache
+from app.nlp.summarizer import ArticleSummarizer, estimate_tokens
+from app.scrapers.strategies import rate_limit
+from app.tasks import scoring
+
+CONTENT = "Python 3.13 ships a free-threaded build and a new JIT compiler. " * 5
+
+
+def _message(text):
+    return {
+        "id": "msg_1", "type": "message", "role": "assistant", "model": "claude-test",
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn", "stop_sequence": None,
+        "usage": {"input_tokens": 10, "output_tokens": 5},
+    }
+
+
+class StubAnthropic(BaseHTTPRequestHandler):
+    """Minimal /v1/messages and /v1/messages/batches endpoints"""
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, headers=None, content_type="application/json"):
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _batch(self, batch_id):
+        state = self.server.state
+        return {
+            "id": batch_id, "type": "message_batch",
+            "processing_status": "ended" if state["batch_ended"] else "in_progress",
+            "request_counts": {"processing": 0, "succeeded": 0, "errored": 0, "canceled": 0, "expired": 0},
+            "results_url": f"{state['base_url']}/v1/messages/batches/{batch_id}/results",
+            "created_at": "2026-03-10T12:00:00Z", "expires_at": "2026-03-11T12:00:00Z",
+            "ended_at": None, "archived_at": None, "cancel_initiated_at": None,
+        }
+
+    def do_POST(self):
+        state = self.server.state
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+        if self.path == "/v1/messages/batches":
+            state["batch_requests"] = body["requests"]
+            return self._send(200, self._batch("msgbatch_1"))
+
+        with state["lock"]:
+            state["requests"].append(body)
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            scripted = state["script"].pop(0) if state["script"] else None
+        time.sleep(state["delay"])
+        with state["lock"]:
+            state["in_flight"] -= 1
+
+        if scripted:
+            status, headers = scripted
+            return self._send(status, {"type": "error", "error": {"type": "overloaded_error", "message": "busy"}}, headers)
+        title = body["messages"][0]["content"].split("Titre: ")[1].split("\n")[0]
+        self._send(200, _message(f"Résumé de {title}"))
+
+    def do_GET(self):
+        if self.path.endswith("/results"):
+            lines = [
+                {"custom_id": request["custom_id"], "result": {"type": "succeeded", "message": _message(f"Résumé {request['custom_id']}")}}
+                for request in self.server.state["batch_requests"]
+            ]
+            lines[-1]["result"] = {"type": "errored", "error": {"type": "error", "error": {"type": "api_error", "message": "boom"}}}
+            return self._send(200, "\n".join(json.dumps(line) for line in lines).encode(), content_type="application/binary")
+        self._send(200, self._batch(self.path.rsplit("/", 1)[-1]))
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubAnthropic)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    server.state = {
+        "lock": threading.Lock(), "requests": [], "script": [], "delay": 0.0,
+        "in_flight": 0, "peak": 0, "batch_requests": [], "batch_ended": False, "base_url": base_url,
+    }
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setattr(summarizer_module.settings, "ANTHROPIC_API_KEY", "sk-ant-test")
+    monkeypatch.setattr(summarizer_module.settings, "ANTHROPIC_BASE_URL", base_url)
+    limiter_redis = fakeredis.aioredis.FakeRedis()
+    monkeypatch.setattr(rate_limit, "_async_client", lambda: limiter_redis)
+    monkeypatch.setattr(rate_limit, "_unavailable_until", 0.0)
+
+    yield server.state
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_summarize_batch_runs_concurrently_with_bounded_concurrency(stub_api):
+    stub_api["delay"] = 0.05
+    summarizer = ArticleSummarizer(max_concurrency=3)
+    articles = [{"id": str(i), "title": f"Article {i}", "content": CONTENT} for i in range(9)]
+    articles.append({"id": "short", "title": "Short", "content": "too short"})
+
+    start = time.monotonic()
+    summaries = await summarizer.summarize_batch(articles)
+    elapsed = time.monotonic() - start
+
+    assert summaries["4"] == "Résumé de Article 4"
+    assert summaries["short"] is None
+    assert len(stub_api["requests"]) == 9
+    assert stub_api["peak"] == 3
+    assert elapsed < 9 * 0.05
+    assert stub_api["requests"][0]["model"] == summarizer.model
+
+
+@pytest.mark.asyncio
+async def test_summarize_retries_rate_limited_and_overloaded_responses(stub_api, monkeypatch):
+    stub_api["script"] = [(429, {"retry-after": "2"}), (529, {})]
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        await real_sleep(0)
+
+    monkeypatch.setattr(summarizer_module.asyncio, "sleep", fake_sleep)
+    summarizer = ArticleSummarizer(max_retries=2)
+
+    assert await summarizer.summarize("Retry", CONTENT) == "Résumé de Retry"
+    assert len(stub_api["requests"]) == 3
+    assert sleeps[0] == 2.0  # retry-after honoured
+    assert 0.5 <= sleeps[1] <= 2.0  # exponential backoff with jitter
+
+    stub_api["script"] = [(529, {"retry-after": "0"})] * 3
+    assert await summarizer.summarize("Gives up", CONTENT) is None
+
+
+@pytest.mark.asyncio
+async def test_each_attempt_reserves_request_and_token_budgets(stub_api, monkeypatch):
+    summarizer = ArticleSummarizer()
+    reserved = []
+
+    async def record(self, cost=1):
+        reserved.append((self.provider, cost))
+
+    monkeypatch.setattr(rate_limit.DistributedRateLimiter, "acquire", record)
+    await summarizer.summarize("Budget", CONTENT)
+
+    prompt = stub_api["requests"][0]["messages"][0]["content"]
+    assert reserved == [
+        ("anthropic:requests", 1),
+        ("anthropic:input_tokens", estimate_tokens(prompt)),
+        ("anthropic:output_tokens", 500),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_message_batch_submit_and_collect(stub_api):
+    summarizer = ArticleSummarizer()
+    articles = [{"id": str(i), "title": f"Article {i}", "content": CONTENT} for i in (1, 2, 3)]
+    articles.append({"id": "4", "title": "Empty", "content": None})
+
+    batch_id = await summarizer.submit_batch(articles)
+
+    assert batch_id == "msgbatch_1"
+    assert [r["custom_id"] for r in stub_api["batch_requests"]] == ["1", "2", "3"]
+    assert await summarizer.fetch_batch_results(batch_id) is None
+
+    stub_api["batch_ended"] = True
+    assert await summarizer.fetch_batch_results(batch_id) == {"1": "Résumé 1", "2": "Résumé 2", "3": None}
+
+
+def test_daily_backlog_goes_through_batches(stub_api, db_session, monkeypatch):
+    for i in range(3):
+        db_session.add(Article(
+            title=f"Article {i}", url=f"https://example.com/{i}", external_id=str(i),
+            published_at=datetime(2026, 3, 10), content=CONTENT + str(i)
+        ))
+    db_session.commit()
+
+    store = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(scoring, "_pending_batches", lambda: store)
+    monkeypatch.setattr(summary_cache, "_redis_client", lambda: store)
+    monkeypatch.setattr(scoring, "SessionLocal", lambda: db_session)
+    monkeypatch.setattr(scoring, "invalidate_tags", lambda *tags: None)
+    monkeypatch.setattr(db_session, "close", lambda: None)
+
+    submitted = scoring.summarize_articles(use_batches=True)
+    assert submitted["status"] == "submitted"
+    assert scoring.summarize_articles(use_batches=True)["reason"] == "batch_pending"
+    assert scoring.collect_summary_batches()["batches_pending"] == 1
+
+    stub_api["batch_ended"] = True
+    collected = scoring.collect_summary_batches()
+
+    assert collected["articles_summarized"] == 2
+    assert not store.smembers(scoring.SUMMARY_BATCHES_KEY)
+    summaries = {a.id: a.summary for a in db_session.query(Article)}
+    assert summaries == {1: "Résumé 1", 2: "Résumé 2", 3: None}
+    assert len(summary_cache.SummaryCache(db_session).get_many(
+        summary_cache.summary_cache_key(CONTENT + str(i), summarizer_module.settings.SUMMARY_MODEL) for i in range(3)
+    )) == 2
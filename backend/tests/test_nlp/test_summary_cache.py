@@ -0,0 +1,110 @@
+"""
+Tests for the content-hash summary cache
+"""
+
+from datetime import datetime
+
+import fakeredis
+import pytest
+import redis
+
+from app.models import Article, SummaryCacheEntry
+from app.nlp import summary_cache
+from app.nlp.summarizer import ArticleSummarizer
+from app.nlp.summary_cache import SummaryCache, summary_cache_key
+from app.tasks import scoring
+
+POST = "<p>Rust 1.80 stabilises <b>LazyCell</b> and exclusive ranges in patterns.</p>\n" * 3
+MODEL = "claude-test"
+
+
+def test_cache_key_ignores_markup_case_and_whitespace():
+    syndicated = "  RUST 1.80 stabilises LazyCell   and exclusive ranges in patterns.\n" * 3
+
+    assert summary_cache_key(POST, MODEL) == summary_cache_key(syndicated, MODEL)
+    assert summary_cache_key(POST, MODEL) != summary_cache_key(POST, "claude-other")
+    assert summary_cache_key(POST, MODEL) != summary_cache_key(POST, MODEL, max_length=100)
+    assert summary_cache_key(POST, MODEL) != summary_cache_key(POST.replace("1.80", "1.81"), MODEL)
+
+
+def test_prompt_version_changes_keys(monkeypatch):
+    key = summary_cache_key(POST, MODEL)
+    monkeypatch.setattr(summary_cache, "PROMPT_VERSION", "2")
+
+    assert summary_cache_key(POST, MODEL) != key
+
+
+def test_database_fallback_refills_redis(db_session):
+    store = fakeredis.FakeRedis(decode_responses=True)
+    cache = SummaryCache(db_session, redis_client=store)
+    cache.set_many({"a" * 64: "Résumé A", "b" * 64: None}, MODEL)
+    db_session.commit()
+
+    store.flushall()
+    assert cache.get_many(["a" * 64, "b" * 64]) == {"a" * 64: "Résumé A"}
+    assert store.get(f"{summary_cache.KEY_PREFIX}:{'a' * 64}") == "Résumé A"
+
+    # Re-storing a key does not duplicate the row
+    cache.set_many({"a" * 64: "Résumé A"}, MODEL)
+    db_session.commit()
+    assert db_session.query(SummaryCacheEntry).count() == 1
+
+
+def test_works_without_redis(db_session):
+    class DownRedis:
+        def mget(self, keys):
+            raise redis.ConnectionError("down")
+
+    cache = SummaryCache(db_session, redis_client=DownRedis())
+    assert cache.get_many(["a" * 64]) == {}
+    assert cache.redis is None
+
+    cache.set_many({"a" * 64: "Résumé A"}, MODEL)
+    cache.record(hits=1, misses=0)
+    assert cache.get_many(["a" * 64]) == {"a" * 64: "Résumé A"}
+    assert cache.stats()["hits"] == 0
+
+
+@pytest.fixture
+def summarize_task(db_session, monkeypatch):
+    store = fakeredis.FakeRedis(decode_responses=True)
+    calls = []
+
+    async def fake_summarize_batch(self, articles, max_length=200):
+        calls.append([article["title"] for article in articles])
+        return {article["id"]: f"Résumé de {article['title']}" for article in articles}
+
+    monkeypatch.setattr(scoring.settings, "ANTHROPIC_API_KEY", "sk-ant-test")
+    monkeypatch.setattr(ArticleSummarizer, "summarize_batch", fake_summarize_batch)
+    monkeypatch.setattr(summary_cache, "_redis_client", lambda: store)
+    monkeypatch.setattr(scoring, "SessionLocal", lambda: db_session)
+    monkeypatch.setattr(scoring, "invalidate_tags", lambda *tags: None)
+    monkeypatch.setattr(db_session, "close", lambda: None)
+    return calls
+
+
+def _add(db_session, title, content):
+    db_session.add(Article(
+        title=title, url=f"https://example.com/{title}", published_at=datetime(2026, 3, 10), content=content
+    ))
+    db_session.commit()
+
+
+def test_summarize_articles_reuses_cached_summaries(db_session, summarize_task):
+    _add(db_session, "medium", POST)
+    _add(db_session, "devto", POST.upper())
+    _add(db_session, "other", "Kubernetes 1.31 removes in-tree cloud providers for good. " * 3)
+
+    first = scoring.summarize_articles()
+
+    assert summarize_task == [["medium", "other"]]
+    assert (first["api_requests"], first["cache_hits"], first["articles_summarized"]) == (2, 1, 3)
+    assert db_session.query(Article).filter_by(title="devto").one().summary == "Résumé de medium"
+
+    # Same post scraped again from Reddit: no API call
+    _add(db_session, "reddit", POST)
+    second = scoring.summarize_articles()
+
+    assert len(summarize_task) == 1
+    assert (second["api_requests"], second["cache_hits"], second["articles_summarized"]) == (0, 1, 1)
+    assert SummaryCache(db_session).stats() == {"hits": 2, "misses": 2, "hit_rate": 0.5}
@@ -0,0 +1,125 @@
+"""
+Tests for the corpus TF-IDF model and its use by the scorer
+"""
+
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from app.models.article import Article
+from app.models.source import Source
+from app.nlp.scorer import ArticleScorer
+from app.nlp.tfidf_model import CorpusTfidfModel, load_tfidf_model
+
+KEYWORDS = [
+    {"keyword": "python", "weight": 2.0, "category": "dev"},
+    {"keyword": "rust", "weight": 1.0, "category": "dev"},
+]
+
+CORPUS = [
+    "Python release brings faster data processing",
+    "Rust compiler improves borrow checker diagnostics",
+    "Kubernetes operators written in Go and Rust",
+    "Machine learning with Python and numpy",
+]
+NEW_DOCS = [
+    "Python packaging gets a new lock file format",
+    "Rust async runtime benchmarks",
+]
+
+
+def test_partial_fit_matches_full_refit_idf():
+    """Incremental document frequencies give the same IDF as refitting on the union"""
+    model = CorpusTfidfModel.fit(CORPUS, last_article_id=4)
+    added = model.partial_fit(NEW_DOCS, last_article_id=6)
+
+    reference = TfidfVectorizer(
+        vocabulary=model.vectorizer.vocabulary_,
+        stop_words='english',
+        ngram_range=(1, 2)
+    ).fit(CORPUS + NEW_DOCS)
+
+    assert added == 2
+    assert model.n_docs == 6
+    assert model.last_article_id == 6
+    np.testing.assert_allclose(model._idf, reference.idf_)
+
+    texts = ["python data and rust"]
+    expected = reference.transform(texts).toarray()
+    np.testing.assert_allclose(model.transform(texts).toarray(), expected, rtol=1e-6)
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    path = str(tmp_path / "models" / "tfidf.joblib")
+    model = CorpusTfidfModel.fit(CORPUS, last_article_id=4)
+    model.save(path)
+
+    loaded = load_tfidf_model(path)
+
+    assert loaded.n_docs == 4
+    assert loaded.last_article_id == 4
+    np.testing.assert_allclose(
+        loaded.similarities(["python data"], KEYWORDS),
+        model.similarities(["python data"], KEYWORDS)
+    )
+    assert load_tfidf_model(str(tmp_path / "missing.joblib")) is None
+
+
+def test_scorer_uses_corpus_model_and_reloads(fake_spacy, tmp_path):
+    """Batch and single scoring agree, and a rewritten model file is picked up"""
+    path = str(tmp_path / "tfidf.joblib")
+    scorer = ArticleScorer(language="en", tfidf_model_path=path)
+    text = "Python release brings faster data processing"
+
+    assert scorer._current_tfidf_model() is None
+
+    CorpusTfidfModel.fit(CORPUS).save(path)
+    single = scorer.score_article(text, KEYWORDS)
+    batched = next(scorer.score_batch([text], KEYWORDS))
+    assert single["scores"]["tfidf"] == pytest.approx(batched["scores"]["tfidf"])
+    assert single["scores"]["tfidf"] > 0
+
+    first_model = scorer._current_tfidf_model()
+    CorpusTfidfModel.fit(CORPUS + NEW_DOCS).save(path)
+    os.utime(path, (0, 0))
+    assert scorer._current_tfidf_model() is not first_model
+    assert scorer._current_tfidf_model().n_docs == 6
+
+
+def test_refresh_task_full_then_incremental(db_session, tmp_path):
+    """First run fits the whole corpus, later runs only add new articles"""
+    from app.tasks.scoring import refresh_tfidf_model
+
+    source = Source(name="HackerNews", type="hackernews", config={}, is_active=True)
+    db_session.add(source)
+    db_session.commit()
+    source_id = source.id
+
+    def add_articles(titles):
+        for title in titles:
+            db_session.add(Article(
+                title=title,
+                url=f"https://example.com/{title.replace(' ', '-')}",
+                source_id=source_id,
+                published_at=datetime(2026, 1, 1),
+            ))
+        db_session.commit()
+
+    path = str(tmp_path / "tfidf.joblib")
+    add_articles(CORPUS)
+
+    with patch("app.tasks.scoring.SessionLocal", return_value=db_session), \
+            patch("app.tasks.scoring.settings.TFIDF_MODEL_PATH", path):
+        first = refresh_tfidf_model()
+        add_articles(NEW_DOCS)
+        second = refresh_tfidf_model()
+
+    assert first["mode"] == "full"
+    assert first["documents_added"] == 4
+    assert second["mode"] == "incremental"
+    assert second["documents_added"] == 2
+    assert load_tfidf_model(path).n_docs == 6
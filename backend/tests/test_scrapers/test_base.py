@@ -35,3 +35,61 @@ async def test_quick_match():
     assert await scraper._quick_match("Learn Python Programming", keywords) == True
     assert await scraper._quick_match("Django REST Framework", keywords) == True
     assert await scraper._quick_match("Java Spring Boot", keywords) == False
+
+
+class StreamingScraper(ConcreteScraper):
+    CACHE_CHUNK_SIZE = 2
+
+    def __init__(self, redis_client=None, count=5):
+        super().__init__(redis_client)
+        self.count = count
+        self.calls = 0
+
+    async def iter_articles(self, config, keywords):
+        from datetime import datetime
+        from app.schemas.scraped_article import ScrapedArticle
+
+        self.calls += 1
+        for i in range(self.count):
+            yield ScrapedArticle(
+                title=f"Article {i}", url=f"https://example.com/{i}", source_type="test",
+                external_id=str(i), published_at=datetime(2026, 1, 1)
+            )
+
+
+@pytest.mark.asyncio
+async def test_iter_with_cache_streams_then_replays_cache_in_chunks():
+    import fakeredis.aioredis
+
+    redis = fakeredis.aioredis.FakeRedis()
+    scraper = StreamingScraper(redis)
+
+    first = [a.title async for a in scraper.iter_with_cache({}, ["python"])]
+    cache_key = scraper._make_cache_key(["python"], {})
+    assert await redis.llen(cache_key) == 5
+    assert 0 < await redis.ttl(cache_key) <= scraper.CACHE_TTL
+
+    second = await scraper.scrape_with_cache({}, ["python"])
+    assert [a.title for a in second] == first == [f"Article {i}" for i in range(5)]
+    assert scraper.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_interrupted_stream_leaves_no_cache_entry():
+    import fakeredis.aioredis
+
+    redis = fakeredis.aioredis.FakeRedis()
+    scraper = StreamingScraper(redis)
+
+    stream = scraper.iter_with_cache({}, [])
+    async for _ in stream:
+        break
+    await stream.aclose()
+
+    assert not await redis.exists(scraper._make_cache_key([], {}))
+    assert scraper.calls == 1
+
+    # Entries cached in the previous format are a miss, then replaced
+    await redis.set(scraper._make_cache_key([], {}), "[]")
+    assert len(await scraper.scrape_with_cache({}, [])) == 5
+    assert scraper.calls == 2
@@ -0,0 +1,158 @@
+"""
+Tests for conditional GET (ETag / Last-Modified) in ScraperPlugin
+"""
+
+import fakeredis.aioredis
+import httpx
+import pytest
+import respx
+
+from app.scrapers.base import ScraperPlugin
+
+FEED_URL = "https://example.com/feed.xml"
+RSS = (
+    '<?xml version="1.0"?><rss version="2.0"><channel><title>Blog</title>'
+    '<item><title>Hello</title><link>https://example.com/hello</link></item>'
+    '</channel></rss>'
+)
+
+
+class FeedScraper(ScraperPlugin):
+    name = "test"
+    display_name = "Test"
+    version = "1.0.0"
+
+    async def scrape(self, config, keywords):
+        return []
+
+    def validate_config(self, config):
+        return True
+
+
+@pytest.fixture
+def scraper():
+    return FeedScraper(redis_client=fakeredis.aioredis.FakeRedis())
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_validators_are_sent_and_304_skips_parsing(scraper):
+    route = respx.get(FEED_URL).mock(side_effect=[
+        httpx.Response(200, text=RSS, headers={
+            "ETag": '"v1"', "Last-Modified": "Mon, 05 Jan 2026 10:00:00 GMT"
+        }),
+        httpx.Response(304),
+    ])
+
+    async with scraper:
+        first, = await scraper._fetch_feeds([FEED_URL])
+        await scraper.commit_validators()
+        second, = await scraper._fetch_feeds([FEED_URL])
+
+    assert [e.title for e in first.entries] == ["Hello"]
+    assert second is None
+    assert "if-none-match" not in route.calls[0].request.headers
+    assert route.calls[1].request.headers["if-none-match"] == '"v1"'
+    assert route.calls[1].request.headers["if-modified-since"] == "Mon, 05 Jan 2026 10:00:00 GMT"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_changed_feed_replaces_validators(scraper):
+    route = respx.get(FEED_URL).mock(side_effect=[
+        httpx.Response(200, text=RSS, headers={"ETag": '"v1"'}),
+        httpx.Response(200, text=RSS, headers={"ETag": '"v2"'}),
+        httpx.Response(304),
+    ])
+
+    async with scraper:
+        for _ in range(3):
+            await scraper._retry_request("GET", FEED_URL, conditional=True)
+            await scraper.commit_validators()
+
+    assert route.calls[2].request.headers["if-none-match"] == '"v2"'
+    assert await scraper._get_validators(FEED_URL) == {"etag": '"v2"'}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_validators_are_per_query_string(scraper):
+    route = respx.get("https://example.com/api/articles").respond(
+        json=[], headers={"ETag": '"tag-python"'}
+    )
+
+    async with scraper:
+        await scraper._retry_request(
+            "GET", "https://example.com/api/articles", params={"tag": "python"}, conditional=True
+        )
+        await scraper.commit_validators()
+        await scraper._retry_request(
+            "GET", "https://example.com/api/articles", params={"tag": "rust"}, conditional=True
+        )
+
+    assert "if-none-match" not in route.calls[1].request.headers
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_requests_are_unconditional_by_default(scraper):
+    route = respx.get(FEED_URL).respond(text=RSS, headers={"ETag": '"v1"'})
+
+    async with scraper:
+        await scraper._retry_request("GET", FEED_URL)
+        await scraper._retry_request("GET", FEED_URL)
+
+    assert "if-none-match" not in route.calls[1].request.headers
+    assert await scraper._get_validators(FEED_URL) == {}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_no_redis_means_plain_get():
+    scraper = FeedScraper()
+    route = respx.get(FEED_URL).respond(text=RSS, headers={"ETag": '"v1"'})
+
+    async with scraper:
+        feeds = await scraper._fetch_feeds([FEED_URL, FEED_URL])
+
+    assert all(feed is not None for feed in feeds)
+    assert all("if-none-match" not in call.request.headers for call in route.calls)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_validators_wait_for_commit(scraper):
+    """A run that fails before its articles are saved fetches the feed again"""
+    route = respx.get(FEED_URL).respond(text=RSS, headers={"ETag": '"v1"'})
+
+    async with scraper:
+        await scraper._fetch_feeds([FEED_URL])
+        await scraper._fetch_feeds([FEED_URL])
+
+    assert "if-none-match" not in route.calls[1].request.headers
+    assert await scraper._get_validators(FEED_URL) == {}
+
+    await scraper.commit_validators()
+    assert await scraper._get_validators(FEED_URL) == {"etag": '"v1"'}
+
+
+class StreamingFeedScraper(FeedScraper):
+    async def iter_articles(self, config, keywords):
+        await self._fetch_feeds([FEED_URL])
+        return
+        yield
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_validators_are_per_keywords(scraper):
+    """Items filtered out for other keywords are read again when the keywords change"""
+    scraper = StreamingFeedScraper(redis_client=scraper.redis)
+    route = respx.get(FEED_URL).respond(text=RSS, headers={"ETag": '"v1"'})
+
+    async with scraper:
+        await scraper.scrape_with_cache({}, ["python"])
+        await scraper.commit_validators()
+        await scraper.scrape_with_cache({}, ["rust"])
+
+    assert "if-none-match" not in route.calls[1].request.headers
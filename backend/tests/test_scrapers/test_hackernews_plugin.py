@@ -30,3 +30,94 @@ async def test_hackernews_scrape(monkeypatch):
 
     articles = await scraper.scrape({"max_articles": 10}, ["python"])
     assert len(articles) > 0
+
+
+def _mock_hn_api(story_count, latency=0.01, in_flight=None):
+    """Mock HN Firebase API with a fixed per-item latency
+
+    in_flight: optional {'now': 0, 'peak': 0} dict, updated with the item requests in flight
+    """
+    import asyncio
+    import httpx
+    import respx
+
+    respx.get("https://hacker-news.firebaseio.com/v0/topstories.json").mock(
+        return_value=httpx.Response(200, json=list(range(1, story_count + 1)))
+    )
+
+    async def item_response(request):
+        if in_flight is not None:
+            in_flight['now'] += 1
+            in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            if in_flight is not None:
+                in_flight['now'] -= 1
+        story_id = int(request.url.path.rsplit('/', 1)[-1].split('.')[0])
+        return httpx.Response(200, json={
+            'id': story_id,
+            'type': 'story',
+            'title': f'Python story {story_id}' if story_id % 2 else f'Story {story_id}',
+            'url': f'https://example.com/{story_id}',
+            'by': 'author',
+            'time': 1704067200,
+            'score': 10,
+            'descendants': 2
+        })
+
+    return respx.get(
+        url__regex=r"https://hacker-news\.firebaseio\.com/v0/item/\d+\.json"
+    ).mock(side_effect=item_response)
+
+
+@pytest.mark.asyncio
+async def test_hackernews_concurrent_fetch_benchmark():
+    """Concurrent pipeline keeps `concurrency` item fetches in flight, the serial path one"""
+    import respx
+    from app.scrapers.strategies.rate_limit import RateLimiter
+
+    story_count = 60
+
+    for concurrency in (1, 10):
+        in_flight = {'now': 0, 'peak': 0}
+        with respx.mock:
+            item_route = _mock_hn_api(story_count, in_flight=in_flight)
+            scraper = HackerNewsScraper()
+            scraper.rate_limiter = RateLimiter(requests_per_minute=100000)
+
+            async with scraper:
+                articles = await scraper.scrape(
+                    {"max_articles": story_count, "concurrency": concurrency},
+                    ["python"]
+                )
+
+        assert len(articles) == story_count // 2
+        # Only half the stories match: no early stop, every item fetched once
+        assert item_route.call_count == story_count
+        assert in_flight['peak'] == concurrency
+
+
+@pytest.mark.asyncio
+async def test_hackernews_stops_fetching_after_max_articles():
+    """No new item requests once max_articles matches are found, in ranking order"""
+    import respx
+    from app.scrapers.strategies.rate_limit import RateLimiter
+
+    with respx.mock:
+        item_route = _mock_hn_api(200)
+        scraper = HackerNewsScraper()
+        scraper.rate_limiter = RateLimiter(requests_per_minute=100000)
+
+        async with scraper:
+            articles = await scraper.scrape(
+                {"max_articles": 5, "concurrency": 4},
+                ["python"]
+            )
+
+    assert len(articles) == 5
+    assert [a.external_id for a in articles] == sorted(
+        (a.external_id for a in articles), key=int
+    )
+    # The 5th match is story 9: requests stop there, plus the 3 other workers' fetches
+    assert item_route.call_count <= 9 + 4 - 1
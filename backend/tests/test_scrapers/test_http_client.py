@@ -0,0 +1,177 @@
+"""
+Tests for the shared scraper HTTP client manager
+"""
+
+import asyncio
+import socket
+
+import httpcore
+import httpx
+import pytest
+import respx
+
+from app.scrapers import base
+from app.scrapers.base import ScraperPlugin
+from app.scrapers.http_client import CachingDNSBackend, ConnectionPoolTransport, HTTPClientManager
+from app.tasks import event_loop
+
+
+class ConcreteScraper(ScraperPlugin):
+    name = "test"
+    display_name = "Test"
+    version = "1.0.0"
+
+    async def scrape(self, config, keywords):
+        return []
+
+    def validate_config(self, config):
+        return True
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = HTTPClientManager(max_per_host=2, dns_cache_ttl=0)
+    monkeypatch.setattr(base, "http_clients", manager)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_plugins_borrow_one_client_per_loop(manager):
+    first, second = ConcreteScraper(), ConcreteScraper()
+
+    async with first:
+        client = first.client
+    async with second:
+        assert second.client is client
+
+    assert first.client is None
+    assert not client.is_closed
+
+    await manager.aclose()
+    assert client.is_closed
+    assert manager.get_client() is not client
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_requests_are_capped_per_host(manager):
+    in_flight = {"a.example.com": 0, "b.example.com": 0}
+    peak = dict(in_flight)
+
+    async def slow(request):
+        host = request.url.host
+        in_flight[host] += 1
+        peak[host] = max(peak[host], in_flight[host])
+        await asyncio.sleep(0.02)
+        in_flight[host] -= 1
+        return httpx.Response(200)
+
+    respx.get(url__regex=r"https://[ab]\.example\.com/.*").mock(side_effect=slow)
+    scraper = ConcreteScraper()
+
+    async with scraper:
+        await asyncio.gather(*[
+            scraper._retry_request("GET", f"https://{host}/{i}")
+            for host in in_flight for i in range(6)
+        ])
+
+    assert peak == {"a.example.com": 2, "b.example.com": 2}
+
+
+class RecordingBackend(httpcore.AsyncNetworkBackend):
+    def __init__(self, refuse=()):
+        self.dialed = []
+        self.refuse = set(refuse)
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.dialed.append(host)
+        if host in self.refuse:
+            raise httpcore.ConnectError(f"refused {host}")
+        return object()
+
+
+@pytest.fixture
+async def resolver(monkeypatch):
+    lookups = []
+
+    async def getaddrinfo(host, port, type=0):
+        lookups.append(host)
+        return [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", port)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.2", port)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", port)),
+        ]
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+    return lookups
+
+
+@pytest.mark.asyncio
+async def test_dns_cache_resolves_once_per_ttl(resolver):
+    backend = RecordingBackend()
+    dns = CachingDNSBackend(backend, ttl=60)
+
+    await dns.connect_tcp("example.com", 443)
+    await dns.connect_tcp("example.com", 443)
+    await dns.connect_tcp("127.0.0.1", 8080)
+
+    assert resolver == ["example.com"]
+    assert backend.dialed == ["10.0.0.1", "10.0.0.1", "127.0.0.1"]
+
+
+@pytest.mark.asyncio
+async def test_dns_cache_falls_back_and_evicts_on_failure(resolver):
+    backend = RecordingBackend(refuse={"10.0.0.1"})
+    dns = CachingDNSBackend(backend, ttl=60)
+
+    await dns.connect_tcp("example.com", 443)
+    assert backend.dialed == ["10.0.0.1", "10.0.0.2"]
+
+    backend.refuse.add("10.0.0.2")
+    with pytest.raises(httpcore.ConnectError):
+        await dns.connect_tcp("example.com", 443)
+    await dns.resolve("example.com", 443)
+
+    assert resolver == ["example.com", "example.com"]
+
+
+@pytest.mark.asyncio
+async def test_dns_cache_transport_serves_requests(resolver):
+    dns = CachingDNSBackend(httpcore.AsyncMockBackend([
+        b"HTTP/1.1 200 OK\r\n", b"Content-Length: 2\r\n", b"\r\n", b"ok",
+    ]), ttl=60)
+    pool = httpcore.AsyncConnectionPool(network_backend=dns, max_keepalive_connections=0)
+    async with httpx.AsyncClient(transport=ConnectionPoolTransport(pool)) as client:
+        first = await client.get("http://example.com/a")
+        second = await client.get("http://example.com/b")
+
+    assert (first.status_code, first.text, second.text) == (200, "ok", "ok")
+    assert resolver == ["example.com"]
+
+
+@pytest.mark.asyncio
+async def test_dns_cache_transport_raises_httpx_errors(resolver):
+    dns = CachingDNSBackend(RecordingBackend(refuse={"10.0.0.1", "10.0.0.2"}), ttl=60)
+    transport = ConnectionPoolTransport(httpcore.AsyncConnectionPool(network_backend=dns))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get("http://example.com/")
+
+
+def test_worker_loop_is_reused_until_shutdown(monkeypatch):
+    manager = HTTPClientManager(dns_cache_ttl=0)
+    monkeypatch.setattr(event_loop, "http_clients", manager)
+
+    async def current():
+        return asyncio.get_running_loop(), manager.get_client()
+
+    loop, client = event_loop.run_async(current())
+    assert event_loop.run_async(current()) == (loop, client)
+
+    event_loop.shutdown_worker_loop()
+
+    assert client.is_closed
+    assert loop.is_closed()
+    assert event_loop.run_async(current())[0] is not loop
+    event_loop.shutdown_worker_loop()
@@ -1,6 +1,7 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
+import respx
 
 from app.scrapers.plugins.official_blogs import OfficialBlogsScraper
 from app.scrapers.registry import ScraperRegistry
@@ -103,94 +104,89 @@ async def test_parse_rss_entry_missing_date():
     assert article.published_at is not None  # Should have a date
 
 
+def _rss(*items):
+    """RSS document with (title, link, summary, pubDate) items"""
+    body = "".join(
+        f"<item><title>{title}</title><link>{link}</link><guid>{link}</guid>"
+        f"<description>{summary}</description><pubDate>{date}</pubDate></item>"
+        for title, link, summary, date in items
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Blog</title>{body}</channel></rss>'
+
+
 @pytest.mark.asyncio
+@respx.mock
 async def test_scrape_fetches_feeds():
     """Test scrape fetches and parses configured feeds"""
     scraper = OfficialBlogsScraper()
 
-    # Mock feed data
-    mock_feed = Mock()
-    mock_feed.bozo = False
-    mock_feed.entries = [
-        Mock(
-            title='Article 1',
-            link='https://openai.com/blog/article-1',
-            id='article-1',
-            published_parsed=(2026, 1, 5, 10, 0, 0, 0, 0, 0),
-            get=lambda k, d=None: {'summary': 'Summary 1'}.get(k, d)
-        ),
-        Mock(
-            title='Article 2',
-            link='https://openai.com/blog/article-2',
-            id='article-2',
-            published_parsed=(2026, 1, 4, 10, 0, 0, 0, 0, 0),
-            get=lambda k, d=None: {'summary': 'Summary 2'}.get(k, d)
-        )
-    ]
+    respx.get("https://openai.com/blog/rss.xml").respond(text=_rss(
+        ("Article 1", "https://openai.com/blog/article-1", "Summary 1", "Mon, 05 Jan 2026 10:00:00 GMT"),
+        ("Article 2", "https://openai.com/blog/article-2", "Summary 2", "Sun, 04 Jan 2026 10:00:00 GMT"),
+    ), headers={"content-type": "application/rss+xml; charset=utf-8"})
 
     config = {
         "feeds": [{"name": "OpenAI", "url": "https://openai.com/blog/rss.xml"}],
         "max_articles_per_feed": 10
     }
 
-    with patch('app.scrapers.plugins.official_blogs.feedparser.parse', return_value=mock_feed):
-        articles = await scraper.scrape(config, [])
+    articles = await scraper.scrape(config, [])
 
     assert len(articles) == 2
     assert articles[0].title == 'Article 1'
+    assert articles[0].content == 'Summary 1'
     assert articles[1].title == 'Article 2'
 
 
 @pytest.mark.asyncio
+@respx.mock
 async def test_scrape_filters_by_keywords():
     """Test scrape filters articles by keywords"""
     scraper = OfficialBlogsScraper()
 
-    mock_feed = Mock()
-    mock_feed.bozo = False
-    mock_feed.entries = [
-        Mock(
-            title='GPT-5 Release',
-            link='https://openai.com/blog/gpt5',
-            id='gpt5',
-            published_parsed=(2026, 1, 5, 10, 0, 0, 0, 0, 0),
-            get=lambda k, d=None: {'summary': 'New model'}.get(k, d)
-        ),
-        Mock(
-            title='Company Update',
-            link='https://openai.com/blog/update',
-            id='update',
-            published_parsed=(2026, 1, 4, 10, 0, 0, 0, 0, 0),
-            get=lambda k, d=None: {'summary': 'Business news'}.get(k, d)
-        )
-    ]
+    respx.get("https://openai.com/blog/rss.xml").respond(text=_rss(
+        ("GPT-5 Release", "https://openai.com/blog/gpt5", "New model", "Mon, 05 Jan 2026 10:00:00 GMT"),
+        ("Company Update", "https://openai.com/blog/update", "Business news", "Sun, 04 Jan 2026 10:00:00 GMT"),
+    ))
 
     config = {
         "feeds": [{"name": "OpenAI", "url": "https://openai.com/blog/rss.xml"}]
     }
 
-    with patch('app.scrapers.plugins.official_blogs.feedparser.parse', return_value=mock_feed):
-        articles = await scraper.scrape(config, ['GPT'])
+    articles = await scraper.scrape(config, ['GPT'])
 
     assert len(articles) == 1
     assert articles[0].title == 'GPT-5 Release'
 
 
 @pytest.mark.asyncio
+@respx.mock
 async def test_scrape_uses_default_feeds_when_not_configured():
     """Test scrape uses default OpenAI/DeepMind feeds when none configured"""
     scraper = OfficialBlogsScraper()
 
-    mock_feed = Mock()
-    mock_feed.bozo = False
-    mock_feed.entries = []
+    openai = respx.get("https://openai.com/blog/rss.xml").respond(text=_rss())
+    deepmind = respx.get("https://deepmind.google/blog/rss.xml").respond(text=_rss())
+
+    await scraper.scrape({}, [])
+
+    # Should have fetched both default feeds
+    assert openai.called
+    assert deepmind.called
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_scrape_keeps_other_feeds_when_one_fails():
+    """Test a failing feed is counted as an error without dropping the others"""
+    scraper = OfficialBlogsScraper()
+    scraper.MAX_RETRIES = 1
 
-    with patch('app.scrapers.plugins.official_blogs.feedparser.parse', return_value=mock_feed) as mock_parse:
-        await scraper.scrape({}, [])
+    respx.get("https://openai.com/blog/rss.xml").respond(status_code=404)
+    respx.get("https://deepmind.google/blog/rss.xml").respond(text=_rss(
+        ("Gemini", "https://deepmind.google/blog/gemini", "Model", "Mon, 05 Jan 2026 10:00:00 GMT"),
+    ))
 
-        # Should have called parse for both default feeds
-        assert mock_parse.call_count == 2
+    articles = await scraper.scrape({}, [])
 
-        called_urls = [call[0][0] for call in mock_parse.call_args_list]
-        assert 'https://openai.com/blog/rss.xml' in called_urls
-        assert 'https://deepmind.google/blog/rss.xml' in called_urls
+    assert [a.title for a in articles] == ['Gemini']
@@ -1,7 +1,12 @@
 import pytest
 import asyncio
 import time
-from app.scrapers.strategies.rate_limit import RateLimiter
+
+import fakeredis.aioredis
+import redis
+
+from app.scrapers.strategies import rate_limit
+from app.scrapers.strategies.rate_limit import DistributedRateLimiter, RateLimiter
 
 
 @pytest.mark.asyncio
@@ -39,3 +44,82 @@ async def test_rate_limiter_throttles():
     # the second request should wait ~1 second
     assert elapsed >= 0.9  # Allow small margin
     assert len(timestamps) == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_computes_exact_wait():
+    limiter = RateLimiter(requests_per_minute=60)
+    limiter.tokens = 0
+
+    # Tokens are reserved in order: 1s, then 2s from now
+    assert limiter._reserve() == pytest.approx(1.0, abs=0.01)
+    assert limiter._reserve() == pytest.approx(2.0, abs=0.01)
+
+
+@pytest.fixture
+def shared_redis(monkeypatch):
+    client = fakeredis.aioredis.FakeRedis()
+    monkeypatch.setattr(rate_limit, "_async_client", lambda: client)
+    monkeypatch.setattr(rate_limit, "_unavailable_until", 0.0)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_distributed_limiter_shares_bucket_per_provider(shared_redis):
+    worker_a = DistributedRateLimiter("reddit", requests_per_minute=2)
+    worker_b = DistributedRateLimiter("reddit", requests_per_minute=2)
+    other = DistributedRateLimiter("hackernews", requests_per_minute=2)
+
+    waits = [await worker_a._reserve(), await worker_b._reserve(), await worker_a._reserve()]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(30.0, abs=0.1)
+    assert await other._reserve() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_distributed_limiter_sleeps_reserved_time(shared_redis, monkeypatch):
+    limiter = DistributedRateLimiter("devto", requests_per_minute=60)
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", fake_sleep)
+    for _ in range(62):
+        async with limiter:
+            pass
+
+    # Burst of 60, then one sleep per request: no polling
+    assert len(sleeps) == 2
+    assert sleeps[0] == pytest.approx(1.0, abs=0.1)
+    assert sleeps[1] == pytest.approx(2.0, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_distributed_limiter_falls_back_to_local_bucket(monkeypatch):
+    class DownRedis:
+        async def eval(self, *args):
+            raise redis.ConnectionError("down")
+
+    monkeypatch.setattr(rate_limit, "_async_client", lambda: DownRedis())
+    monkeypatch.setattr(rate_limit, "_unavailable_until", 0.0)
+    limiter = DistributedRateLimiter("arxiv", requests_per_minute=30)
+
+    async with limiter:
+        pass
+
+    assert limiter._local.tokens == pytest.approx(29, abs=0.01)
+    assert rate_limit._unavailable_until > 0
+
+
+@pytest.mark.asyncio
+async def test_distributed_limiter_reserves_weighted_cost(shared_redis):
+    # Token budgets: a 6000-token request drains a 6000/min bucket for a minute
+    limiter = DistributedRateLimiter("anthropic:input_tokens", requests_per_minute=6000)
+
+    assert await limiter._reserve(6000) == 0.0
+    assert await limiter._reserve(1500) == pytest.approx(15.0, abs=0.1)
+
+    local = RateLimiter(requests_per_minute=6000)
+    assert local._reserve(7500) == pytest.approx(15.0, abs=0.01)
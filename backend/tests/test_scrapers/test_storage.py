@@ -108,3 +108,185 @@ async def test_save_articles_with_optional_fields(db_session):
     assert article.comments_count == 25
     assert article.tags == ['python', 'fastapi']
     assert article.external_id == 'reddit_123'
+
+
+@pytest.fixture
+def hn_source(db_session):
+    from app.models.source import Source
+    source = Source(name="HackerNews", type="hackernews", config={}, is_active=True)
+    db_session.add(source)
+    db_session.commit()
+    return source
+
+
+def _hn_batch(count, upvotes=10):
+    return [
+        {
+            'title': f'Story {i}',
+            'url': f'https://example.com/story/{i}',
+            'source_type': 'hackernews',
+            'published_at': datetime(2024, 1, 1),
+            'upvotes': upvotes,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_upsert_articles_reports_counts(db_session, hn_source):
+    """Inserted, updated and unchanged rows are counted separately"""
+    from app.scrapers.storage import upsert_articles
+
+    stats = await upsert_articles(_hn_batch(3), 'hackernews', db_session)
+    assert stats == {'inserted': 3, 'updated': 0, 'unchanged': 0, 'failed': 0, 'near_duplicates': 0}
+
+    batch = _hn_batch(4)
+    batch[0]['upvotes'] = 99
+    stats = await upsert_articles(batch, 'hackernews', db_session)
+    assert stats == {'inserted': 1, 'updated': 1, 'unchanged': 2, 'failed': 0, 'near_duplicates': 0}
+
+    article = db_session.query(Article).filter_by(url='https://example.com/story/0').one()
+    assert article.upvotes == 99
+    assert article.source_id == hn_source.id
+    assert db_session.query(Article).count() == 4
+
+
+@pytest.mark.asyncio
+async def test_upsert_articles_keeps_existing_values_over_none(db_session, hn_source):
+    """A None in the scraped data never erases a stored value"""
+    from app.scrapers.storage import upsert_articles
+
+    batch = _hn_batch(1)
+    batch[0]['author'] = 'pg'
+    await upsert_articles(batch, 'hackernews', db_session)
+
+    batch[0]['author'] = None
+    stats = await upsert_articles(batch, 'hackernews', db_session)
+
+    assert stats['unchanged'] == 1
+    assert db_session.query(Article).one().author == 'pg'
+
+
+@pytest.mark.asyncio
+async def test_upsert_articles_collapses_duplicate_urls_in_batch(db_session, hn_source):
+    """The last occurrence of a URL within a batch wins"""
+    from app.scrapers.storage import upsert_articles
+
+    batch = _hn_batch(1, upvotes=1) + _hn_batch(1, upvotes=2)
+    stats = await upsert_articles(batch, 'hackernews', db_session)
+
+    assert stats['inserted'] == 1
+    assert db_session.query(Article).one().upvotes == 2
+
+
+@pytest.mark.asyncio
+async def test_upsert_articles_uses_constant_statement_count(db_session, hn_source):
+    """A 500-article batch costs a handful of statements, not one per article"""
+    from sqlalchemy import event
+    from app.scrapers.storage import upsert_articles
+
+    await upsert_articles(_hn_batch(500), 'hackernews', db_session)
+    source_id = hn_source.id
+
+    statements = []
+    engine = db_session.get_bind()
+
+    def listener(*args):
+        statements.append(args[2])
+
+    event.listen(engine, 'before_cursor_execute', listener)
+    try:
+        stats = await upsert_articles(
+            _hn_batch(500, upvotes=20), 'hackernews', db_session, source_id=source_id
+        )
+    finally:
+        event.remove(engine, 'before_cursor_execute', listener)
+
+    assert stats['updated'] == 500
+    selects = [s for s in statements if s.lstrip().upper().startswith('SELECT')]
+    assert len(selects) == 1
+
+
+@pytest.mark.asyncio
+async def test_near_duplicates_link_to_canonical_article(db_session, hn_source):
+    """The same story under other URLs points at the first copy stored"""
+    from app.scrapers.storage import upsert_articles
+
+    story = " ".join(f"token{(i * 7919) % 1000}" for i in range(250))
+
+    def _copy(url, title, content, published_at=datetime(2024, 1, 2)):
+        return {'title': title, 'url': url, 'source_type': 'hackernews',
+                'published_at': published_at, 'content': content}
+
+    await upsert_articles([_copy('https://blog.example.com/post', 'Launch post', story)], 'hackernews', db_session)
+    stats = await upsert_articles([
+        _copy('https://medium.com/@a/post', 'Launch post | Medium', f"{story} Thanks for reading!"),
+        _copy('https://dev.to/a/post', 'Launch post', f"<p>Cross-posted.</p>{story}"),
+        _copy('https://example.com/other', 'Other', story[::-1]),
+        _copy('https://example.com/old', 'Launch post', story, published_at=datetime(2023, 1, 1)),
+    ], 'hackernews', db_session)
+
+    canonical = db_session.query(Article).filter_by(url='https://blog.example.com/post').one()
+    links = {a.url: a.duplicate_of_id for a in db_session.query(Article)}
+    assert stats['near_duplicates'] == 2
+    assert links == {
+        'https://blog.example.com/post': None,
+        'https://medium.com/@a/post': canonical.id,
+        'https://dev.to/a/post': canonical.id,
+        'https://example.com/other': None,
+        'https://example.com/old': None,  # Outside DUPLICATE_WINDOW_DAYS
+    }
+
+    # Re-scraping a canonical article does not link it to its own copies
+    stats = await upsert_articles([_copy('https://blog.example.com/post', 'Launch post', story)], 'hackernews', db_session)
+    assert stats['near_duplicates'] == 0
+    assert db_session.get(Article, canonical.id).duplicate_of_id is None
+
+
+@pytest.mark.asyncio
+async def test_url_variants_map_to_one_row(db_session, hn_source):
+    """Tracking parameters and alternate URL forms do not create new rows"""
+    from app.scrapers.storage import upsert_articles
+
+    def _variant(url, upvotes):
+        return {'title': 'Video', 'url': url, 'source_type': 'hackernews',
+                'published_at': datetime(2024, 1, 1), 'upvotes': upvotes}
+
+    await upsert_articles([_variant('https://www.youtube.com/watch?v=dQw4w9WgXcQ&utm_source=hn', 1)], 'hackernews', db_session)
+    stats = await upsert_articles([
+        _variant('https://youtu.be/dQw4w9WgXcQ?si=abc', 2),
+        _variant('http://m.youtube.com/watch/?v=dQw4w9WgXcQ', 3),
+    ], 'hackernews', db_session)
+
+    article = db_session.query(Article).one()
+    assert stats['inserted'] == 0 and stats['updated'] == 1
+    assert article.canonical_url == 'https://youtube.com/watch?v=dQw4w9WgXcQ'
+    assert article.url == 'https://www.youtube.com/watch?v=dQw4w9WgXcQ&utm_source=hn'  # First copy kept
+    assert article.upvotes == 3
+
+
+@pytest.mark.asyncio
+async def test_article_sink_writes_micro_batches(db_session, hn_source):
+    """Articles are committed every batch_size, the last copy of a URL wins"""
+    from app.scrapers.storage import ArticleSink
+
+    sink = ArticleSink(db_session, 'hackernews', source_id=hn_source.id, batch_size=2)
+    batch = _hn_batch(3)
+
+    await sink.add(batch[0])
+    await sink.add({**batch[0], 'url': 'https://example.com/story/0?utm_source=rss', 'upvotes': 50})
+    assert db_session.query(Article).count() == 0
+
+    await sink.add(batch[1])
+    assert db_session.query(Article).count() == 2  # Visible before the run ends
+
+    await sink.add(batch[2])
+    await sink.add({**batch[1], 'upvotes': 70})  # First copy already written
+    await sink.add({'title': 'No URL'})
+    await sink.flush()
+
+    upvotes = {a.title: a.upvotes for a in db_session.query(Article)}
+    assert upvotes == {'Story 0': 50, 'Story 1': 70, 'Story 2': 10}
+    assert sink.batches == 2
+    assert (sink.received, sink.saved) == (6, 3)
+    assert sink.stats == {'inserted': 3, 'updated': 1, 'unchanged': 0, 'failed': 1, 'near_duplicates': 0}
@@ -0,0 +1,146 @@
+"""
+Tests for incremental scraping watermarks
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from app.models.source import Source
+from app.models.source_watermark import SourceWatermark
+from app.schemas.scraped_article import ScrapedArticle
+from app.scrapers.base import ScraperPlugin
+from app.scrapers.plugins.arxiv import ArxivScraper
+from app.scrapers.plugins.hackernews import HackerNewsScraper
+from app.scrapers.plugins.reddit import RedditScraper
+from app.scrapers.watermarks import ScrapeWatermark, load_watermark, save_watermark
+from app.tasks.scraping import _scrape_source
+
+NOW = datetime(2026, 3, 10, 12, 0)
+
+
+def _article(external_id, published_at, source_type="test"):
+    return ScrapedArticle(
+        title=f"Article {external_id}",
+        url=f"https://example.com/{external_id}",
+        source_type=source_type,
+        external_id=str(external_id),
+        published_at=published_at,
+    )
+
+
+async def _no_invalidation(*tags):
+    pass
+
+
+class FeedScraper(ScraperPlugin):
+    name = "test"
+    display_name = "Test"
+    version = "1.0.0"
+    INCREMENTAL = True
+
+    def __init__(self, articles=()):
+        super().__init__()
+        self.articles = list(articles)
+
+    async def scrape(self, config, keywords):
+        return self.articles
+
+    def validate_config(self, config):
+        return True
+
+
+def test_filter_new_keeps_overlap_and_normalizes_timezones():
+    scraper = FeedScraper()
+    scraper.watermark = ScrapeWatermark(published_at=NOW)
+    articles = [
+        _article(1, NOW - timedelta(hours=2)),
+        _article(2, NOW - timedelta(minutes=30)),
+        _article(3, (NOW + timedelta(hours=1)).replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(hours=2)))),
+    ]
+
+    assert [a.external_id for a in scraper.filter_new(articles)] == ["2", "3"]
+
+    scraper.watermark = None
+    assert scraper.filter_new(articles) == articles
+
+
+def test_next_watermark_never_moves_backwards():
+    scraper = FeedScraper()
+    previous = ScrapeWatermark(published_at=NOW)
+
+    assert scraper.next_watermark([_article(1, NOW - timedelta(days=1))], previous).published_at == NOW
+    assert scraper.next_watermark([], previous) == previous
+    assert scraper.next_watermark([_article(1, NOW + timedelta(hours=1))], previous).published_at == (
+        NOW + timedelta(hours=1)
+    )
+
+
+def test_load_watermark_schedules_full_refresh(db_session):
+    source = Source(name="HN", type="hackernews", config={}, is_active=True)
+    db_session.add(source)
+    db_session.commit()
+
+    assert load_watermark(db_session, source.id, now=NOW) == (None, True)
+
+    save_watermark(db_session, source.id, ScrapeWatermark(NOW, "42"), full_refresh=True, now=NOW)
+    db_session.commit()
+
+    assert load_watermark(db_session, source.id, now=NOW + timedelta(hours=6)) == (ScrapeWatermark(NOW, "42"), False)
+    assert load_watermark(db_session, source.id, now=NOW + timedelta(hours=24))[1] is True
+
+    # Incremental runs keep the time of the last full refresh
+    save_watermark(db_session, source.id, ScrapeWatermark(NOW, "43"), full_refresh=False, now=NOW + timedelta(hours=6))
+    assert db_session.query(SourceWatermark).one().last_full_scrape_at == NOW
+
+
+@pytest.mark.parametrize("scraper_cls", [HackerNewsScraper, RedditScraper])
+def test_ranked_listings_stay_on_full_scrapes(scraper_cls):
+    # Front pages hold stories older than any overlap window: a cutoff would drop unseen ones
+    assert scraper_cls.INCREMENTAL is False
+
+
+@pytest.mark.asyncio
+async def test_arxiv_queries_from_watermark():
+    scraper = ArxivScraper()
+    _captured = []
+
+    async def _capture_params(method, url, params=None, **kwargs):
+        _captured.append(params)
+        return Mock(text="<feed/>")
+
+    scraper._retry_request = _capture_params
+
+    await scraper._fetch_papers(["llm"], 10)
+    assert "submittedDate" not in _captured[-1]["search_query"]
+
+    scraper.watermark = ScrapeWatermark(published_at=NOW)
+    await scraper._fetch_papers(["llm"], 10)
+    assert _captured[-1]["search_query"].endswith("AND submittedDate:[202603071200 TO 999912312359]")
+
+
+@pytest.mark.asyncio
+async def test_scrape_source_alternates_full_and_incremental_runs(db_session, monkeypatch):
+    source = Source(name="Feed", type="test", config={}, is_active=True)
+    db_session.add(source)
+    db_session.commit()
+    monkeypatch.setattr("app.scrapers.storage.invalidate_tags_async", _no_invalidation)
+
+    older, old, new = _article(0, NOW - timedelta(days=3)), _article(1, NOW - timedelta(days=2)), _article(2, NOW)
+    registry = Mock()
+
+    async def run(articles):
+        registry.get.return_value = FeedScraper(articles)
+        return await _scrape_source(source, registry, None, [], db_session, source_timeout=10)
+
+    first = await run([old])
+    assert first["mode"] == "full"
+    assert first["articles_saved"] == 1
+
+    # Items published before the watermark (minus the overlap) are dropped
+    second = await run([older, old, new])
+    assert second["mode"] == "incremental"
+    assert second["articles_scraped"] == 2
+    assert second["articles_inserted"] == 1
+    assert db_session.query(SourceWatermark).one().last_published_at == NOW
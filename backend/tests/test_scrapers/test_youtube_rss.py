@@ -1,4 +1,9 @@
+import asyncio
+import threading
+
+import httpx
 import pytest
+import respx
 from unittest.mock import Mock, patch
 from app.scrapers.plugins.youtube_rss import YouTubeRSSScraper
 from app.scrapers.registry import ScraperRegistry
@@ -64,10 +69,101 @@ async def test_scrape_fetches_from_db(db_session):
 
     scraper = YouTubeRSSScraper()
 
-    with patch.object(scraper, '_get_active_channels') as mock_get:
+    with respx.mock, patch.object(scraper, '_get_active_channels') as mock_get:
         mock_get.return_value = [channel]
+        respx.get(channel.rss_feed_url).respond(text=_atom('UC_test', ['abc']))
 
-        # Should attempt to fetch channels
-        await scraper.scrape({}, [])
+        # Should fetch the channel feed
+        videos = await scraper.scrape({}, [])
 
         mock_get.assert_called_once()
+    assert [v.video_id for v in videos] == ['abc']
+
+
+def _atom(channel_id, video_ids):
+    """YouTube channel Atom feed"""
+    entries = "".join(
+        f"<entry><id>yt:video:{vid}</id><yt:videoId>{vid}</yt:videoId>"
+        f"<yt:channelId>{channel_id}</yt:channelId><title>Video {vid}</title>"
+        f'<link rel="alternate" href="https://www.youtube.com/watch?v={vid}"/>'
+        f"<published>2026-01-03T12:00:00+00:00</published></entry>"
+        for vid in video_ids
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" '
+        f'xmlns="http://www.w3.org/2005/Atom"><title>{channel_id}</title>{entries}</feed>'
+    )
+
+
+def _channel(i):
+    channel = Mock()
+    channel.channel_id = f'UC_{i}'
+    channel.channel_name = f'Channel {i}'
+    channel.rss_feed_url = f'https://www.youtube.com/feeds/videos.xml?channel_id=UC_{i}'
+    return channel
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_scrape_fetches_channels_concurrently():
+    """Feeds are downloaded in parallel, at most FEED_CONCURRENCY at a time"""
+    scraper = YouTubeRSSScraper()
+    scraper._channels = [_channel(i) for i in range(30)]
+    in_flight, peak = 0, 0
+
+    async def slow_feed(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        channel_id = request.url.params['channel_id']
+        return httpx.Response(200, text=_atom(channel_id, [f'{channel_id}-1']))
+
+    respx.get(url__startswith='https://www.youtube.com/feeds/videos.xml').mock(side_effect=slow_feed)
+
+    async with scraper:
+        videos = await scraper.scrape({}, [])
+
+    assert len(videos) == 30
+    assert peak == scraper.FEED_CONCURRENCY
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_failing_channel_does_not_stop_others():
+    """A channel whose feed errors is skipped"""
+    scraper = YouTubeRSSScraper()
+    scraper.MAX_RETRIES = 1
+    scraper._channels = [_channel(1), _channel(2)]
+
+    respx.get(scraper._channels[0].rss_feed_url).respond(status_code=404)
+    respx.get(scraper._channels[1].rss_feed_url).respond(text=_atom('UC_2', ['xyz']))
+
+    videos = await scraper.scrape({}, [])
+
+    assert [v.video_id for v in videos] == ['xyz']
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_feeds_are_parsed_off_the_event_loop():
+    """feedparser runs in the parse thread pool, not on the loop thread"""
+    import feedparser
+
+    scraper = YouTubeRSSScraper()
+    scraper._channels = [_channel(1)]
+    respx.get(scraper._channels[0].rss_feed_url).respond(text=_atom('UC_1', ['abc']))
+    threads = []
+    parse = feedparser.parse
+
+    def recording_parse(*args, **kwargs):
+        threads.append(threading.current_thread().name)
+        return parse(*args, **kwargs)
+
+    with patch('app.scrapers.base.feedparser.parse', side_effect=recording_parse):
+        await scraper.scrape({}, [])
+
+    assert len(threads) == 1
+    assert threads[0].startswith('feedparse')
@@ -0,0 +1,91 @@
+"""
+Tests for article_keywords links written at scoring time
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import get_async_db
+from app.main import app
+from app.models.article import Article
+from app.models.article_keyword import ArticleKeyword
+from app.models.keyword import Keyword
+from app.models.source import Source
+from app.services.article_keywords import ArticleKeywordService
+
+
+@pytest.fixture
+def data(db_session):
+    source = Source(name="HackerNews", type="hackernews", config={}, is_active=True)
+    db_session.add(source)
+    db_session.flush()
+    keywords = [
+        Keyword(keyword="rust", category="dev", weight=2.0, is_active=True),
+        Keyword(keyword="wasm", category="dev", weight=1.0, is_active=True),
+    ]
+    articles = [
+        Article(title="Rust 2.0", content="now with wasm", url="https://example.com/1",
+                source_id=source.id, published_at=datetime(2026, 1, 1)),
+        Article(title="Kernel news", content="written in rust", url="https://example.com/2",
+                source_id=source.id, published_at=datetime(2026, 1, 2)),
+        Article(title="Python 4", url="https://example.com/3",
+                source_id=source.id, published_at=datetime(2026, 1, 3)),
+    ]
+    db_session.add_all(keywords + articles)
+    db_session.commit()
+    return db_session, articles, keywords
+
+
+def _links(db):
+    return {
+        (link.article_id, link.keyword_id): link.relevance_score
+        for link in db.query(ArticleKeyword)
+    }
+
+
+def test_links_carry_field_boosted_relevance(data):
+    db, articles, (rust, wasm) = data
+
+    written = ArticleKeywordService(db).link_articles(articles, [rust, wasm])
+    db.commit()
+
+    assert written == 3
+    assert _links(db) == {
+        (articles[0].id, rust.id): 2.0 * 2.0,  # title
+        (articles[0].id, wasm.id): 1.0 * 1.0,  # content
+        (articles[1].id, rust.id): 2.0 * 1.0,
+    }
+
+
+def test_relinking_replaces_previous_links(data):
+    db, articles, (rust, wasm) = data
+    service = ArticleKeywordService(db)
+    service.link_articles(articles, [rust, wasm])
+    db.commit()
+
+    articles[0].title = "Zig 1.0"
+    articles[0].content = None
+    service.link_articles([articles[0]], [rust, wasm])
+    db.commit()
+
+    assert _links(db) == {(articles[1].id, rust.id): 2.0}
+
+
+def test_articles_endpoint_filters_by_keyword(data, async_db):
+    db, articles, (rust, wasm) = data
+    ArticleKeywordService(db).link_articles(articles, [rust, wasm])
+    db.commit()
+    rust_id, wasm_id = rust.id, wasm.id
+
+    app.dependency_overrides[get_async_db] = async_db
+    try:
+        client = TestClient(app)
+        rust_titles = {a["title"] for a in client.get(f"/api/articles?keyword_id={rust_id}").json()["data"]}
+        wasm_titles = {a["title"] for a in client.get(f"/api/articles?keyword_id={wasm_id}").json()["data"]}
+    finally:
+        app.dependency_overrides.clear()
+
+    assert rust_titles == {"Rust 2.0", "Kernel news"}
+    assert wasm_titles == {"Rust 2.0"}
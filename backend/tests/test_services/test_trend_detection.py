@@ -0,0 +1,151 @@
+"""
+Tests for set-based, incremental trend detection
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event, update
+
+from app.database import Base
+from app.models.article import Article
+from app.models.article_keyword import ArticleKeyword
+from app.models.keyword import Keyword
+from app.models.keyword_daily_stat import KeywordDailyStat
+from app.models.source import Source
+from app.models.trend import Trend
+from app.services.article_keywords import ArticleKeywordService
+from app.services.trend_detection import TrendDetectionService, _day_ranges
+
+TODAY = date(2026, 3, 10)
+
+
+@pytest.fixture
+def db(db_session):
+    engine = db_session.get_bind()
+    for name in ("trends", "keyword_daily_stats"):
+        Base.metadata.tables[name].create(engine, checkfirst=True)
+
+    source = Source(name="HackerNews", type="hackernews", config={}, is_active=True)
+    db_session.add(source)
+    db_session.add_all([
+        Keyword(keyword="Rust", category="dev", weight=2.0, is_active=True),
+        Keyword(keyword="python", category="dev", weight=1.0, is_active=True),
+        Keyword(keyword="cobol", category="dev", weight=1.0, is_active=False),
+    ])
+    db_session.commit()
+    db_session.info["source_id"] = source.id
+    return db_session
+
+
+def _article(db, title, day, score=50.0):
+    article = Article(
+        title=title, url=f"https://example.com/{title}/{day}",
+        source_id=db.info["source_id"], score=score,
+        published_at=datetime.combine(day, datetime.min.time()) + timedelta(hours=12)
+    )
+    db.add(article)
+    return article
+
+
+def _score(db, articles=None):
+    """Link articles to active keywords, as the scoring tasks do"""
+    articles = articles or db.query(Article).all()
+    keywords = db.query(Keyword).filter(Keyword.is_active == True).all()
+    ArticleKeywordService(db).link_articles(articles, keywords)
+    db.commit()
+
+
+def _trends(db):
+    return {t.keyword: t for t in db.query(Trend).filter(Trend.date == TODAY)}
+
+
+def test_detect_matches_titles_and_computes_window_stats(db):
+    _article(db, "Rust 2.0 released", TODAY, score=80)
+    _article(db, "Why rust and python", TODAY - timedelta(days=1), score=40)
+    _article(db, "Rust in the kernel", TODAY - timedelta(days=1), score=60)
+    _article(db, "Old rust news", TODAY - timedelta(days=30), score=90)
+    _article(db, "COBOL forever", TODAY, score=90)
+    db.commit()
+    _score(db)
+
+    stats = TrendDetectionService(db).detect(today=TODAY)
+
+    trends = _trends(db)
+    assert stats["mode"] == "full"
+    assert set(trends) == {"Rust", "python"}
+    rust = trends["Rust"]
+    assert rust.article_count == 3
+    assert rust.article_count_delta == 1 - 2
+    assert rust.trend_score == pytest.approx(3 * 2.0 * 60 / 10)
+    assert trends["python"].article_count == 1
+
+
+def test_incremental_run_only_recomputes_changed_days(db):
+    _article(db, "Rust one", TODAY - timedelta(days=3))
+    db.commit()
+    _score(db)
+    # Scraped and scored well before the watermark overlap
+    an_hour_ago = datetime.utcnow() - timedelta(hours=1)
+    db.execute(update(Article).values(updated_at=an_hour_ago))
+    db.execute(update(ArticleKeyword).values(created_at=an_hour_ago))
+    db.commit()
+    service = TrendDetectionService(db)
+    service.detect(today=TODAY)
+
+    new = _article(db, "Rust two", TODAY)
+    db.commit()
+    _score(db, [new])
+    stats = service.detect(today=TODAY)
+
+    assert stats["mode"] == "incremental"
+    assert stats["days_recomputed"] == 1
+    assert stats["stats_rows"] == 1
+    assert _trends(db)["Rust"].article_count == 2
+
+
+def test_rescored_article_updates_average(db):
+    article = _article(db, "Rust one", TODAY, score=10)
+    db.commit()
+    _score(db)
+    service = TrendDetectionService(db)
+    service.detect(today=TODAY)
+
+    article.score = 90
+    db.commit()
+    service.detect(today=TODAY)
+
+    assert _trends(db)["Rust"].trend_score == pytest.approx(1 * 2.0 * 90 / 10)
+
+
+def test_stats_and_trends_are_written_set_based(db):
+    for i in range(20):
+        _article(db, f"Rust and python {i}", TODAY - timedelta(days=i % 5))
+    db.commit()
+    _score(db)
+
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", listener)
+    try:
+        TrendDetectionService(db).detect(today=TODAY)
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", listener)
+
+    inserts = [s for s in statements if s.startswith("INSERT")]
+    assert len(inserts) == 2
+    assert "INSERT INTO keyword_daily_stats" in inserts[0] and "SELECT" in inserts[0]
+    assert inserts[1].startswith("INSERT INTO trends")
+    assert db.query(KeywordDailyStat).count() == 10
+
+
+def test_day_ranges_merge_consecutive_days():
+    days = {TODAY, TODAY - timedelta(days=1), TODAY - timedelta(days=5)}
+
+    assert _day_ranges(days) == [
+        (TODAY - timedelta(days=5), TODAY - timedelta(days=5)),
+        (TODAY - timedelta(days=1), TODAY),
+    ]
@@ -0,0 +1,134 @@
+"""
+Tests for bulk personalized scoring
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.database import Base
+from app.models.article import Article
+from app.models.source import Source
+from app.models.user import User
+from app.models.user_article_score import UserArticleScore
+from app.models.user_keyword import UserKeyword
+from app.services.user_scoring import UserScoringService, score_new_articles_for_all_users
+
+
+@pytest.fixture
+def scoring_db(db_session):
+    """db_session plus the user tables, with two users and a few articles"""
+    engine = db_session.get_bind()
+    for name in ('users', 'user_keywords', 'user_article_scores'):
+        Base.metadata.tables[name].create(engine, checkfirst=True)
+
+    source = Source(name="HackerNews", type="hackernews", config={}, is_active=True)
+    alice = User(email="alice@example.com", username="alice")
+    bob = User(email="bob@example.com", username="bob")
+    carol = User(email="carol@example.com", username="carol")  # No keywords
+    db_session.add_all([source, alice, bob, carol])
+    db_session.flush()
+
+    db_session.add_all([
+        UserKeyword(user_id=alice.id, keyword="Rust", weight=2.0),
+        UserKeyword(user_id=alice.id, keyword="python", weight=1.0),
+        UserKeyword(user_id=alice.id, keyword="cobol", weight=1.0, is_active=False),
+        UserKeyword(user_id=bob.id, keyword="rust", weight=1.0),
+        UserKeyword(user_id=bob.id, keyword="kubernetes", weight=3.0),
+        UserKeyword(user_id=bob.id, keyword="machine learning", weight=1.0),
+    ])
+    articles = [
+        ("Rust 2.0 released", "Faster compiles", None, ["release"], 80.0),
+        ("Weekly news", "python and kubernetes tips", "rust mentioned", None, None),
+        ("Gardening", "Tomatoes", None, ["kubernetes"], 40.0),
+        ("Machine learning in Python", None, None, ["rust", "python"], 10.0),
+    ]
+    for i, (title, content, summary, tags, score) in enumerate(articles):
+        db_session.add(Article(
+            title=title, url=f"https://example.com/{i}", content=content, summary=summary,
+            tags=tags, score=score, source_id=source.id, published_at=datetime(2026, 1, i + 1)
+        ))
+    db_session.commit()
+    return db_session, [alice.id, bob.id, carol.id]
+
+
+def _expected(db, user_id, article):
+    keywords = db.query(UserKeyword).filter_by(user_id=user_id, is_active=True).all()
+    return UserScoringService(db).score_article_for_user(article, user_id, keywords)
+
+
+def test_bulk_scores_match_single_article_formula(scoring_db):
+    db, (alice, bob, carol) = scoring_db
+
+    stats = UserScoringService(db).score_articles_for_users()
+
+    assert stats == {'users': 2, 'articles': 4, 'scores': 8}
+    for article in db.query(Article).all():
+        for user_id in (alice, bob):
+            row = db.query(UserArticleScore).filter_by(user_id=user_id, article_id=article.id).one()
+            assert row.score == pytest.approx(_expected(db, user_id, article))
+    assert db.query(UserArticleScore).filter_by(user_id=carol).count() == 0
+
+
+def test_keyword_matches_count(scoring_db):
+    db, (alice, bob, _) = scoring_db
+    UserScoringService(db).score_articles_for_users()
+
+    article = db.query(Article).filter_by(title="Weekly news").one()
+    matches = {
+        row.user_id: row.keyword_matches
+        for row in db.query(UserArticleScore).filter_by(article_id=article.id)
+    }
+    assert matches == {alice: 2, bob: 2}
+
+
+def test_summary_only_match_counts(scoring_db):
+    """keyword_matches covers the same fields as the score, summary included"""
+    db, (alice, _, _) = scoring_db
+    article = db.query(Article).filter_by(title="Gardening").one()
+    article.summary = "Python scripts to water tomatoes"
+    db.commit()
+
+    UserScoringService(db).score_articles_for_users(user_ids=[alice], article_ids=[article.id])
+
+    row = db.query(UserArticleScore).filter_by(user_id=alice, article_id=article.id).one()
+    assert row.keyword_matches == 1
+    assert row.score == pytest.approx(_expected(db, alice, article))
+    assert row.score > 40.0 * 0.3  # Scored as a match, not as an unmatched article
+
+
+def test_only_unscored_articles_are_selected(scoring_db):
+    db, (alice, bob, _) = scoring_db
+    service = UserScoringService(db)
+    first = service.score_articles_for_users(article_ids=None, limit=2)
+
+    # Bob's new keyword: rescoring his explicit articles updates rows in place
+    db.add(UserKeyword(user_id=bob, keyword="gardening", weight=1.0))
+    db.commit()
+    gardening = db.query(Article).filter_by(title="Gardening").one()
+    service.score_articles_for_user(bob, article_ids=[gardening.id])
+
+    second = service.score_articles_for_users()
+
+    assert first['articles'] == 2
+    assert second['articles'] == 2
+    row = db.query(UserArticleScore).filter_by(user_id=bob, article_id=gardening.id).one()
+    assert row.score == pytest.approx(_expected(db, bob, gardening))
+    assert db.query(UserArticleScore).count() == 8
+
+
+def test_all_users_scoring_is_one_pass(scoring_db):
+    """No per-article or per-user queries: statement count is independent of size"""
+    db, _ = scoring_db
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(db.get_bind(), "before_cursor_execute", listener)
+    try:
+        result = score_new_articles_for_all_users(db)
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", listener)
+
+    assert result == {"users": 2, "articles_scored": 8}
+    # keywords + articles + one upsert
+    assert len(statements) == 3
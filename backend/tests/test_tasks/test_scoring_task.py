@@ -0,0 +1,38 @@
+"""
+Tests for the rescoring task
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.models import Article, Keyword
+from app.tasks import scoring
+
+
+class _StubScorer:
+    def score_batch(self, texts, keywords, **kwargs):
+        return [{"overall_score": 42.0, "category": "dev"} for _ in texts]
+
+
+@pytest.mark.parametrize("force_all", [True, False])
+def test_rescore_skips_near_duplicates(db_session, monkeypatch, force_all):
+    db_session.add(Keyword(keyword="rust", category="dev", weight=1.0, is_active=True))
+    canonical = Article(title="Rust 2.0", url="https://example.com/a", published_at=datetime(2026, 1, 1))
+    db_session.add(canonical)
+    db_session.flush()
+    db_session.add(Article(
+        title="Rust 2.0 (repost)", url="https://example.com/b",
+        published_at=datetime(2026, 1, 1), duplicate_of_id=canonical.id
+    ))
+    db_session.commit()
+
+    monkeypatch.setattr(scoring, "SessionLocal", lambda: db_session)
+    monkeypatch.setattr(scoring, "get_scorer", lambda language: _StubScorer())
+    monkeypatch.setattr(scoring, "invalidate_tags", lambda *tags: None)
+    monkeypatch.setattr(db_session, "close", lambda: None)
+
+    result = scoring.rescore_all_articles(force_all=force_all)
+
+    assert result["articles_scored"] == 1
+    assert {a.title: a.score for a in db_session.query(Article)} == {"Rust 2.0": 42.0, "Rust 2.0 (repost)": None}
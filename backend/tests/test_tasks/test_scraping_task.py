@@ -167,3 +167,272 @@ async def test_scrape_all_sources_logs_to_scraping_runs(db_session):
         assert run is not None
         assert run.status == 'success'
         assert run.articles_scraped >= 1
+
+
+class _SlowScraper:
+    """Minimal scraper stub that sleeps before returning articles"""
+
+    def __init__(self, delay, articles=None):
+        self.delay = delay
+        self.articles = articles or []
+        self.redis = None
+
+    def validate_config(self, config):
+        return True
+
+    async def scrape_with_cache(self, config, keywords):
+        import asyncio
+        await asyncio.sleep(self.delay)
+        return self.articles
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_scrape_all_sources_runs_sources_concurrently(db_session):
+    """Wall-clock time should be that of the slowest source, not the sum"""
+    import time
+    from app.models.source import Source
+
+    with patch('app.tasks.scraping.ScraperRegistry') as mock_registry_class:
+        mock_registry = Mock()
+        mock_registry_class.return_value = mock_registry
+        mock_registry.get.side_effect = lambda source_type: _SlowScraper(0.3, [{
+            'title': f'{source_type} article',
+            'url': f'https://example.com/{source_type}',
+            'published_at': datetime(2024, 1, 1),
+        }])
+
+        for source_type in ('hackernews', 'reddit', 'devto'):
+            db_session.add(Source(name=source_type, type=source_type, config={}, is_active=True))
+        db_session.commit()
+
+        start = time.monotonic()
+        result = await scrape_all_sources_async(
+            db=db_session,
+            keywords=["python"],
+            task_id="test-concurrent",
+            max_concurrency=3
+        )
+        elapsed = time.monotonic() - start
+
+    assert result['status'] == 'success'
+    assert result['sources_scraped'] == 3
+    assert result['articles_saved'] == 3
+    assert all('duration_seconds' in r for r in result['results'])
+    assert elapsed < 0.8
+
+
+@pytest.mark.asyncio
+async def test_scrape_all_sources_enforces_source_timeout(db_session):
+    """A source exceeding its deadline fails without blocking the others"""
+    from app.models.source import Source
+
+    with patch('app.tasks.scraping.ScraperRegistry') as mock_registry_class:
+        mock_registry = Mock()
+        mock_registry_class.return_value = mock_registry
+        mock_registry.get.side_effect = lambda source_type: (
+            _SlowScraper(5.0) if source_type == 'reddit' else _SlowScraper(0.0)
+        )
+
+        db_session.add(Source(name="HN", type="hackernews", config={}, is_active=True))
+        db_session.add(Source(name="Reddit", type="reddit", config={}, is_active=True))
+        db_session.commit()
+
+        result = await scrape_all_sources_async(
+            db=db_session,
+            keywords=["python"],
+            task_id="test-timeout",
+            source_timeout=0.2
+        )
+
+    assert result['status'] == 'partial_success'
+    assert result['errors'] == 1
+    failed = [r for r in result['results'] if r['status'] == 'error']
+    assert failed[0]['source'] == 'Reddit'
+    assert 'Timed out' in failed[0]['error']
+
+
+@pytest.mark.asyncio
+async def test_scrape_source_stores_articles_while_streaming(db_session, monkeypatch):
+    """Micro-batches are committed before the scraper has finished"""
+    from app.config import settings
+    from app.models.article import Article
+    from app.models.source import Source
+    from app.schemas.scraped_article import ScrapedArticle
+    from app.scrapers.base import ScraperPlugin
+
+    stored_mid_run = []
+
+    class StreamingScraper(ScraperPlugin):
+        name = "hackernews"
+        display_name = "Streaming"
+        version = "1.0.0"
+
+        def validate_config(self, config):
+            return True
+
+        async def scrape(self, config, keywords):
+            return [a async for a in self.iter_articles(config, keywords)]
+
+        async def iter_articles(self, config, keywords):
+            for i in range(3):
+                stored_mid_run.append(db_session.query(Article).count())
+                yield ScrapedArticle(
+                    title=f"Story {i}", url=f"https://example.com/{i}", source_type="hackernews",
+                    external_id=str(i), published_at=datetime(2024, 1, 1)
+                )
+
+    monkeypatch.setattr(settings, "SCRAPING_SINK_BATCH_SIZE", 1)
+    with patch('app.tasks.scraping.ScraperRegistry') as mock_registry_class:
+        mock_registry = Mock()
+        mock_registry_class.return_value = mock_registry
+        mock_registry.get.return_value = StreamingScraper()
+
+        db_session.add(Source(name="HN", type="hackernews", config={}, is_active=True))
+        db_session.commit()
+
+        result = await scrape_all_sources_async(db=db_session, keywords=[], task_id="test-stream")
+
+    assert stored_mid_run == [0, 1, 2]
+    assert result['articles_saved'] == 3
+    assert db_session.query(Article).count() == 3
+
+
+@pytest.mark.asyncio
+async def test_validators_committed_only_after_successful_run(db_session):
+    """A timed-out run keeps re-fetching its feeds (no 304 for unsaved items)"""
+    import asyncio
+    from app.models.source import Source
+    from app.scrapers.base import ScraperPlugin
+
+    committed = []
+
+    class FeedScraper(ScraperPlugin):
+        name = "hackernews"
+        display_name = "Feeds"
+        version = "1.0.0"
+
+        def __init__(self, delay):
+            super().__init__()
+            self.delay = delay
+
+        def validate_config(self, config):
+            return True
+
+        async def scrape(self, config, keywords):
+            await asyncio.sleep(self.delay)
+            return []
+
+        async def commit_validators(self):
+            committed.append(self.delay)
+
+    with patch('app.tasks.scraping.ScraperRegistry') as mock_registry_class:
+        mock_registry = Mock()
+        mock_registry_class.return_value = mock_registry
+        mock_registry.get.side_effect = lambda source_type: (
+            FeedScraper(5.0) if source_type == 'reddit' else FeedScraper(0.0)
+        )
+
+        db_session.add(Source(name="HN", type="hackernews", config={}, is_active=True))
+        db_session.add(Source(name="Reddit", type="reddit", config={}, is_active=True))
+        db_session.commit()
+
+        result = await scrape_all_sources_async(
+            db=db_session, keywords=[], task_id="test-validators", source_timeout=0.2
+        )
+
+    assert result['errors'] == 1
+    assert committed == [0.0]
+
+
+@pytest.mark.asyncio
+async def test_timed_out_source_counts_saved_batches(db_session, monkeypatch):
+    """Batches committed before the deadline are part of the run totals"""
+    import asyncio
+    from app.config import settings
+    from app.models.source import Source
+    from app.schemas.scraped_article import ScrapedArticle
+    from app.scrapers.base import ScraperPlugin
+
+    class StallingScraper(ScraperPlugin):
+        name = "hackernews"
+        display_name = "Stalling"
+        version = "1.0.0"
+
+        def validate_config(self, config):
+            return True
+
+        async def scrape(self, config, keywords):
+            return []
+
+        async def iter_articles(self, config, keywords):
+            for i in range(2):
+                yield ScrapedArticle(
+                    title=f"Story {i}", url=f"https://example.com/{i}", source_type="hackernews",
+                    external_id=str(i), published_at=datetime(2024, 1, 1)
+                )
+            await asyncio.sleep(5)
+
+    monkeypatch.setattr(settings, "SCRAPING_SINK_BATCH_SIZE", 1)
+    with patch('app.tasks.scraping.ScraperRegistry') as mock_registry_class:
+        mock_registry = Mock()
+        mock_registry_class.return_value = mock_registry
+        mock_registry.get.return_value = StallingScraper()
+
+        db_session.add(Source(name="HN", type="hackernews", config={}, is_active=True))
+        db_session.commit()
+
+        result = await scrape_all_sources_async(
+            db=db_session, keywords=[], task_id="test-stall", source_timeout=0.2
+        )
+
+    assert result['status'] == 'failed'
+    assert result['results'][0]['articles_saved'] == 2
+    assert (result['articles_scraped'], result['articles_saved']) == (2, 2)
+    run = db_session.query(ScrapingRun).filter_by(task_id="test-stall").one()
+    assert run.articles_saved == 2
+
+
+@pytest.mark.asyncio
+async def test_scrape_all_sources_isolates_failed_source_sessions(db_session, monkeypatch):
+    """A source whose flush fails does not take down the others or the run record"""
+    from app.models.source import Source
+    from app.scrapers.storage import ArticleSink
+
+    original_flush = ArticleSink.flush
+
+    async def failing_flush(self):
+        if self.source_type == 'reddit':
+            # Unique name clash: the session is left needing a rollback
+            self.db.add(Source(name="HN", type="duplicate", config={}, is_active=False))
+            self.db.flush()
+        await original_flush(self)
+
+    monkeypatch.setattr(ArticleSink, "flush", failing_flush)
+    with patch('app.tasks.scraping.ScraperRegistry') as mock_registry_class:
+        mock_registry = Mock()
+        mock_registry_class.return_value = mock_registry
+        mock_registry.get.side_effect = lambda source_type: _SlowScraper(
+            0.1 if source_type == 'hackernews' else 0.0, [{
+                'title': f'{source_type} article',
+                'url': f'https://example.com/{source_type}',
+                'published_at': datetime(2024, 1, 1),
+            }]
+        )
+
+        db_session.add(Source(name="HN", type="hackernews", config={}, is_active=True))
+        db_session.add(Source(name="Reddit", type="reddit", config={}, is_active=True))
+        db_session.commit()
+
+        result = await scrape_all_sources_async(db=db_session, keywords=[], task_id="test-isolation")
+
+    statuses = {r['source']: r['status'] for r in result['results']}
+    assert statuses == {'HN': 'success', 'Reddit': 'error'}
+    assert result['articles_saved'] == 1
+    run = db_session.query(ScrapingRun).filter_by(task_id="test-isolation").one()
+    assert run.status == 'partial_success'
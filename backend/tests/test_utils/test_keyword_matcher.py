@@ -0,0 +1,82 @@
+"""
+Tests for the Aho-Corasick keyword matcher
+"""
+
+import random
+import string
+
+from app.services.user_scoring import UserScoringService
+from app.utils.keyword_matcher import get_matcher
+
+
+def test_find_reports_overlapping_hits_with_field_and_position():
+    matcher = get_matcher(["Claude", "claude code", "code"])
+
+    hits = matcher.find(title="Claude Code rocks", content="ask claude")
+
+    assert [(h.keyword, h.field, h.start, h.end) for h in hits] == [
+        ("Claude", "title", 0, 6),
+        ("claude code", "title", 0, 11),
+        ("code", "title", 7, 11),
+        ("Claude", "content", 4, 10),
+    ]
+
+
+def test_hits_never_span_fields():
+    matcher = get_matcher(["machine learning"])
+
+    assert matcher.find(title="machine", content="learning") == []
+    assert matcher.matched_indices("machine learning") == {0}
+
+
+def test_matcher_is_cached_per_keyword_set():
+    assert get_matcher(["python", "rust"]) is get_matcher(("python", "rust"))
+    assert get_matcher(["python", "rust"]) is not get_matcher(["rust", "python"])
+
+
+def test_duplicate_and_empty_keywords():
+    matcher = get_matcher(["Python", "python", ""])
+
+    assert matcher.matched_indices("I like PYTHON") == {0, 1}
+    assert not matcher.contains_any("no match here")
+    assert not get_matcher([]).contains_any("anything")
+
+
+def test_matches_naive_substring_search():
+    """Same keyword set as `kw.lower() in text.lower()` on random inputs"""
+    rng = random.Random(7)
+    alphabet = "abc "
+    keywords = ["".join(rng.choices(alphabet, k=rng.randint(1, 4))) for _ in range(200)]
+    matcher = get_matcher(keywords)
+
+    for _ in range(50):
+        text = "".join(rng.choices(alphabet + string.ascii_uppercase[:3], k=60))
+        expected = {i for i, kw in enumerate(keywords) if kw.lower() in text.lower()}
+        assert matcher.matched_indices(text) == expected
+
+
+class _Keyword:
+    def __init__(self, keyword, weight=1.0):
+        self.keyword = keyword
+        self.weight = weight
+
+
+class _Article:
+    def __init__(self, title, content=None, summary=None, tags=None, score=None):
+        self.title = title
+        self.content = content
+        self.summary = summary
+        self.tags = tags
+        self.score = score
+
+
+def test_user_scoring_boosts_by_field():
+    """Title hits weigh more than tag hits, which weigh more than body hits"""
+    service = UserScoringService(db=None)
+    keywords = [_Keyword("rust")]
+
+    title_score = service.score_article_for_user(_Article("Rust 2.0"), 1, keywords)
+    tag_score = service.score_article_for_user(_Article("News", tags=["rust"]), 1, keywords)
+    body_score = service.score_article_for_user(_Article("News", content="rust"), 1, keywords)
+
+    assert title_score > tag_score > body_score
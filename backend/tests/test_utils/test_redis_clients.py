@@ -0,0 +1,25 @@
+"""
+Tests for the per-event-loop Redis clients
+"""
+
+import asyncio
+import gc
+
+from app.utils.redis_clients import LoopRedisClients
+
+
+def test_clients_are_kept_per_loop_and_dropped_with_it():
+    clients = LoopRedisClients(socket_timeout=1)
+
+    async def pair():
+        return clients.get(), clients.get()
+
+    first, again = asyncio.run(pair())
+    assert first is again
+
+    # asyncio.run() closed that loop: a new loop never gets its client back
+    second, _ = asyncio.run(pair())
+    assert second is not first
+
+    gc.collect()
+    assert len(clients._clients) == 0
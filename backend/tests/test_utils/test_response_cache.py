@@ -0,0 +1,221 @@
+"""
+Tests for the Redis response cache
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+import redis
+from fastapi.testclient import TestClient
+
+from app.database import get_async_db, get_db
+from app.main import app
+from app.models.article import Article
+from app.models.keyword import Keyword
+from app.models.source import Source
+from app.utils import response_cache
+from app.utils.response_cache import (
+    TAG_ARTICLES, TAG_KEYWORDS, cached_response, invalidate_tags, invalidate_tags_async
+)
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    """Async and sync fake clients sharing one server"""
+    server = fakeredis.FakeServer()
+    async_client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    sync_client = fakeredis.FakeRedis(server=server, decode_responses=True)
+
+    monkeypatch.setattr(response_cache, "_async_client", lambda: async_client)
+    monkeypatch.setattr(response_cache, "_sync_redis", lambda: sync_client)
+    monkeypatch.setattr(response_cache, "_unavailable_until", 0.0)
+    monkeypatch.setattr(response_cache.settings, "RESPONSE_CACHE_ENABLED", True)
+    return sync_client
+
+
+def _counting_route(tags=(TAG_ARTICLES,), delay=0.0):
+    calls = []
+
+    @cached_response(ttl=60, tags=tags)
+    async def route(days: int = 7, db=None):
+        calls.append(days)
+        await asyncio.sleep(delay)
+        return {"days": days, "calls": len(calls)}
+
+    return route, calls
+
+
+async def test_second_call_is_served_from_cache(fake_cache):
+    route, calls = _counting_route()
+
+    first = await route(days=7, db=object())
+    second = await route(days=7, db=object())
+    other = await route(days=30, db=object())
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert json.loads(second.body) == {"days": 7, "calls": 1}
+    assert other.headers["X-Cache"] == "MISS"
+    assert calls == [7, 30]
+
+
+async def test_invalidating_a_tag_forces_recompute(fake_cache):
+    route, calls = _counting_route(tags=(TAG_ARTICLES,))
+
+    await route(days=7)
+    invalidate_tags(TAG_KEYWORDS)
+    assert (await route(days=7)).headers["X-Cache"] == "HIT"
+
+    invalidate_tags(TAG_ARTICLES)
+    response = await route(days=7)
+
+    assert response.headers["X-Cache"] == "MISS"
+    assert json.loads(response.body)["calls"] == 2
+
+
+async def test_async_invalidation_forces_recompute(fake_cache):
+    route, calls = _counting_route(tags=(TAG_ARTICLES,))
+
+    await route(days=7)
+    await invalidate_tags_async(TAG_ARTICLES)
+
+    assert (await route(days=7)).headers["X-Cache"] == "MISS"
+    assert calls == [7, 7]
+
+
+async def test_async_invalidation_with_redis_down_skips_cache(monkeypatch):
+    class BrokenPipeline:
+        def incr(self, key):
+            pass
+
+        async def execute(self):
+            raise redis.ConnectionError("down")
+
+    class BrokenRedis:
+        def pipeline(self, transaction=True):
+            return BrokenPipeline()
+
+    monkeypatch.setattr(response_cache, "_async_client", lambda: BrokenRedis())
+    monkeypatch.setattr(response_cache, "_unavailable_until", 0.0)
+    monkeypatch.setattr(response_cache.settings, "RESPONSE_CACHE_ENABLED", True)
+
+    await invalidate_tags_async(TAG_ARTICLES)
+
+    assert not response_cache._available()
+
+
+async def test_concurrent_misses_compute_once(fake_cache):
+    route, calls = _counting_route(delay=0.05)
+
+    responses = await asyncio.gather(*[route(days=7) for _ in range(5)])
+
+    assert calls == [7]
+    assert {json.loads(r.body)["calls"] for r in responses} == {1}
+
+
+async def test_waits_for_recompute_in_another_worker(fake_cache):
+    route, calls = _counting_route()
+    key = await response_cache._cache_key(
+        response_cache._async_client(),
+        f"{route.__module__}.{route.__qualname__}", (TAG_ARTICLES,), {"days": 7}
+    )
+    fake_cache.set(f"{key}:lock", "other-worker", px=5000)
+
+    async def other_worker():
+        await asyncio.sleep(0.1)
+        fake_cache.set(key, '{"days":7,"calls":0}')
+
+    response, _ = await asyncio.gather(route(days=7), other_worker())
+
+    assert response.headers["X-Cache"] == "HIT"
+    assert json.loads(response.body)["calls"] == 0
+    assert calls == []
+
+
+async def test_errors_are_not_cached(fake_cache):
+    attempts = []
+
+    @cached_response(ttl=60)
+    async def route():
+        attempts.append(1)
+        raise ValueError("boom")
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await route()
+
+    assert len(attempts) == 2
+
+
+async def test_redis_unavailable_bypasses_cache(monkeypatch):
+    class BrokenRedis:
+        async def mget(self, *args, **kwargs):
+            raise redis.ConnectionError("down")
+
+    monkeypatch.setattr(response_cache, "_async_client", lambda: BrokenRedis())
+    monkeypatch.setattr(response_cache, "_unavailable_until", 0.0)
+    route, calls = _counting_route()
+
+    first = await route(days=7)
+    second = await route(days=7)
+
+    assert first.headers["X-Cache"] == second.headers["X-Cache"] == "BYPASS"
+    assert calls == [7, 7]
+
+
+def test_keyword_changes_invalidate_categories(db_session, fake_cache):
+    db_session.add(Keyword(keyword="rust", category="dev", weight=1.0, is_active=True))
+    db_session.commit()
+    app.dependency_overrides[get_db] = lambda: db_session
+    client = TestClient(app)
+
+    try:
+        assert client.get("/api/keywords/categories/list").json() == {"categories": ["dev"]}
+        hit = client.get("/api/keywords/categories/list")
+        assert hit.headers["X-Cache"] == "HIT"
+
+        created = client.post("/api/keywords", json={
+            "keyword": "solidity", "category": "web3", "weight": 1.0
+        })
+        assert created.status_code == 201
+
+        response = client.get("/api/keywords/categories/list")
+        assert response.headers["X-Cache"] == "MISS"
+        assert response.json() == {"categories": ["dev", "web3"]}
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_votes_invalidate_best_of_week(db_session, async_db, fake_cache):
+    source = Source(name="HackerNews", type="hackernews", config={}, is_active=True)
+    db_session.add(source)
+    db_session.flush()
+    for title, score in (("Top", 50.0), ("Runner-up", 40.0)):
+        db_session.add(Article(
+            title=title, url=f"https://example.com/{title}", score=score,
+            source_id=source.id, published_at=datetime.utcnow()
+        ))
+    db_session.commit()
+    top = db_session.query(Article).filter_by(title="Top").one()
+
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_async_db] = async_db
+    client = TestClient(app)
+
+    try:
+        assert client.get("/api/articles/best-of-week").json()["title"] == "Top"
+        assert client.get("/api/articles/best-of-week").headers["X-Cache"] == "HIT"
+
+        assert client.post(f"/api/articles/{top.id}/dislike").status_code == 200
+        response = client.get("/api/articles/best-of-week")
+        assert response.headers["X-Cache"] == "MISS"
+        assert response.json()["title"] == "Runner-up"
+
+        assert client.post(f"/api/articles/{top.id}/like").status_code == 200
+        assert client.get("/api/articles/best-of-week").json()["title"] == "Top"
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,63 @@
+"""
+Tests for SimHash fingerprints and the near-duplicate index
+"""
+
+import random
+
+from app.utils.simhash import (
+    MAX_DISTANCE,
+    NearDuplicateIndex,
+    article_fingerprint,
+    band_keys,
+    hamming_distance,
+    simhash,
+)
+
+random.seed(7)
+VOCAB = [f"word{i}" for i in range(2000)]
+
+
+def _text(words=300):
+    return " ".join(random.choice(VOCAB) for _ in range(words))
+
+
+def test_syndicated_copies_are_close_and_unrelated_texts_are_far():
+    story = _text()
+    syndicated = f"<p>Originally published on my blog.</p> {story} <footer>Thanks for reading!</footer>"
+
+    original = article_fingerprint("Rust 1.80 is out", story)
+    copy = article_fingerprint("Rust 1.80 is out | by Jane | Medium", syndicated)
+    unrelated = article_fingerprint("Rust 1.80 is out", _text())
+
+    assert hamming_distance(original, copy) <= MAX_DISTANCE
+    assert hamming_distance(original, unrelated) > 2 * MAX_DISTANCE
+
+
+def test_fingerprint_is_signed_64_bit_and_skips_short_texts():
+    fingerprints = [simhash(_text()) for _ in range(50)]
+
+    assert all(-(2 ** 63) <= fp < 2 ** 63 for fp in fingerprints)
+    assert any(fp < 0 for fp in fingerprints)
+    assert simhash("Show HN: a tiny tool") is None
+    assert simhash(story := _text(40)) == simhash(story.upper())
+
+
+def test_close_fingerprints_share_a_band():
+    fp = simhash(_text())
+    for _ in range(200):
+        flipped = fp
+        for bit in random.sample(range(64), MAX_DISTANCE):
+            flipped ^= 1 << bit
+        assert set(band_keys(fp)) & set(band_keys(flipped))
+
+
+def test_index_returns_nearest_match():
+    base = simhash(_text())
+    index = NearDuplicateIndex()
+    index.add(1, base ^ 0b111)
+    index.add(2, base ^ 0b1)
+    index.add(3, simhash(_text()))
+
+    assert index.nearest(base) == 2
+    assert index.nearest(base ^ (0b1111111 << 40)) is None
+    assert len(index) == 3
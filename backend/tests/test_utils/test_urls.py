@@ -0,0 +1,41 @@
+"""
+Tests for URL canonicalization
+"""
+
+import pytest
+
+from app.utils.urls import canonicalize_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    # Generic cleanup
+    ("http://www.Example.com:443/post/?utm_source=hn&b=2&a=1&ref=rss#comments", "https://example.com/post?a=1&b=2"),
+    ("https://example.com//blog///post/", "https://example.com/blog/post"),
+    ("https://example.com/", "https://example.com/"),
+    ("https://example.com:8443/post?fbclid=x&page=2", "https://example.com:8443/post?page=2"),
+    # YouTube
+    ("https://youtu.be/dQw4w9WgXcQ?si=share&t=42", "https://youtube.com/watch?v=dQw4w9WgXcQ"),
+    ("https://m.youtube.com/watch?feature=share&v=dQw4w9WgXcQ", "https://youtube.com/watch?v=dQw4w9WgXcQ"),
+    ("https://www.youtube.com/shorts/dQw4w9WgXcQ", "https://youtube.com/watch?v=dQw4w9WgXcQ"),
+    # Medium
+    ("https://medium.com/@jane/ship-it-1a2b3c4d5e6f?source=rss----tag", "https://medium.com/p/1a2b3c4d5e6f"),
+    ("https://medium.com/p/1a2b3c4d5e6f", "https://medium.com/p/1a2b3c4d5e6f"),
+    ("https://engineering.medium.com/ship-it-1a2b3c4d5e6f", "https://medium.com/p/1a2b3c4d5e6f"),
+    # Reddit, Hacker News
+    ("https://old.reddit.com/r/python/comments/abc123/some_title/", "https://reddit.com/comments/abc123"),
+    ("https://redd.it/abc123", "https://reddit.com/comments/abc123"),
+    ("https://news.ycombinator.com/item?id=123&p=2", "https://news.ycombinator.com/item?id=123"),
+    # arXiv, X, GitHub
+    ("http://arxiv.org/pdf/2401.00001v2", "https://arxiv.org/abs/2401.00001"),
+    ("https://arxiv.org/abs/hep-th/9901001v1", "https://arxiv.org/abs/hep-th/9901001"),
+    ("https://mobile.twitter.com/Jane/status/123?s=20", "https://x.com/jane/status/123"),
+    ("https://github.com/Foo/Bar/", "https://github.com/foo/bar"),
+])
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_canonical_form_is_stable():
+    url = "https://medium.com/@jane/ship-it-1a2b3c4d5e6f?source=rss"
+    assert canonicalize_url(canonicalize_url(url)) == canonicalize_url(url)
+    assert canonicalize_url("mailto:someone@example.com") == "mailto:someone@example.com"